@@ -0,0 +1,7 @@
+"""
+Micro-benchmarks for the rendering path of squiffy.
+
+Run a benchmark as a module from the root of the repository, ex:
+
+    python -m benchmarks.bench_style_template
+"""
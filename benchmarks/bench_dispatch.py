@@ -0,0 +1,98 @@
+"""
+Times the routing of the signals by the Menu, through an isinstance chain
+(the previous implementation) and through the type-keyed dispatch table.
+"""
+
+from timeit import repeat
+from squiffy import signals
+from squiffy.dispatch import TypeDispatcher
+
+REPEAT: int = 5
+NUMBER: int = 200
+
+SIGNALS: list[signals.Signal] = [
+    signals.SwitchSubmenu(target_id="Bench"),
+    signals.Error(),
+    signals.Quit(),
+    signals.ReturnToPrevious(),
+    signals.ReturnToMain(),
+    signals.OK(),
+    signals.Do(signal="Bench"),
+    signals.OpenPalette(),
+    signals.Jump(address="Bench"),
+    signals.RecordMacro(),
+    signals.PlayMacro(name="Bench"),
+    signals.Abort(),
+] * 100
+
+
+def _handle(signal: signals.Signal) -> None:
+    pass
+
+
+def _isinstance_chain(signal: signals.Signal) -> None:
+    if isinstance(signal, signals.SwitchSubmenu):
+        _handle(signal)
+    elif isinstance(signal, signals.Error):
+        _handle(signal)
+    elif isinstance(signal, signals.Quit):
+        _handle(signal)
+    elif isinstance(signal, signals.ReturnToPrevious):
+        _handle(signal)
+    elif isinstance(signal, signals.ReturnToMain):
+        _handle(signal)
+    elif isinstance(signal, signals.OK) or isinstance(signal, signals.Do):
+        _handle(signal)
+    elif isinstance(signal, signals.OpenPalette):
+        _handle(signal)
+    elif isinstance(signal, signals.Jump):
+        _handle(signal)
+    elif isinstance(signal, signals.RecordMacro):
+        _handle(signal)
+    elif isinstance(signal, signals.PlayMacro):
+        _handle(signal)
+    elif isinstance(signal, signals.Abort):
+        pass
+
+
+_DISPATCHER = TypeDispatcher(
+    {
+        signal_type: _handle
+        for signal_type in (
+            signals.SwitchSubmenu,
+            signals.Error,
+            signals.Quit,
+            signals.ReturnToPrevious,
+            signals.ReturnToMain,
+            signals.OK,
+            signals.Do,
+            signals.OpenPalette,
+            signals.Jump,
+            signals.RecordMacro,
+            signals.PlayMacro,
+        )
+    }
+)
+
+
+def _best(statement, number: int = NUMBER) -> float:
+    return min(repeat(statement, repeat=REPEAT, number=number)) / number
+
+
+def main() -> None:
+    def chain() -> None:
+        for signal in SIGNALS:
+            _isinstance_chain(signal)
+
+    def table() -> None:
+        for signal in SIGNALS:
+            _DISPATCHER.dispatch(signal)
+
+    per_signal = 1e9 / len(SIGNALS)
+    print(f"{'routing':<20}{'per signal (ns)':>18}")
+    print(f"{'isinstance chain':<20}{_best(chain) * per_signal:>18.1f}")
+    print(f"{'dispatch table':<20}{_best(table) * per_signal:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
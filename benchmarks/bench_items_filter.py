@@ -0,0 +1,49 @@
+"""
+Times the type-ahead filtering of the options of a large ItemsCollection.
+"""
+
+from timeit import repeat
+from squiffy import signals
+from squiffy.menu.menu_items import Item, ItemsCollection
+
+ITEMS: int = 50000
+REPEAT: int = 5
+NUMBER: int = 200
+
+QUERIES: tuple[str, ...] = ("o", "nu", "option", "4999", "number_12345", "missing")
+
+
+def _collection(items: int) -> ItemsCollection:
+    return ItemsCollection(
+        uid="Bench",
+        items=[
+            Item(option=f"OPTION_NUMBER_{index}", signal=signals.Quit())
+            for index in range(items)
+        ],
+    )
+
+
+def _best(statement, number: int = NUMBER) -> float:
+    return min(repeat(statement, repeat=REPEAT, number=number)) / number
+
+
+def main() -> None:
+    collection = _collection(ITEMS)
+
+    print(f"{'query':<16}{'matches':>10}{'search (us)':>14}")
+    for query in QUERIES:
+        matches = len(collection.index.search(query))
+        search_time = _best(lambda: collection.index.search(query)) * 1e6
+        print(f"{query:<16}{matches:>10}{search_time:>14.1f}")
+
+    item = Item(option="OPTION_NUMBER_APPENDED", signal=signals.Quit())
+
+    def add_and_remove() -> None:
+        collection.index.add(item)
+        collection.index.remove(item)
+
+    print(f"{'index add + remove':<26}{_best(add_and_remove) * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Times the routing of a Do signal by the MenuObserversLayer, with one
+observer per option.
+"""
+
+from timeit import repeat
+from unittest.mock import Mock
+from squiffy import signals
+from squiffy.menu.menu_layers import MenuObserversLayer
+from squiffy.menu.menu_observers import RoutingObserver
+
+OBSERVERS: tuple[int, ...] = (10, 1000, 100000)
+REPEAT: int = 5
+NUMBER: int = 1000
+
+
+def _layer(observers: int) -> MenuObserversLayer:
+    layer = MenuObserversLayer(Mock())
+    context = Mock()
+
+    for index in range(observers):
+        observer = RoutingObserver(f"OPTION_{index}")
+        observer.context = context
+        layer.attach(observer)
+
+    return layer
+
+
+def _best(statement, number: int = NUMBER) -> float:
+    return min(repeat(statement, repeat=REPEAT, number=number)) / number
+
+
+def main() -> None:
+    print(f"{'observers':<12}{'send (us)':>12}")
+    for observers in OBSERVERS:
+        layer = _layer(observers)
+        signal = signals.Do(f"OPTION_{observers // 2}")
+
+        print(f"{observers:<12}{_best(lambda: layer.send(signal)) * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
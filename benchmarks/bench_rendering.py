@@ -0,0 +1,242 @@
+"""
+Benchmark suite for the rendering path of the layout package.
+
+Times TextGenerator.generate, Style.create (with a cold and a warm frame
+cache) and StyleFactory.create across terminal widths, border types,
+padding sizes and item counts. The results are saved as JSON and can be
+compared with a previous run:
+
+    python -m benchmarks.bench_rendering --output new.json
+    python -m benchmarks.bench_rendering --output new.json --compare old.json
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable
+from squiffy.layout.borders import BORDERS
+from squiffy.layout.style_components import TextGenerator
+from squiffy.layout.style_factory import StyleFactory
+from squiffy.screen import HeadlessScreen
+from squiffy.version import __version__
+
+WIDTHS: tuple[int, ...] = (40, 80, 120, 200)
+PADDINGS: tuple[int, ...] = (0, 1, 2)
+ITEM_COUNTS: tuple[int, ...] = (10, 100, 1000, 10000, 100000)
+SCREEN_HIGHT: int = 50
+
+QUICK_WIDTHS: tuple[int, ...] = (80,)
+QUICK_PADDINGS: tuple[int, ...] = (1,)
+QUICK_ITEM_COUNTS: tuple[int, ...] = (10, 1000)
+
+# minimum time spent measuring each repetition of a case, in seconds
+MIN_TIME: float = 0.02
+REPEAT: int = 3
+
+# a case slower than the baseline by more than this ratio is reported
+REGRESSION_THRESHOLD: float = 1.10
+
+
+def _style_sheet(padding: int, border: str) -> dict:
+    return {
+        "dimensions": {"type": "auto", "width": None, "height": None},
+        "padding": {
+            "top": padding,
+            "right": padding,
+            "bottom": padding,
+            "left": padding,
+        },
+        "border": {"type": border},
+    }
+
+
+def _items(count: int) -> dict[int, str]:
+    return {index: f"OPTION_NUMBER_{index}" for index in range(count)}
+
+
+def _time(function: Callable[[], object]) -> float:
+    """
+    The best time of a call, in seconds, over REPEAT repetitions.
+    """
+    start = time.perf_counter()
+    function()
+    estimate = max(time.perf_counter() - start, 1e-7)
+    number = max(1, int(MIN_TIME / estimate))
+
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    return best
+
+
+def _cases(width: int, border: str, padding: int, items: int) -> dict:
+    screen = HeadlessScreen(SCREEN_HIGHT, width)
+    style_sheet = _style_sheet(padding, border)
+    content = _items(items)
+    texts = [f"{key}>>>{value}" for key, value in content.items()]
+
+    style = StyleFactory(screen=screen).create(style_sheet)
+
+    def text_generator() -> str:
+        return TextGenerator(border).generate(
+            screen_h=SCREEN_HIGHT,
+            screen_w=width,
+            padding_top=padding,
+            padding_bottom=padding,
+            padding_left=padding,
+            padding_right=padding,
+            texts=texts,
+            alignment="left",
+        )
+
+    def style_create() -> str:
+        return style.create("Title", "", "Header message", content, "Footer")
+
+    def style_create_cold() -> str:
+        style.invalidate()
+        return style_create()
+
+    def style_factory() -> object:
+        return StyleFactory(screen=screen).create(style_sheet)
+
+    return {
+        "TextGenerator.generate": text_generator,
+        "Style.create[cold]": style_create_cold,
+        "Style.create[warm]": style_create,
+        "StyleFactory.create": style_factory,
+    }
+
+
+def run(
+    widths: tuple[int, ...],
+    paddings: tuple[int, ...],
+    item_counts: tuple[int, ...],
+    borders: tuple[str, ...],
+) -> list[dict]:
+    results: list[dict] = list([])
+
+    for width, border, padding, items in itertools.product(
+        widths, borders, paddings, item_counts
+    ):
+        for target, function in _cases(width, border, padding, items).items():
+            # the style factory does not depend on the items
+            if target == "StyleFactory.create" and items != item_counts[0]:
+                continue
+
+            seconds = _time(function)
+            results.append(
+                {
+                    "target": target,
+                    "width": width,
+                    "border": border,
+                    "padding": padding,
+                    "items": items,
+                    "seconds": seconds,
+                }
+            )
+            print(
+                f"{target:<24}{width:>5}{border:>8}{padding:>3}{items:>8}"
+                f"{seconds * 1e6:>14.1f} us"
+            )
+
+    return results
+
+
+def compare(
+    results: list[dict],
+    baseline: list[dict],
+    threshold: float = REGRESSION_THRESHOLD,
+) -> list[tuple[dict, float]]:
+    """
+    Matches the cases of two runs and returns the ones slower than the
+    baseline by more than the threshold ratio, with their ratio.
+    """
+
+    def key(result: dict) -> tuple:
+        return (
+            result["target"],
+            result["width"],
+            result["border"],
+            result["padding"],
+            result["items"],
+        )
+
+    baseline_times = {key(result): result["seconds"] for result in baseline}
+    regressions: list[tuple[dict, float]] = list([])
+
+    for result in results:
+        previous = baseline_times.get(key(result))
+        if previous is None:
+            continue
+
+        ratio = result["seconds"] / previous
+        if ratio > threshold:
+            regressions.append((result, ratio))
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default="rendering_benchmark.json")
+    parser.add_argument("--compare", default=None, help="a previous JSON result")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="the slowdown ratio reported as a regression",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="run a reduced set of cases"
+    )
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        widths, paddings, item_counts = QUICK_WIDTHS, QUICK_PADDINGS, QUICK_ITEM_COUNTS
+    else:
+        widths, paddings, item_counts = WIDTHS, PADDINGS, ITEM_COUNTS
+
+    results = run(widths, paddings, item_counts, tuple(BORDERS))
+
+    with open(args.output, "w") as file:
+        json.dump(
+            {
+                "meta": {
+                    "squiffy": __version__,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "date": datetime.now(timezone.utc).isoformat(),
+                },
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare, "r") as file:
+        baseline = json.load(file)["results"]
+
+    regressions = compare(results, baseline, args.threshold)
+    for result, ratio in regressions:
+        print(
+            f"REGRESSION {result['target']} width={result['width']} "
+            f"border={result['border']} padding={result['padding']} "
+            f"items={result['items']}: {ratio:.2f}x slower"
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
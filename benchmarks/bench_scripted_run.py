@@ -0,0 +1,43 @@
+"""
+Measures the callback throughput of an Application driven by a script.
+"""
+
+import os
+import time
+from squiffy import Application, LayoutFactory, ScriptedInput, State, signals
+
+EXAMPLE_LAYOUT: str = os.path.join(
+    os.path.dirname(__file__), os.pardir, "examples", "example1.json"
+)
+
+SELECTIONS: int = 20000
+
+
+def _run(render: bool) -> float:
+    application = Application(
+        layout=LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True),
+        state=State(),
+        input_source=ScriptedInput(["Main_Menu/Print_and_wait"] * SELECTIONS),
+        render=render,
+    )
+    application.add(
+        function=lambda state: signals.OK(),
+        option_name="Print_and_wait",
+        submenu_name="Main_Menu",
+    )
+
+    start = time.perf_counter()
+    application.run()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'render':<10}{'selections':>12}{'callbacks/s':>16}")
+
+    for render in (True, False):
+        seconds = _run(render)
+        print(f"{str(render):<10}{SELECTIONS:>12}{SELECTIONS / seconds:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compares the compiled style templates with the TextGenerator path.
+"""
+
+from timeit import repeat
+from squiffy.layout.borders import BORDERS
+from squiffy.layout.style_components import TextGenerator, compile_template
+
+REPEAT: int = 5
+NUMBER: int = 200
+
+
+def _texts(items: int) -> list[str]:
+    return [f"{index}>>>OPTION_NUMBER_{index}" for index in range(items)]
+
+
+def _best(statement) -> float:
+    return min(repeat(statement, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main() -> None:
+    print(
+        f"{'border':<8}{'items':>8}{'generator (us)':>18}"
+        f"{'template (us)':>18}{'gain':>8}"
+    )
+
+    for border in BORDERS:
+        for items in (10, 100, 1000):
+            texts = _texts(items)
+
+            def generator() -> str:
+                return TextGenerator(border).generate(
+                    screen_h=40,
+                    screen_w=120,
+                    padding_top=1,
+                    padding_bottom=1,
+                    padding_left=2,
+                    padding_right=2,
+                    texts=texts,
+                    alignment="left",
+                )
+
+            template = compile_template(border, 120, 1, 1, 2, 2)
+
+            def compiled() -> str:
+                return template.fill(texts=texts, alignment="left")
+
+            assert generator() == compiled()
+
+            generator_time = _best(generator) * 1e6
+            template_time = _best(compiled) * 1e6
+
+            print(
+                f"{border:<8}{items:>8}{generator_time:>18.1f}{template_time:>18.1f}"
+                f"{generator_time / template_time:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
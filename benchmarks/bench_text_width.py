@@ -0,0 +1,90 @@
+"""
+Measures the cost of the display-width-aware text measurement and wrapping
+on ASCII menus, against len and textwrap which were used before, and the
+greedy and cached wrapping of long messages.
+"""
+
+import textwrap
+from timeit import repeat
+from squiffy.layout.style_components import StyleTemplate
+from squiffy.layout.text_width import display_width, wrap_text, _greedy_wrap
+
+REPEAT: int = 5
+NUMBER: int = 200
+WIDTH: int = 60
+
+
+def _legacy_wrap(text: str, max_width: int) -> list[str]:
+    if len(text) > max_width:
+        return textwrap.wrap(text, max_width)
+    else:
+        return [text]
+
+
+class LegacyTemplate(StyleTemplate):
+    """
+    The template filled as before, measuring the text with len.
+    """
+
+    def fill(self, texts: list[str], alignment: str = "center") -> str:
+        form = list(self._head)
+
+        for text in texts:
+            for line in _legacy_wrap(text, self._interior_width):
+                form.append(self._row(line, len(line), alignment))
+
+        form.extend(self._tail)
+
+        return "\n".join(form)
+
+
+def _best(statement) -> float:
+    return min(repeat(statement, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def main() -> None:
+    texts = [f"{index}>>>OPTION_NUMBER_{index}" for index in range(1000)]
+    texts.append("A long footer message which is wrapped on the screen " * 4)
+    messages = [f"Help message number {index} of an option " * 4 for index in range(50)]
+
+    legacy_template = LegacyTemplate("light", WIDTH, 1, 1, 2, 2)
+    template = StyleTemplate("light", WIDTH, 1, 1, 2, 2)
+    assert legacy_template.fill(texts, "left") == template.fill(texts, "left")
+
+    cases = {
+        "width": (
+            lambda: [len(text) for text in texts],
+            lambda: [display_width(text) for text in texts],
+        ),
+        "wrap": (
+            lambda: [_legacy_wrap(text, WIDTH) for text in texts],
+            lambda: [wrap_text(text, WIDTH) for text in texts],
+        ),
+        # long help and footer messages, without and with the wrap cache
+        "greedy": (
+            lambda: [textwrap.wrap(text, WIDTH) for text in messages],
+            lambda: [_greedy_wrap(text, WIDTH) for text in messages],
+        ),
+        "cached": (
+            lambda: [textwrap.wrap(text, WIDTH) for text in messages],
+            lambda: [wrap_text(text, WIDTH) for text in messages],
+        ),
+        "frame": (
+            lambda: legacy_template.fill(texts, "left"),
+            lambda: template.fill(texts, "left"),
+        ),
+    }
+
+    print(f"{'case':<8}{'legacy (us)':>14}{'aware (us)':>14}{'ratio':>8}")
+    for name, (legacy, aware) in cases.items():
+        legacy_time = _best(legacy) * 1e6
+        aware_time = _best(aware) * 1e6
+
+        print(
+            f"{name:<8}{legacy_time:>14.1f}{aware_time:>14.1f}"
+            f"{aware_time / legacy_time:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
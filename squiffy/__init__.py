@@ -2,6 +2,7 @@ from . import signals
 from .state import State
 from .application import Application
 from .layout.layout_factory import LayoutFactory
+from .input_source import ScriptedInput
 from .example import example
 
-__all__ = ["signals", "State", "Application", "LayoutFactory"]
+__all__ = ["signals", "State", "Application", "LayoutFactory", "ScriptedInput"]
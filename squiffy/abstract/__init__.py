@@ -4,10 +4,12 @@ from . import abstract_menu
 from . import abstract_application
 from . import abstract_state
 from . import abstract_style
+from . import abstract_input
 
 __all__ = ["abstract_context", 
            "abstract_layout", 
            "abstract_menu",
            "abstract_application",
            "abstract_state",
-           "abstract_style"]
\ No newline at end of file
+           "abstract_style",
+           "abstract_input"]
\ No newline at end of file
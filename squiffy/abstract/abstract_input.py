@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractInputSource(ABC):
+    @abstractmethod
+    def read(self, submenu: str) -> str:
+        """
+        Returns the next selection for the submenu, as an index or an
+        option name. Raises EOFError when there are no more selections.
+        """
+        pass
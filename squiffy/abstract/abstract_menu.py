@@ -20,6 +20,18 @@ class AbstractObserver(ABC):
         """
         pass
 
+    @property
+    def route(self) -> str | None:
+        """
+        The name of the Do signal the observer responds to. The observers
+        layer sends the Do signals of that name only to the observers routed
+        to it. An observer without a route is sent every event.
+
+        Returns:
+            str | None
+        """
+        return None
+
 
 class AbstractMenu(ABC):
     """
@@ -21,6 +21,16 @@ class AbstractScreen(ABC):
         pass
 
 
+class AbstractRenderer(ABC):
+    @abstractmethod
+    def render(self, frame: str) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        pass
+
+
 class AbstractStyle(ABC):
     @abstractmethod
     def create(self) -> str:
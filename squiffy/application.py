@@ -1,19 +1,51 @@
+import asyncio
 from traceback import format_exc
 from typing import Callable
 from .abstract import abstract_application
 from .layout import layout_factory
-from .state import State
+from .state import State, StateView
+from .abstract.abstract_input import AbstractInputSource
 from . import utils, signals
+from .errors import UnknownOptionError
 from squiffy.context import context, executor
 
 
 class Application(abstract_application.AbstractApplication):
-    def __init__(self, layout: layout_factory.LayoutFactory, state: State) -> None:
+    """
+    Runs the menu created from the layout and routes the selected options
+    to the callback functions.
+
+    Args:
+        layout (LayoutFactory): The layout of the application.
+        state (State): The state passed to the callback functions.
+        input_source (AbstractInputSource | None): Reads the selections from
+        a source other than the prompt (ex. a ScriptedInput), so the
+        application can run without a terminal.
+        render (bool): Renders the submenus. Defaults to True.
+        start_at (str | None): The address of a submenu or option the
+        application starts at, ex. "Main_Menu/Second_Menu/Accept_an_input".
+    """
+
+    def __init__(
+        self,
+        layout: layout_factory.LayoutFactory,
+        state: State,
+        input_source: AbstractInputSource | None = None,
+        render: bool = True,
+        start_at: str | None = None,
+    ) -> None:
         self._layout = layout
         self._context = context.Context(application=self)
 
         self._menu = self._layout.create()
         self._menu._context = self._context
+        self._context.option_ids = self._layout.option_ids
+
+        if input_source is not None:
+            self._menu.set_input_source(input_source)
+
+        if not render:
+            self._menu.set_rendering(False)
 
         # self._menu_wrapper = menu_layers.MenuObserversLayer(self._menu)
 
@@ -21,10 +53,30 @@ class Application(abstract_application.AbstractApplication):
         self._running: bool = True
         self._state: State = state
 
+        self._start_at: str | None = start_at
+        self._last_abort: signals.Abort | None = None
+
+        # The payloads of the OK signals of a loop iteration are merged (the
+        # last one wins for each key) and applied with a single update. The
+        # origin of the last value written to each key is kept for debugging.
+        self._ok_batch: dict[str, object] = dict({})
+        self._payload_origins: dict[str, str | None] = dict({})
+
+        # the callbacks read the pending payloads through the view, so the
+        # batch is not applied before each of them (ex. the steps of a macro)
+        self._state_view = StateView(state, self._ok_batch)
+
     def run(self) -> None:
+        # the callbacks are added after the creation, so the jump is done here
+        if self._start_at is not None:
+            self.jump(self._start_at)
+            self._running = self._menu.is_running
+
         while self._running:
             try:
                 self._menu.show()
+                self._handle_finished_jobs()
+                self.flush_ok_batch()
                 self._running = self._menu.is_running
 
                 if self._running is False:
@@ -32,20 +84,99 @@ class Application(abstract_application.AbstractApplication):
             except KeyboardInterrupt or EOFError:
                 self.handle_quit()
 
-    def add(self, function: Callable, option_name: str, submenu_name: str) -> None:
+    async def run_async(self) -> None:
+        """
+        Runs the application in asyncio mode, ex. asyncio.run(app.run_async()).
+
+        The prompt of the submenus and the callback functions share the
+        running event loop. The callbacks can be coroutine functions, which
+        are awaited once the prompt is left, and pressing Ctrl-C while one
+        of them runs cancels it and sends an Abort instead of quitting.
+        The terminal size is watched on the loop instead of read per frame.
+        """
+        self._context.asynchronous = True
+        size_watcher = asyncio.ensure_future(self._layout.screen.async_get_sceen_size())
+
+        try:
+            if self._start_at is not None:
+                self.jump(self._start_at)
+                await self._context.execute_pending()
+                self._running = self._menu.is_running
+
+            while self._running:
+                try:
+                    await self._menu.show_async()
+                    await self._context.execute_pending()
+                    self._handle_finished_jobs()
+                    self.flush_ok_batch()
+                    self._running = self._menu.is_running
+
+                    if self._running is False:
+                        self._save_state()
+                except (KeyboardInterrupt, EOFError):
+                    self.handle_quit()
+        finally:
+            self._context.asynchronous = False
+
+            size_watcher.cancel()
+            await asyncio.gather(size_watcher, return_exceptions=True)
+
+    def add(
+        self,
+        function: Callable,
+        option_name: str,
+        submenu_name: str,
+        state_keys: list[str] | None = None,
+    ) -> None:
+        """
+        Attaches the function to the option. The function of an option
+        running in a process (*"background": "process"*) has to be a module
+        level function and gets a snapshot of the state_keys of the state.
+        """
         # Create rounting observers and Executors for the signal signature and the function
         signal_signature: str = utils.generate_signal_name(submenu_name, option_name)
-        exe = executor.Executor(signals.Do(signal_signature), function)
+
+        if signal_signature not in self._context.option_ids:
+            raise UnknownOptionError(
+                f"No option {option_name} in the submenu {submenu_name} of the layout"
+            )
+
+        # the options marked as background run their callback in the job runner
+        runner = (
+            self._layout.jobs
+            if signal_signature in self._layout.background_options
+            else None
+        )
+        exe = executor.Executor(
+            signals.Do(signal_signature),
+            function,
+            runner=runner,
+            processes=signal_signature in self._layout.process_options,
+            state_keys=state_keys or (),
+        )
 
         self._context.executors = exe
 
+    def jump(self, address: str) -> None:
+        self._menu.jump(address)
+
     def handle_errors(self, error: signals.Error) -> None:
         # self._save_state()
         self._menu.handle_errors(error)
 
     def handle_ok(self, signal: signals.OK) -> None:
         if signal.is_payload():
-            self._state.update(signal.payload)
+            self._ok_batch.update(signal.payload)
+            self._payload_origins.update(dict.fromkeys(signal.payload, signal.origin))
+
+    def flush_ok_batch(self) -> None:
+        """
+        Applies the payloads gathered since the last flush to the state.
+        """
+        if self._ok_batch:
+            # the batch is emptied in place, since the view of the state reads it
+            self._state.update(dict(self._ok_batch))
+            self._ok_batch.clear()
 
     def handle_quit(self) -> None:
         self._running = False
@@ -53,15 +184,40 @@ class Application(abstract_application.AbstractApplication):
 
     def handle_abort(self, signal: signals.Abort) -> None:
         if isinstance(signal, signals.Abort):
-            # TODO: Implement abort handling or provide means of custom handling functions.
-            pass
+            # The aborted callback did not finish, so the state is left as it
+            # is and the menu goes on. Its output may be cut mid-frame, so the
+            # next frame is entirely redrawn.
+            self._last_abort = signal
+            self._layout.renderer.invalidate()
         else:
             raise ValueError("Signal is not an instance of signals.Abort")
 
+    @property
+    def last_abort(self) -> signals.Abort | None:
+        return self._last_abort
+
+    @property
+    def payload_origins(self) -> dict[str, str | None]:
+        return self._payload_origins
+
     def provide_state(self):
-        return self._state
+        # the callbacks see the payloads of the previous callbacks
+        return self._state_view
+
+    def _handle_finished_jobs(self) -> None:
+        # the results of the background jobs are applied between the frames
+        if self._layout.jobs is not None:
+            for signal in self._layout.jobs.drain():
+                self._context.handle_signal(signal)
 
     def _save_state(self) -> None | signals.Error:
+        # the running background jobs are waited for, so their results are saved
+        if self._layout.jobs is not None:
+            self._layout.jobs.shutdown(wait=True)
+            self._handle_finished_jobs()
+
+        self.flush_ok_batch()
+
         try:
             self._state.save()
         except Exception:
@@ -1,4 +1,5 @@
 from . import context
 from . import executor
+from . import jobs
 
-__all__ = ["context", "executor"]
+__all__ = ["context", "executor", "jobs"]
@@ -1,44 +1,87 @@
+from collections import deque
 from traceback import format_exc
 from typing import Union
 from . import executor
 from squiffy import signals
+from squiffy.dispatch import TypeDispatcher
 from squiffy.abstract import abstract_application, abstract_context
 
 
+class _NoExecutor:
+    """
+    The executor of the options without a callback function, which does
+    nothing when they are selected.
+    """
+
+    def execute(self, signal: signals.Do, state) -> None:
+        pass
+
+    async def execute_async(self, signal: signals.Do, state) -> None:
+        pass
+
+
+_NO_EXECUTOR = _NoExecutor()
+
+
 class Context(abstract_context.AbstractContext):
     """
     The purpose of the Context class is to match signals comming from the
     menu (and subsequently from the items in each Submenu) to the callback functions
     contained in the executors.
 
+    The executors are kept in a list indexed by the option ids given by the
+    LayoutFactory, where the options without a callback hold a no-op
+    executor, so a Do signal of the layout is routed with a single lookup.
+    The Do signals without an option id are routed by their name.
+
+    In asyncio mode, the executors of the selected options are queued and
+    awaited by execute_pending, once the prompt of the menu is left.
 
     """
 
+    # The handlers are called with the context and the signal.
+    _SIGNAL_HANDLERS = TypeDispatcher(
+        {
+            signals.Do: lambda context, signal: context._handle_do_event(signal),
+            signals.OK: lambda context, signal: context._application.handle_ok(signal),
+            signals.Abort: lambda context, signal: context._application.handle_abort(
+                signal
+            ),
+            signals.Error: lambda context, signal: context._application.handle_errors(
+                signal
+            ),
+            signals.Quit: lambda context, signal: context._application.handle_quit(
+                signal
+            ),
+            signals.Jump: lambda context, signal: context._application.jump(
+                signal.address
+            ),
+        }
+    )
+
     def __init__(self, application: abstract_application.AbstractApplication) -> None:
         self._application: abstract_application.AbstractApplication = application
         self._executors: dict[signals.Do, executor.Executor] = dict({})
 
+        self._option_ids: dict[str, int] = dict({})
+        self._routes: list[executor.Executor | _NoExecutor] = list([])
+
+        self._asynchronous: bool = False
+        self._pending: deque[tuple] = deque([])
+
     def handle_signal(
         self,
         signal: Union[
-            signals.OK, signals.Do, signals.Abort, signals.Error, signals.Quit
+            signals.OK,
+            signals.Do,
+            signals.Abort,
+            signals.Error,
+            signals.Quit,
+            signals.Jump,
         ],
     ) -> None:
         try:
-            if isinstance(signal, signals.Do):
-                self._handle_do_event(signal)
-
-            elif isinstance(signal, signals.OK):
-                self._application.handle_ok(signal)
-
-            elif isinstance(signal, signals.Abort):
-                self._application.handle_abort(signal)
-
-            elif isinstance(signal, signals.Error):
-                self._application.handle_errors(signal)
-
-            elif isinstance(signal, signals.Quit):
-                self._application.handle_quit(signal)
+            self._SIGNAL_HANDLERS.dispatch(signal, self)
 
         except Exception:
             self._application.handle_errors(
@@ -52,12 +95,24 @@ class Context(abstract_context.AbstractContext):
     def _handle_do_event(self, signal: signals.Do) -> None:
         state = self._application.provide_state()
         # If the selected option does not have a callback function attached to it
-        # it should do nothing when selected. So the error raised by failing
-        # to find the executor will be ignored.
-        try:
-            self._executors[signal.signal].execute(signal, state)
-        except KeyError:
-            pass
+        # it should do nothing when selected, so it is routed to the no-op executor.
+        if signal.option_id is not None and signal.option_id < len(self._routes):
+            route = self._routes[signal.option_id]
+        else:
+            route = self._executors.get(signal.signal, _NO_EXECUTOR)
+
+        if self._asynchronous:
+            self._pending.append((route, signal, state))
+        else:
+            route.execute(signal, state)
+
+    async def execute_pending(self) -> None:
+        """
+        Awaits the executors queued in asyncio mode, in the selection order.
+        """
+        while self._pending:
+            route, signal, state = self._pending.popleft()
+            await route.execute_async(signal, state)
 
     @property
     def master(self) -> abstract_application.AbstractApplication:
@@ -67,6 +122,14 @@ class Context(abstract_context.AbstractContext):
     def master(self, master: abstract_application.AbstractApplication) -> None:
         self._application = master
 
+    @property
+    def asynchronous(self) -> bool:
+        return self._asynchronous
+
+    @asynchronous.setter
+    def asynchronous(self, asynchronous: bool) -> None:
+        self._asynchronous = asynchronous
+
     @property
     def executors(self) -> dict[signals.Do, executor.Executor]:
         return self._executors
@@ -75,3 +138,21 @@ class Context(abstract_context.AbstractContext):
     def executors(self, executor: executor.Executor) -> None:
         executor.context = self
         self._executors.update({executor.signal: executor})
+
+        if executor.signal in self._option_ids:
+            self._routes[self._option_ids[executor.signal]] = executor
+
+    @property
+    def option_ids(self) -> dict[str, int]:
+        return self._option_ids
+
+    @option_ids.setter
+    def option_ids(self, option_ids: dict[str, int]) -> None:
+        """
+        Compiles the routing list from the option ids of the layout.
+        """
+        self._option_ids = dict(option_ids)
+
+        self._routes = [_NO_EXECUTOR] * (max(option_ids.values(), default=-1) + 1)
+        for signal_name, option_id in self._option_ids.items():
+            self._routes[option_id] = self._executors.get(signal_name, _NO_EXECUTOR)
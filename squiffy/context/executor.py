@@ -1,34 +1,95 @@
+import asyncio
+import inspect
+import signal as os_signal
 from traceback import format_exc
-from typing import Callable, Union
+from typing import Awaitable, Callable, Union
 from squiffy.abstract import abstract_context
 from squiffy import signals
+from .jobs import JobRunner
 
 
 class Executor:
+    """
+    Runs the callback function of an option and sends its result to the
+    context.
+
+    The callback can be a coroutine function. It is run to completion by
+    execute, or awaited by execute_async when the application runs in
+    asyncio mode, where pressing Ctrl-C cancels it and sends an Abort.
+    With a job runner, the callback is sent to the background instead and
+    its result is handled once the job is finished. A callback running in a
+    worker process gets a snapshot of the state keys it requested.
+    """
+
     def __init__(
         self,
         signal: signals.Do,
         callback: Callable[
             ..., Union[signals.OK, signals.Error, signals.Abort, signals.Quit]
         ],
+        runner: JobRunner | None = None,
+        processes: bool = False,
+        state_keys: list[str] | tuple[str, ...] = (),
     ) -> None:
         self._signal = signal
         self._callback = callback
+        self._runner = runner
+        self._processes = processes
+        self._state_keys = tuple(state_keys)
 
         self._context: abstract_context.AbstractContext | None = None
 
     def execute(self, signal: signals.Do, state) -> None:
+        if self._runner is not None:
+            self._submit(state)
+            return
+
         try:
-            self._context.handle_signal(self._callback(state))
+            result = self._callback(state)
+            if inspect.iscoroutine(result):
+                result = asyncio.run(result)
+
+            self._context.handle_signal(result)
         except Exception:
+            self._context.handle_signal(self._error())
+
+    async def execute_async(self, signal: signals.Do, state) -> None:
+        if self._runner is not None:
+            self._submit(state)
+            return
+
+        try:
+            result = self._callback(state)
+            if inspect.isawaitable(result):
+                result = await _cancel_on_interrupt(result)
+
+            self._context.handle_signal(result)
+        except (asyncio.CancelledError, KeyboardInterrupt):
             self._context.handle_signal(
-                signals.Error(
+                signals.Abort(
                     origin=self._signal.signal,
-                    log_message=f"""An error occurred while trying to execute the option.
-                                                      Traceback: {format_exc()}""",
-                    traceback=format_exc(),
+                    log_message="The option was cancelled",
                 )
             )
+        except Exception:
+            self._context.handle_signal(self._error())
+
+    def _submit(self, state) -> None:
+        if self._processes:
+            # the state stays in this process, the worker gets a copy of its keys
+            state = state.snapshot(self._state_keys)
+
+        self._runner.submit(
+            self._signal.signal, self._callback, state, processes=self._processes
+        )
+
+    def _error(self) -> signals.Error:
+        return signals.Error(
+            origin=self._signal.signal,
+            log_message=f"""An error occurred while trying to execute the option.
+                                                      Traceback: {format_exc()}""",
+            traceback=format_exc(),
+        )
 
     @property
     def context(self) -> abstract_context.AbstractContext:
@@ -41,3 +102,26 @@ class Executor:
     @property
     def signal(self) -> str:
         return self._signal.signal
+
+
+async def _cancel_on_interrupt(awaitable: Awaitable) -> object:
+    """
+    Awaits the result of a callback, cancelling it when Ctrl-C is pressed.
+    """
+    task = asyncio.ensure_future(awaitable)
+    loop = asyncio.get_running_loop()
+
+    try:
+        loop.add_signal_handler(os_signal.SIGINT, task.cancel)
+    except (NotImplementedError, RuntimeError):
+        # without signal handlers (ex. Windows) Ctrl-C raises KeyboardInterrupt
+        try:
+            return await task
+        except KeyboardInterrupt:
+            task.cancel()
+            raise
+
+    try:
+        return await task
+    finally:
+        loop.remove_signal_handler(os_signal.SIGINT)
@@ -0,0 +1,212 @@
+import asyncio
+import inspect
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import count
+from queue import Empty, SimpleQueue
+from time import monotonic
+from traceback import format_exc
+from typing import Callable
+from squiffy import signals
+
+# the default number of threads running the background jobs
+JOB_WORKERS: int = 4
+
+# the maximum number of finished jobs kept for the jobs submenu
+JOBS_KEPT: int = 50
+
+JOB_RUNNING: str = "running"
+JOB_DONE: str = "done"
+JOB_FAILED: str = "failed"
+
+
+class Job:
+    """
+    A callback function running in the background, with its timings.
+    """
+
+    __slots__ = ("uid", "name", "status", "started", "finished")
+
+    def __init__(self, uid: int, name: str) -> None:
+        self.uid = uid
+        self.name = name
+        self.status: str = JOB_RUNNING
+        self.started: float = monotonic()
+        self.finished: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished if self.finished is not None else monotonic()
+        return end - self.started
+
+    def __repr__(self) -> str:
+        return f"{self.name} {self.status} {self.elapsed:.1f}s"
+
+
+class JobRunner:
+    """
+    Runs the callback functions of the background options in a thread pool,
+    or in a process pool for the CPU-bound ones, so the menu comes back
+    right away.
+
+    The signal returned by a callback (or an Error, when it raises) is put
+    on a thread-safe queue, which the application drains between the frames
+    and handles through the context. The callbacks run concurrently with the
+    menu, so they should only read the state and return their changes as
+    the payload of an OK. The pools are started on their first job and
+    reused, so the processes are spawned once.
+
+    Args:
+        max_workers (int): The maximum number of threads running jobs.
+        kept (int): The maximum number of finished jobs listed.
+        max_processes (int | None): The maximum number of processes running
+        jobs. Defaults to the number of processors.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = JOB_WORKERS,
+        kept: int = JOBS_KEPT,
+        max_processes: int | None = None,
+    ) -> None:
+        self._max_workers = max_workers
+        self._max_processes = max_processes
+        self._kept = kept
+
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: ProcessPoolExecutor | None = None
+        self._results: SimpleQueue[signals.Signal] = SimpleQueue()
+
+        self._uids = count()
+        self._jobs: list[Job] = list([])
+
+    def submit(
+        self, name: str, callback: Callable, state, processes: bool = False
+    ) -> Job:
+        """
+        Starts a job running the callback with the state. In a process, the
+        callback has to be a module level function and the state a
+        picklable snapshot (ex. State.snapshot).
+        """
+        job = Job(uid=next(self._uids), name=name)
+
+        try:
+            if processes:
+                future = self._submit_to_processes(callback, state)
+            else:
+                future = self._thread_pool().submit(_call, callback, state)
+        except Exception:
+            # the job is listed as failed, and its error is handled as a result
+            self._fail(job)
+        else:
+            future.add_done_callback(partial(self._finish, job))
+
+        self._jobs.append(job)
+        return job
+
+    def _submit_to_processes(self, callback: Callable, state) -> Future:
+        try:
+            return self._process_pool().submit(_call, callback, state)
+        except BrokenProcessPool:
+            # a worker process died, so the pool is replaced by a new one
+            self._processes.shutdown(wait=False)
+            self._processes = None
+
+            return self._process_pool().submit(_call, callback, state)
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="squiffy-job"
+            )
+
+        return self._threads
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self._max_processes)
+
+        return self._processes
+
+    def _finish(self, job: Job, future: Future) -> None:
+        try:
+            result = future.result()
+        except Exception:
+            self._fail(job)
+            return
+
+        job.status = JOB_DONE
+        job.finished = monotonic()
+        self._results.put(result)
+
+    def _fail(self, job: Job) -> None:
+        # called while the exception of the job is handled
+        job.status = JOB_FAILED
+        job.finished = monotonic()
+        self._results.put(
+            signals.Error(
+                origin=job.name,
+                log_message=f"The background job {job.name} failed",
+                traceback=format_exc(),
+            )
+        )
+
+    def drain(self) -> list[signals.Signal]:
+        """
+        The signals of the jobs finished since the last drain.
+        """
+        results: list[signals.Signal] = list([])
+
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except Empty:
+                break
+
+        if results:
+            self._forget_finished()
+
+        return results
+
+    def _forget_finished(self) -> None:
+        finished = sum(job.finished is not None for job in self._jobs)
+        if finished <= self._kept:
+            return
+
+        # the oldest finished jobs are dropped, the running ones are kept
+        dropped = finished - self._kept
+        kept_jobs: list[Job] = list([])
+        for job in self._jobs:
+            if dropped and job.finished is not None:
+                dropped -= 1
+            else:
+                kept_jobs.append(job)
+
+        self._jobs = kept_jobs
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._threads is not None:
+            self._threads.shutdown(wait=wait)
+            self._threads = None
+
+        if self._processes is not None:
+            self._processes.shutdown(wait=wait)
+            self._processes = None
+
+    @property
+    def jobs(self) -> list[Job]:
+        return list(self._jobs)
+
+    @property
+    def running(self) -> int:
+        return sum(job.status == JOB_RUNNING for job in self._jobs)
+
+
+def _call(callback: Callable, state) -> object:
+    # a module level function, so it is sent to the worker processes
+    result = callback(state)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+
+    return result
@@ -0,0 +1,64 @@
+from typing import Any, Callable
+
+Handler = Callable[..., Any]
+
+
+class TypeDispatcher:
+    """
+    Routes a signal to the handler registered for its type.
+
+    The handler of a type is looked up in a table, instead of a chain of
+    isinstance checks. A type without a handler of its own uses the handler
+    of its nearest registered base class (following the method resolution
+    order), or the default handler. The resolved handler is cached by type,
+    so every dispatch after the first one of a type is a single lookup.
+
+    Args:
+        handlers (dict[type, Handler] | None): The handlers by signal type.
+        default (Handler | None): The handler of the types without one.
+        Without it, those signals are ignored.
+    """
+
+    def __init__(
+        self,
+        handlers: dict[type, Handler] | None = None,
+        default: Handler | None = None,
+    ) -> None:
+        self._handlers: dict[type, Handler] = dict(handlers or {})
+        self._default: Handler | None = default
+        self._resolved: dict[type, Handler | None] = dict(self._handlers)
+
+    def register(self, signal_type: type, handler: Handler) -> None:
+        self._handlers[signal_type] = handler
+        # the subclasses may resolve to the new handler
+        self._resolved = dict(self._handlers)
+
+    def resolve(self, signal_type: type) -> Handler | None:
+        try:
+            return self._resolved[signal_type]
+        except KeyError:
+            pass
+
+        handler = self._default
+        for base in signal_type.__mro__[1:]:
+            if base in self._handlers:
+                handler = self._handlers[base]
+                break
+
+        self._resolved[signal_type] = handler
+        return handler
+
+    def dispatch(self, signal: object, *args: Any) -> Any:
+        """
+        Calls the handler of the signal with the arguments followed by the
+        signal, so the tables of a class can hold its unbound methods.
+        """
+        try:
+            handler = self._resolved[type(signal)]
+        except KeyError:
+            handler = self.resolve(type(signal))
+
+        if handler is None:
+            return None
+
+        return handler(*args, signal)
@@ -17,3 +17,60 @@ class StateContentNotSavable(Exception):
 
     def __init__(self, message: str):
         super().__init__(message)
+
+
+class InvalidHotkeyError(Exception):
+    """
+    An exception raised when the hotkey of an option is not a single
+    character which can be used for the selection, or when it is used
+    by another option of the same submenu.
+
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class InputScriptError(Exception):
+    """
+    An exception raised when a line of an input script does not select
+    an option of the current submenu.
+
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class InvalidMacroError(Exception):
+    """
+    An exception raised when a step of a macro does not select an option
+    of a submenu, or when its hotkey can not be used for macros.
+
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class UnknownOptionError(Exception):
+    """
+    An exception raised when a callback is added for an option which is
+    not in the layout.
+
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class InvalidLayoutError(Exception):
+    """
+    An exception raised when the layout defines a submenu which conflicts
+    with a built-in one, ex. a submenu titled "Jobs" in a layout with
+    background options.
+
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+from squiffy.abstract.abstract_input import AbstractInputSource
+from squiffy.errors import InputScriptError
+
+# separates the submenu from the selection in a script line
+SUBMENU_SEPARATOR: str = "/"
+
+# the lines starting with it are ignored
+COMMENT: str = "#"
+
+
+class ScriptedInput(AbstractInputSource):
+    """
+    Reads the selections from a script instead of the prompt, so the
+    application can run without a terminal (ex. from cron).
+
+    Each line of the script is one selection: an index or an option name,
+    optionally preceded by the submenu it is meant for, ex. "Main_Menu/2"
+    or "Second_Menu/Print_the_state". A selection for another submenu than
+    the current one raises an InputScriptError. Empty lines and the lines
+    starting with # are ignored. When the script ends, EOFError is raised,
+    which quits the application.
+
+    Args:
+        lines (Iterable[str]): The lines of the script.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        self._lines: Iterator[str] = iter(lines)
+        self._line_number: int = 0
+        self._selections: int = 0
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> "ScriptedInput":
+        with open(path, "r") as file:
+            return cls(file.read().splitlines())
+
+    @classmethod
+    def from_stream(cls, stream: TextIO | None = None) -> "ScriptedInput":
+        # the stream is read lazily, so a pipe can feed the selections
+        return cls(stream if stream is not None else sys.stdin)
+
+    def read(self, submenu: str) -> str:
+        for line in self._lines:
+            self._line_number += 1
+            line = line.strip()
+
+            if not line or line.startswith(COMMENT):
+                continue
+
+            target, separator, selection = line.rpartition(SUBMENU_SEPARATOR)
+
+            if separator and target.strip().casefold() != submenu.casefold():
+                raise InputScriptError(
+                    f"Line {self._line_number} selects in {target.strip()}, "
+                    f"but the current submenu is {submenu}"
+                )
+
+            self._selections += 1
+            return selection.strip()
+
+        raise EOFError("The input script has ended")
+
+    @property
+    def line_number(self) -> int:
+        return self._line_number
+
+    @property
+    def selections(self) -> int:
+        return self._selections
@@ -3,3 +3,9 @@ BORDER_HIGHT: int = 1
 TEXT_PADDING: int = 0
 
 STANDARD_WIDTH: int = 100  # in charachters
+
+STANDARD_HIGHT: int = 24  # in lines, used when the terminal size is unknown
+
+FRAME_CACHE_SIZE: int = 32  # rendered frames kept by each Style
+
+PROMPT_LINES: int = 2  # the prompt and the line break of the accepted input
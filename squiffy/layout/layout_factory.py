@@ -6,7 +6,14 @@ from squiffy.menu import menu
 from squiffy.menu import submenu
 from squiffy.menu import menu_items
 from squiffy.menu import error_submenu
-from squiffy.screen import Screen
+from squiffy.menu.command_palette import CommandPalette
+from squiffy.menu.jobs_submenu import JobsSubmenu, JOBS_SUBMENU
+from squiffy.context.jobs import JobRunner
+from squiffy.menu.navigation import MenuAddress, ADDRESS_SEPARATOR, normalize_address
+from squiffy.errors import InvalidHotkeyError, InvalidLayoutError
+from squiffy.screen import Screen, HeadlessScreen
+from squiffy.renderer import Renderer, HeadlessRenderer
+from squiffy.abstract.abstract_style import AbstractRenderer
 from .style import Style
 from .style_factory import StyleFactory
 
@@ -16,10 +23,53 @@ from .style_factory import StyleFactory
 
 
 class LayoutFactory(AbstractLayoutFactory):
-    def __init__(self, layout_file_path: Path, error_handler=None) -> None:
-        self._screen = Screen()
+    """
+    Creates the menu from a layout file.
+
+    Args:
+        layout_file_path (Path): The path to the layout file.
+        error_handler (optional): The error submenu used when the layout
+        does not include the error handling.
+        headless (bool): Renders the frames in memory, with a fixed screen
+        size, instead of the terminal. Defaults to False.
+        screen_size (tuple[int, int] | None): The (hight, width) of the
+        headless screen.
+    """
+
+    def __init__(
+        self,
+        layout_file_path: Path,
+        error_handler=None,
+        headless: bool = False,
+        screen_size: tuple[int, int] | None = None,
+    ) -> None:
+        # a single renderer is shared by all the submenus, since all of them
+        # draw over the same screen
+        if headless:
+            self._screen: Screen = (
+                HeadlessScreen(*screen_size)
+                if screen_size is not None
+                else HeadlessScreen()
+            )
+            self._renderer: AbstractRenderer = HeadlessRenderer(screen=self._screen)
+        else:
+            self._screen: Screen = Screen()
+            self._renderer: AbstractRenderer = Renderer(screen=self._screen)
+
         self.error_handler = error_handler
 
+        # indexes the options of all the submenus, filled while they are created
+        self._palette = CommandPalette(renderer=self._renderer)
+
+        # the dense ids of the options triggering a Do signal, by signal name
+        self._option_ids: dict[str, int] = dict({})
+
+        # the signal names of the options running in the background, and
+        # the runner of their jobs when the layout has any
+        self._background_options: set[str] = set()
+        self._process_options: set[str] = set()
+        self._jobs: JobRunner | None = None
+
         try:
             with open(layout_file_path, "r") as file:
                 self._layout: dict = json.load(file)
@@ -31,11 +81,101 @@ class LayoutFactory(AbstractLayoutFactory):
             )
 
     def create(self) -> menu.Menu:
+        # the options are indexed again while the submenus are created
+        self._palette.clear()
         submenues = self._ansemble_submenu()
         error_handling = self._create_error_handling()
 
-        return menu.Menu(
-            submenu=submenues, main_submenu_idx=0, error_submenu=error_handling
+        paths = self._create_path_index()
+        if self._background_options:
+            submenues.append(self._create_jobs_submenu(paths, main=submenues[0].uid))
+
+        created_menu = menu.Menu(
+            submenu=submenues,
+            main_submenu_idx=0,
+            error_submenu=error_handling,
+            palette=self._palette,
+            paths=paths,
+        )
+
+        for macro in self._layout.get("macros", []):
+            created_menu.add_macro(
+                name=macro.get("name"),
+                steps=macro.get("steps"),
+                hotkey=macro.get("hotkey"),
+            )
+
+        return created_menu
+
+    def _create_path_index(self) -> dict[str, MenuAddress]:
+        """
+        Maps the addresses of the submenus and of their options to their
+        targets. A submenu is addressed by its shortest path of switches
+        from the main submenu (ex. "Main_Menu/Second_Menu") or by its title
+        alone, and an option by the address of its submenu followed by the
+        option name.
+        """
+        submenues = {
+            details.get("title"): details for details in self._layout.get("submenu")
+        }
+        main = next(
+            (title for title, details in submenues.items() if details.get("main")),
+            next(iter(submenues)),
+        )
+
+        # breadth first over the switches, so each submenu gets its shortest path
+        paths: dict[str, tuple[str, ...]] = {main: (main,)}
+        queue: list[str] = [main]
+        for title in queue:
+            for option in submenues[title].get("options"):
+                target = option.get("switch")
+                if target in submenues and target not in paths:
+                    paths[target] = paths[title] + (target,)
+                    queue.append(target)
+
+        index: dict[str, MenuAddress] = dict({})
+        for title, details in submenues.items():
+            # the submenus without a switch leading to them are addressed by title
+            path = paths.get(title, (title,))
+            addresses = {ADDRESS_SEPARATOR.join(path), title}
+
+            for address in addresses:
+                index[normalize_address(address)] = MenuAddress(path=path)
+
+                for position, option in enumerate(details.get("options")):
+                    option_address = (
+                        f"{address}{ADDRESS_SEPARATOR}{option.get('option')}"
+                    )
+                    index[normalize_address(option_address)] = MenuAddress(
+                        path=path, option=position
+                    )
+
+        return index
+
+    def _create_jobs_submenu(
+        self, paths: dict[str, MenuAddress], main: str
+    ) -> JobsSubmenu:
+        """
+        The submenu listing the background jobs, reached by a switch to
+        "Jobs" or by its address.
+        """
+        titles = {
+            details.get("title").casefold() for details in self._layout.get("submenu")
+        }
+        if JOBS_SUBMENU.casefold() in titles:
+            raise InvalidLayoutError(
+                f'The submenu title "{JOBS_SUBMENU}" is used by the built-in jobs '
+                "submenu of the background options. Rename the submenu of the layout."
+            )
+
+        # the runner is kept between the creations, so its pools are not leaked
+        if self._jobs is None:
+            self._jobs = JobRunner()
+
+        paths[normalize_address(JOBS_SUBMENU)] = MenuAddress(path=(main, JOBS_SUBMENU))
+
+        return JobsSubmenu(
+            jobs=self._jobs, style=self._create_style(), renderer=self._renderer
         )
 
     def _ansemble_submenu(self) -> list[submenu.Submenu]:
@@ -43,13 +183,17 @@ class LayoutFactory(AbstractLayoutFactory):
 
         for submenu_details in self._layout.get("submenu"):
             items: list[menu_items.Item] = list([])
+            hotkeys: dict[str, menu_items.Item] = dict({})
 
             for option in submenu_details.get("options"):
                 item = self._create_items(
-                    item_details=option, parent_submenu=submenu_details.get("title")
+                    item_details=option,
+                    parent_submenu=submenu_details.get("title"),
+                    hotkeys=hotkeys,
                 )
 
                 items.append(item)
+                self._palette.add(submenu=submenu_details.get("title"), item=item)
 
             items_collection = menu_items.ItemsCollection(
                 uid=f"{submenu_details.get('title')}_items".upper(), items=items
@@ -65,6 +209,7 @@ class LayoutFactory(AbstractLayoutFactory):
                         submenu_details=submenu_details,
                         items_collection=items_collection,
                         style=style,
+                        hotkeys=hotkeys,
                     ),
                 )
 
@@ -74,6 +219,7 @@ class LayoutFactory(AbstractLayoutFactory):
                         submenu_details=submenu_details,
                         items_collection=items_collection,
                         style=style,
+                        hotkeys=hotkeys,
                     )
                 )
 
@@ -84,6 +230,7 @@ class LayoutFactory(AbstractLayoutFactory):
         submenu_details: dict,
         items_collection: menu_items.ItemsCollection,
         style: Style = None,
+        hotkeys: dict[str, menu_items.Item] | None = None,
     ) -> submenu.Submenu:
         if submenu_details.get("logo") is not None:
             logo = self._import_logo(submenu_details.get("logo"))
@@ -104,31 +251,87 @@ class LayoutFactory(AbstractLayoutFactory):
             add_return=submenu_details.get("return_to_previous"),
             add_return_to_main=submenu_details.get("return_to_main"),
             add_quit=submenu_details.get("quit"),
+            renderer=self._renderer,
+            hotkeys=hotkeys,
         )
 
-    def _create_items(self, item_details: dict, parent_submenu: str) -> menu_items.Item:
+    def _create_items(
+        self,
+        item_details: dict,
+        parent_submenu: str,
+        hotkeys: dict[str, menu_items.Item] | None = None,
+    ) -> menu_items.Item:
         if item_details.get("include_help") is True:
             help = item_details.get("help")
         else:
             help = None
 
+        hotkey = item_details.get("hotkey")
+
         # Check for menu switch and append the appropriate signal
         if item_details.get("switch") is not None:
             swith_to = item_details.get("switch")
 
-            return menu_items.Item(
+            item = menu_items.Item(
                 option=item_details.get("option"),
                 signal=signals.SwitchSubmenu(target_id=swith_to),
                 help=help,
+                hotkey=hotkey,
             )
 
-        return menu_items.Item(
-            option=item_details.get("option"),
-            signal=signals.Do(
-                utils.generate_signal_name(parent_submenu, item_details.get("option"))
-            ),
-            help=help,
-        )
+        else:
+            signal_name = utils.generate_signal_name(
+                parent_submenu, item_details.get("option")
+            )
+            option_id = self._option_ids.setdefault(signal_name, len(self._option_ids))
+
+            # "background": true runs in a thread and "process" in a process
+            background = item_details.get("background")
+            if background is True or background == "process":
+                self._background_options.add(signal_name)
+            if background == "process":
+                self._process_options.add(signal_name)
+
+            item = menu_items.Item(
+                option=item_details.get("option"),
+                signal=signals.Do(signal_name, option_id=option_id),
+                help=help,
+                hotkey=hotkey,
+            )
+
+        # the hotkeys of a submenu are compiled in a key to item table
+        if hotkey is not None and hotkeys is not None:
+            self._check_hotkey(hotkey, item, hotkeys, parent_submenu)
+            hotkeys[hotkey] = item
+
+        return item
+
+    @staticmethod
+    def _check_hotkey(
+        hotkey: str,
+        item: menu_items.Item,
+        hotkeys: dict[str, menu_items.Item],
+        parent_submenu: str,
+    ) -> None:
+        # the digits select by index and ":" opens the command palette
+        if (
+            not isinstance(hotkey, str)
+            or len(hotkey) != 1
+            or not hotkey.isprintable()
+            or hotkey.isspace()
+            or hotkey.isdecimal()
+            or hotkey == ":"
+        ):
+            raise InvalidHotkeyError(
+                f"Invalid hotkey {hotkey!r} in {parent_submenu}. A hotkey should be "
+                "a single character, other than a digit, a space or ':'"
+            )
+
+        if hotkey in hotkeys:
+            raise InvalidHotkeyError(
+                f"The hotkey {hotkey!r} is used by both {hotkeys[hotkey].show()} "
+                f"and {item.show()} in {parent_submenu}"
+            )
 
     def _create_error_handling(self) -> error_submenu.ErrorSubmenu:
         _info: dict = self._layout.get("error_handling")
@@ -136,10 +339,12 @@ class LayoutFactory(AbstractLayoutFactory):
         if _info.get("include"):
             if _info.get("logger_path") is not None:
                 logger = self._create_logger(_info.get("logger_path"))
-                return error_submenu.ErrorSubmenu(logger=logger)
+                return error_submenu.ErrorSubmenu(
+                    logger=logger, renderer=self._renderer
+                )
 
             else:
-                return error_submenu.ErrorSubmenu()
+                return error_submenu.ErrorSubmenu(renderer=self._renderer)
         else:
             return self.error_handler
 
@@ -149,6 +354,34 @@ class LayoutFactory(AbstractLayoutFactory):
         if style_sheet is None:
             return style_factory.create(style_sheet=self._layout.get("default_style"))
 
+    @property
+    def screen(self) -> Screen:
+        return self._screen
+
+    @property
+    def renderer(self) -> AbstractRenderer:
+        return self._renderer
+
+    @property
+    def option_ids(self) -> dict[str, int]:
+        return self._option_ids
+
+    @property
+    def background_options(self) -> set[str]:
+        return self._background_options
+
+    @property
+    def process_options(self) -> set[str]:
+        return self._process_options
+
+    @property
+    def jobs(self) -> JobRunner | None:
+        return self._jobs
+
+    @property
+    def palette(self) -> CommandPalette:
+        return self._palette
+
     def _import_logo(self, logo_path) -> str:
         pass
 
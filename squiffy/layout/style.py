@@ -1,4 +1,59 @@
+from collections import OrderedDict
+from typing import Hashable
 from squiffy.abstract import abstract_style
+from .contants import FRAME_CACHE_SIZE, PROMPT_LINES
+
+
+class FrameCache:
+    """
+    A bounded cache of rendered frames with least-recently-used eviction.
+
+    Args:
+        max_size (int): The maximum number of frames kept in the cache.
+    """
+
+    def __init__(self, max_size: int = FRAME_CACHE_SIZE) -> None:
+        self._max_size = max_size
+        self._frames: OrderedDict[Hashable, str] = OrderedDict()
+
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def get(self, key: Hashable) -> str | None:
+        frame = self._frames.get(key)
+
+        if frame is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._frames.move_to_end(key)
+        return frame
+
+    def put(self, key: Hashable, frame: str) -> None:
+        self._frames[key] = frame
+        self._frames.move_to_end(key)
+
+        if len(self._frames) > self._max_size:
+            self._frames.popitem(last=False)
+
+    def clear(self) -> None:
+        self._frames.clear()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self) -> int:
+        return len(self._frames)
 
 
 class Style(abstract_style.AbstractStyle):
@@ -9,6 +64,7 @@ class Style(abstract_style.AbstractStyle):
         content: abstract_style.AbstractStyleContent = None,
         footer: abstract_style.AbstractStyleFooter = None,
         help: abstract_style.AbstractStyleHelp = None,
+        cache_size: int = FRAME_CACHE_SIZE,
     ) -> None:
         self._screen = screen
         self._header = header
@@ -16,6 +72,19 @@ class Style(abstract_style.AbstractStyle):
         self._footer = footer
         self._help = help
 
+        self._frame_cache = FrameCache(max_size=cache_size)
+
+    def resize(self, hight: int, width: int) -> None:
+        """
+        Pushes the new screen size to the style components and drops the
+        frames rendered for the previous size.
+        """
+        for component in (self._header, self._content, self._footer):
+            component.hight = hight
+            component.width = width
+
+        self.invalidate()
+
     def create(
         self,
         title: str,
@@ -24,6 +93,22 @@ class Style(abstract_style.AbstractStyle):
         content: dict,
         footer_msg: str,
     ) -> str:
+        # A resize is pushed to the components before the key is computed
+        self._screen.refresh()
+
+        if self._content.windowed:
+            return self._create_windowed(
+                title, subtitle, header_msg, content, footer_msg
+            )
+
+        # An unchanged submenu is served from the cache, so the boxes are
+        # only rebuilt when the text, the items or the dimensions change.
+        key = self._frame_key(title, subtitle, header_msg, content, footer_msg)
+        frame = self._frame_cache.get(key)
+
+        if frame is not None:
+            return frame
+
         self._header.title = title
         self._header.subtitle = subtitle
         self._header.message = header_msg
@@ -32,6 +117,90 @@ class Style(abstract_style.AbstractStyle):
 
         self._footer.message = footer_msg
 
-        return "\n".join(
+        frame = "\n".join(
             [self._header.create(), self._content.create(), self._footer.create()]
         )
+        self._frame_cache.put(key, frame)
+
+        return frame
+
+    def scroll(self, pages: int) -> None:
+        self._content.scroll(pages)
+
+    def _create_windowed(
+        self,
+        title: str,
+        subtitle: str,
+        header_msg: str,
+        content: dict,
+        footer_msg: str,
+    ) -> str:
+        # The number of visible rows depends on the hight of the header and
+        # footer, so those are rendered before the content.
+        self._header.title = title
+        self._header.subtitle = subtitle
+        self._header.message = header_msg
+        header = self._header.create()
+
+        self._footer.message = footer_msg
+        footer = self._footer.create()
+
+        self._content.rows = self._visible_rows(header, footer)
+        self._content.content = content
+
+        key = (header, footer, self._content.fingerprint())
+        frame = self._frame_cache.get(key)
+
+        if frame is None:
+            frame = "\n".join([header, self._content.create(), footer])
+            self._frame_cache.put(key, frame)
+
+        return frame
+
+    def _visible_rows(self, header: str, footer: str) -> int:
+        padding = self._content.padding
+        reserved = (
+            header.count("\n")
+            + footer.count("\n")
+            + 2  # the header and footer last lines
+            + 2  # the content borders
+            + padding.top
+            + padding.bottom
+            + 1  # the scrolling indicator
+            + PROMPT_LINES
+        )
+
+        return self._content.hight - reserved
+
+    def invalidate(self) -> None:
+        """
+        Drops all the cached frames. Should be called whenever the style
+        components are changed outside of the create method.
+        """
+        self._frame_cache.clear()
+
+    def _frame_key(
+        self,
+        title: str,
+        subtitle: str,
+        header_msg: str,
+        content: dict,
+        footer_msg: str,
+    ) -> tuple:
+        # The items are rendered through their string representation which
+        # does not change during the lifetime of an item, so the content
+        # is fingerprinted by the (index, item) pairs.
+        return (
+            title,
+            subtitle,
+            header_msg,
+            footer_msg,
+            tuple(content.items()),
+            self._header.hight,
+            self._header.width,
+            self._header.border,
+        )
+
+    @property
+    def frame_cache(self) -> FrameCache:
+        return self._frame_cache
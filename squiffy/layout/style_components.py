@@ -1,8 +1,9 @@
-import textwrap
+from functools import lru_cache
 from typing import Union
 from squiffy.abstract import abstract_style
 from .contants import STANDARD_WIDTH
 from .borders import BORDERS
+from .text_width import display_width, wrap_text
 
 
 class TextGenerator:
@@ -97,17 +98,19 @@ class TextGenerator:
                 + self._border.right_vertical
             )
 
-        assert len(text) <= width, "Text is too long for the given width"
+        text_width = display_width(text)
+
+        assert text_width <= width, "Text is too long for the given width"
 
         if alignment == "center":
-            if len(text) % 2 != 0:
+            if text_width % 2 != 0:
                 left_margin: int = int(
-                    ((width - padding_left - padding_right - 2) - len(text)) / 2
+                    ((width - padding_left - padding_right - 2) - text_width) / 2
                 )
                 right_margin = left_margin + 1
             else:
                 left_margin: int = int(
-                    ((width - padding_left - padding_right - 2) - len(text)) / 2
+                    ((width - padding_left - padding_right - 2) - text_width) / 2
                 )
                 right_margin = left_margin
 
@@ -122,7 +125,7 @@ class TextGenerator:
             )
         elif alignment == "left":
             right_margin: int = (
-                width - padding_left - padding_right - len(text) - 2
+                width - padding_left - padding_right - text_width - 2
             )  # the borders
 
             return (
@@ -136,7 +139,7 @@ class TextGenerator:
 
         elif alignment == "right":
             left_margin: int = (
-                width - padding_left - padding_right - len(text) - 2
+                width - padding_left - padding_right - text_width - 2
             )  # the borders
 
             return (
@@ -150,10 +153,115 @@ class TextGenerator:
 
     @staticmethod
     def wrap_text(text: str, max_width: int) -> list[str]:
-        if len(text) > max_width:
-            return textwrap.wrap(text, max_width)
-        else:
-            return [text]
+        return wrap_text(text, max_width)
+
+
+class StyleTemplate:
+    """
+    A compiled form of a style component.
+
+    The borders, the padding rows and the glyphs of the border style depend
+    only on the border type, the width and the padding, so they are built
+    once at compilation. Filling the template only wraps and aligns the text
+    slots between the prebuilt rows.
+
+    The output is identical to the one of the TextGenerator.
+    """
+
+    def __init__(
+        self,
+        border: str,
+        width: int,
+        padding_top: int,
+        padding_bottom: int,
+        padding_left: int,
+        padding_right: int,
+    ) -> None:
+        glyphs = BORDERS.get(border)()
+
+        total_width = min(width, STANDARD_WIDTH)
+        self._interior_width: int = total_width - padding_left - padding_right - 2
+
+        top = (
+            glyphs.top_left_corner
+            + glyphs.top_horizontal * (total_width - 2)
+            + glyphs.top_right_corner
+        )
+        bottom = (
+            glyphs.bottom_left_corner
+            + glyphs.bottom_horizontal * (total_width - 2)
+            + glyphs.bottom_right_corner
+        )
+        blank = glyphs.left_vertical + " " * (total_width - 2) + glyphs.right_vertical
+
+        self._head: tuple[str, ...] = (top,) + (blank,) * padding_top
+        self._tail: tuple[str, ...] = (blank,) * padding_bottom + (bottom,)
+
+        self._left: str = glyphs.left_vertical + " " * padding_left
+        self._right: str = " " * padding_right + glyphs.right_vertical
+
+    def fill(self, texts: list[str], alignment: str = "center") -> str:
+        form = list(self._head)
+
+        for text in texts:
+            # Fast path for the usual ASCII text which fits on one line,
+            # where the display width is the length.
+            if text.isascii() and len(text) <= self._interior_width:
+                form.append(self._row(text, len(text), alignment))
+                continue
+
+            for line in wrap_text(text, self._interior_width):
+                form.append(self._row(line, display_width(line), alignment))
+
+        form.extend(self._tail)
+
+        return "\n".join(form)
+
+    def row(self, text: str, alignment: str = "center") -> str:
+        return self._row(text, display_width(text), alignment)
+
+    def _row(self, text: str, text_width: int, alignment: str) -> str:
+        free = self._interior_width - text_width
+
+        if alignment == "center":
+            # keeps the margins computed by TextGenerator.row
+            left_margin = int(free / 2)
+            right_margin = left_margin + 1 if text_width % 2 != 0 else left_margin
+
+            return (
+                self._left + " " * left_margin + text + " " * right_margin + self._right
+            )
+        elif alignment == "left":
+            return self._left + text + " " * free + self._right
+
+        elif alignment == "right":
+            return self._left + " " * free + text + self._right
+
+    @property
+    def interior_width(self) -> int:
+        return self._interior_width
+
+
+@lru_cache(maxsize=64)
+def compile_template(
+    border: str,
+    width: int,
+    padding_top: int,
+    padding_bottom: int,
+    padding_left: int,
+    padding_right: int,
+) -> StyleTemplate:
+    """
+    Compiles a style template once per (border, width, padding).
+    """
+    return StyleTemplate(
+        border=border,
+        width=width,
+        padding_top=padding_top,
+        padding_bottom=padding_bottom,
+        padding_left=padding_left,
+        padding_right=padding_right,
+    )
 
 
 class Padding(abstract_style.AbstractPadding):
@@ -182,7 +290,11 @@ class Padding(abstract_style.AbstractPadding):
 
 class StyleHeader(abstract_style.AbstractStyleHeader):
     def __init__(
-        self, max_dimensions: tuple[int, int], padding: Padding, border: str
+        self,
+        max_dimensions: tuple[int, int],
+        padding: Padding,
+        border: str,
+        template: StyleTemplate | None = None,
     ) -> None:
         self._title: str = None
         self._subtitle: str = None
@@ -194,17 +306,13 @@ class StyleHeader(abstract_style.AbstractStyleHeader):
         self._padding: Padding = padding
         self._border: str = border
 
+        self._template: StyleTemplate = (
+            template if template is not None else self._compile_template()
+        )
+
     def create(self) -> str:
-        text_generator = TextGenerator(self._border)
-        return text_generator.generate(
-            screen_h=self._screen_hight,
-            screen_w=self._screen_width,
-            padding_top=self._padding.top,
-            padding_bottom=self._padding.bottom,
-            padding_left=self._padding.left,
-            padding_right=self._padding.right,
-            texts=[self._title, self._subtitle, self._message],
-            alignment="left",
+        return self._template.fill(
+            texts=[self._title, self._subtitle, self._message], alignment="left"
         )
 
     @property
@@ -246,6 +354,7 @@ class StyleHeader(abstract_style.AbstractStyleHeader):
     @width.setter
     def width(self, width: int) -> None:
         self._screen_width = width
+        self._template = self._compile_template()
 
     @property
     def padding(self) -> Padding:
@@ -254,6 +363,7 @@ class StyleHeader(abstract_style.AbstractStyleHeader):
     @padding.setter
     def padding(self, padding: Padding) -> None:
         self._padding = padding
+        self._template = self._compile_template()
 
     @property
     def border(self) -> str:
@@ -262,11 +372,26 @@ class StyleHeader(abstract_style.AbstractStyleHeader):
     @border.setter
     def border(self, border: str) -> None:
         self._border = border
+        self._template = self._compile_template()
+
+    def _compile_template(self) -> StyleTemplate:
+        return compile_template(
+            border=self._border,
+            width=self.width,
+            padding_top=self._padding.top,
+            padding_bottom=self._padding.bottom,
+            padding_left=self._padding.left,
+            padding_right=self._padding.right,
+        )
 
 
 class StyleFooter(abstract_style.AbstractStyleFooter):
     def __init__(
-        self, max_dimensions: tuple[int, int], padding: Padding, border: str
+        self,
+        max_dimensions: tuple[int, int],
+        padding: Padding,
+        border: str,
+        template: StyleTemplate | None = None,
     ) -> None:
         self._message: str = None
 
@@ -276,19 +401,13 @@ class StyleFooter(abstract_style.AbstractStyleFooter):
         self._padding: Padding = padding
         self._border: str = border
 
-    def create(self) -> str:
-        text_generator = TextGenerator(self._border)
-        return text_generator.generate(
-            screen_h=self._hight,
-            screen_w=self._width,
-            padding_top=self._padding.top,
-            padding_bottom=self._padding.bottom,
-            padding_left=self._padding.left,
-            padding_right=self._padding.right,
-            texts=[self._message],
-            alignment="left",
+        self._template: StyleTemplate = (
+            template if template is not None else self._compile_template()
         )
 
+    def create(self) -> str:
+        return self._template.fill(texts=[self._message], alignment="left")
+
     @property
     def message(self) -> str:
         return self._message
@@ -312,6 +431,7 @@ class StyleFooter(abstract_style.AbstractStyleFooter):
     @width.setter
     def width(self, width: int) -> None:
         self._width = width
+        self._template = self._compile_template()
 
     @property
     def padding(self) -> Padding:
@@ -320,6 +440,7 @@ class StyleFooter(abstract_style.AbstractStyleFooter):
     @padding.setter
     def padding(self, padding: Padding) -> None:
         self._padding = padding
+        self._template = self._compile_template()
 
     @property
     def border(self) -> str:
@@ -328,40 +449,125 @@ class StyleFooter(abstract_style.AbstractStyleFooter):
     @border.setter
     def border(self, border: str) -> None:
         self._border = border
+        self._template = self._compile_template()
+
+    def _compile_template(self) -> StyleTemplate:
+        return compile_template(
+            border=self._border,
+            width=self.width,
+            padding_top=self._padding.top,
+            padding_bottom=self._padding.bottom,
+            padding_left=self._padding.left,
+            padding_right=self._padding.right,
+        )
 
 
 class StyleContent(abstract_style.AbstractStyleContent):
     def __init__(
-        self, max_dimensions: tuple[int, int], padding: Padding, border: str
+        self,
+        max_dimensions: tuple[int, int],
+        padding: Padding,
+        border: str,
+        template: StyleTemplate | None = None,
+        windowed: bool = False,
     ) -> None:
         self._content: list[str] = None
 
+        # In the windowed mode only the items visible in the viewport
+        # are formatted and rendered.
+        self._windowed: bool = windowed
+        self._items: dict[int, object] = dict({})
+        self._rows: int | None = None
+        self._offset: int = 0
+
         self._hight: int = max_dimensions[0]
         self._width: int = max_dimensions[1]
 
         self._padding: Padding = padding
         self._border: str = border
 
+        self._template: StyleTemplate = (
+            template if template is not None else self._compile_template()
+        )
+
     def create(self) -> str:
-        text_generator = TextGenerator(self._border)
-        return text_generator.generate(
-            screen_h=self._hight,
-            screen_w=self._width,
-            padding_top=self._padding.top,
-            padding_bottom=self._padding.bottom,
-            padding_left=self._padding.left,
-            padding_right=self._padding.right,
-            texts=self._content,
-            alignment="left",
+        return self._template.fill(texts=self.content, alignment="left")
+
+    def scroll(self, pages: int) -> None:
+        """
+        Moves the viewport by the given number of pages. Negative values
+        scroll up.
+        """
+        self._offset += pages * self.rows
+        self._clamp_offset()
+
+    def window(self) -> range:
+        """
+        The indexes of the items visible in the viewport.
+        """
+        stop = min(self._offset + self.rows, len(self._items))
+        return range(self._offset, stop)
+
+    def fingerprint(self) -> tuple:
+        """
+        Identifies the rendered content of the windowed mode, in O(rows).
+        """
+        window = self.window()
+        return (
+            window.start,
+            len(self._items),
+            tuple(self._items[index] for index in window),
         )
 
+    def _visible_content(self) -> list[str]:
+        # The items are expected to be indexed from 0 to len - 1,
+        # as in the ItemsCollection tree.
+        window = self.window()
+        content = [f"{index}>>>{self._items[index]}" for index in window]
+
+        if len(window) < len(self._items):
+            content.append(
+                f"[{window.start}-{window.stop - 1} of {len(self._items)}]"
+                " PageUp/PageDown to scroll"
+            )
+
+        return content
+
+    def _clamp_offset(self) -> None:
+        last_page = max(len(self._items) - self.rows, 0)
+        self._offset = min(max(self._offset, 0), last_page)
+
     @property
-    def content(self) -> list[tuple[int, str]]:
+    def content(self) -> list[str]:
+        if self._windowed:
+            return self._visible_content()
+
         return self._content
 
     @content.setter
-    def content(self, content: dict[str, str]) -> None:
-        self._content = [f"{key}>>>{value}" for key, value in content.items()]
+    def content(self, content: dict[int, str]) -> None:
+        if self._windowed:
+            # the formatting is deferred to the visible rows
+            self._items = content
+            self._clamp_offset()
+        else:
+            self._content = [f"{key}>>>{value}" for key, value in content.items()]
+
+    @property
+    def windowed(self) -> bool:
+        return self._windowed
+
+    @property
+    def rows(self) -> int:
+        if self._rows is None:
+            return len(self._items)
+
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows: int) -> None:
+        self._rows = max(rows, 1)
+        self._clamp_offset()
 
     @property
     def hight(self) -> int:
@@ -378,6 +584,7 @@ class StyleContent(abstract_style.AbstractStyleContent):
     @width.setter
     def width(self, width: int) -> None:
         self._width = width
+        self._template = self._compile_template()
 
     @property
     def padding(self) -> Padding:
@@ -386,6 +593,7 @@ class StyleContent(abstract_style.AbstractStyleContent):
     @padding.setter
     def padding(self, padding: Padding) -> None:
         self._padding = padding
+        self._template = self._compile_template()
 
     @property
     def border(self) -> str:
@@ -394,3 +602,14 @@ class StyleContent(abstract_style.AbstractStyleContent):
     @border.setter
     def border(self, border: str) -> None:
         self._border = border
+        self._template = self._compile_template()
+
+    def _compile_template(self) -> StyleTemplate:
+        return compile_template(
+            border=self._border,
+            width=self.width,
+            padding_top=self._padding.top,
+            padding_bottom=self._padding.bottom,
+            padding_left=self._padding.left,
+            padding_right=self._padding.right,
+        )
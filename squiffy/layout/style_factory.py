@@ -1,6 +1,12 @@
 from squiffy.screen import Screen
 from squiffy.abstract import abstract_style
-from .style_components import StyleHeader, StyleFooter, StyleContent, Padding
+from .style_components import (
+    StyleHeader,
+    StyleFooter,
+    StyleContent,
+    Padding,
+    compile_template,
+)
 from .style import Style
 
 
@@ -17,12 +23,15 @@ class StyleFactory(abstract_style.AbstractStyleFactory):
     def create(self, style_sheet: dict) -> Style:
         self._parse_style_sheet(style_sheet)
 
-        return Style(
+        style = Style(
             screen=self._screen,
             header=self._header,
             footer=self._footer,
             content=self._content,
         )
+        self._screen.attach(style)
+
+        return style
 
     def _parse_style_sheet(self, style_sheet: dict) -> None:
         if style_sheet["dimensions"]["type"] == "auto":
@@ -34,20 +43,38 @@ class StyleFactory(abstract_style.AbstractStyleFactory):
                 right=_padding_info.get("right"),
             )
 
+            max_dimensions = (self._screen.hight, self._screen.width)
+            border = style_sheet["border"]["type"]
+
+            # The header, footer and content share the border, width and
+            # padding, so the style sheet is compiled once for all of them.
+            template = compile_template(
+                border=border,
+                width=max_dimensions[1],
+                padding_top=padding.top,
+                padding_bottom=padding.bottom,
+                padding_left=padding.left,
+                padding_right=padding.right,
+            )
+
             self._header = StyleHeader(
-                max_dimensions=(self._screen.hight, self._screen.width),
+                max_dimensions=max_dimensions,
                 padding=padding,
-                border=style_sheet["border"]["type"],
+                border=border,
+                template=template,
             )
 
             self._footer = StyleFooter(
-                max_dimensions=(self._screen.hight, self._screen.width),
+                max_dimensions=max_dimensions,
                 padding=padding,
-                border=style_sheet["border"]["type"],
+                border=border,
+                template=template,
             )
 
             self._content = StyleContent(
-                max_dimensions=(self._screen.hight, self._screen.width),
+                max_dimensions=max_dimensions,
                 padding=padding,
-                border=style_sheet["border"]["type"],
+                border=border,
+                template=template,
+                windowed=style_sheet["dimensions"].get("windowed", False),
             )
@@ -0,0 +1,144 @@
+import re
+import textwrap
+from functools import lru_cache
+from wcwidth import wcswidth, wcwidth
+
+TEXT_WIDTH_CACHE_SIZE: int = 4096
+
+TEXT_WRAP_CACHE_SIZE: int = 1024
+
+_SPACES = re.compile(r"( +)")
+
+
+def display_width(text: str) -> int:
+    """
+    The number of terminal columns used to display the text.
+
+    Wide characters (ex. CJK, emoji) take two columns and combining
+    characters none. ASCII text is measured with len.
+    """
+    if text.isascii():
+        return len(text)
+
+    return _wide_display_width(text)
+
+
+@lru_cache(maxsize=TEXT_WIDTH_CACHE_SIZE)
+def _wide_display_width(text: str) -> int:
+    width = wcswidth(text)
+
+    if width < 0:
+        # the text contains non printable characters, which are not displayed
+        width = sum(max(wcwidth(char), 0) for char in text)
+
+    return width
+
+
+def wrap_text(text: str, max_width: int) -> list[str]:
+    """
+    Wraps the text in lines which fit in max_width terminal columns.
+
+    ASCII text is wrapped as textwrap.wrap does, while text containing
+    wide characters is wrapped by its display width. The lines are cached
+    by (text, max_width), since the messages rarely change between frames.
+    """
+    if text.isascii() and len(text) <= max_width:
+        return [text]
+
+    return list(_wrap_text(text, max_width))
+
+
+@lru_cache(maxsize=TEXT_WRAP_CACHE_SIZE)
+def _wrap_text(text: str, max_width: int) -> tuple[str, ...]:
+    if text.isascii():
+        # The greedy wrapper covers single-paragraph text, the rest (tabs,
+        # line breaks, hyphenated words) is left to textwrap.
+        if text.isprintable() and "-" not in text and max_width > 0:
+            return tuple(_greedy_wrap(text, max_width))
+
+        return tuple(textwrap.wrap(text, max_width))
+
+    if _wide_display_width(text) <= max_width:
+        return (text,)
+
+    return tuple(_wrap_wide_text(text, max_width))
+
+
+def _greedy_wrap(text: str, max_width: int) -> list[str]:
+    """
+    The textwrap.wrap algorithm, with the default options, for ASCII
+    text where the only whitespace are spaces and with no hyphens.
+    """
+    chunks = [chunk for chunk in _SPACES.split(text) if chunk]
+    chunks.reverse()
+
+    lines: list[str] = list([])
+
+    while chunks:
+        # the whitespace is dropped at the start of every line but the first
+        if lines and chunks[-1][0] == " ":
+            chunks.pop()
+
+        line: list[str] = list([])
+        line_len = 0
+
+        while chunks and line_len + len(chunks[-1]) <= max_width:
+            chunk = chunks.pop()
+            line.append(chunk)
+            line_len += len(chunk)
+
+        # a word longer than a line fills the rest of the current line
+        if chunks and len(chunks[-1]) > max_width:
+            end = max_width - line_len
+            line.append(chunks[-1][:end])
+            chunks[-1] = chunks[-1][end:]
+
+        # the whitespace (or empty rest of a long word) ending the line
+        if line and (line[-1] == "" or line[-1][0] == " "):
+            del line[-1]
+
+        if line:
+            lines.append("".join(line))
+
+    return lines
+
+
+def _wrap_wide_text(text: str, max_width: int) -> list[str]:
+    lines: list[str] = list([])
+    line, line_width = "", 0
+
+    for word in text.split():
+        word_width = display_width(word)
+
+        if line and line_width + 1 + word_width <= max_width:
+            line, line_width = f"{line} {word}", line_width + 1 + word_width
+            continue
+
+        if line:
+            lines.append(line)
+
+        # words longer than a line (ex. CJK text without spaces) are broken
+        while word_width > max_width:
+            head, word = _split_at_width(word, max_width)
+            lines.append(head)
+            word_width = display_width(word)
+
+        line, line_width = word, word_width
+
+    if line:
+        lines.append(line)
+
+    return lines
+
+
+def _split_at_width(word: str, max_width: int) -> tuple[str, str]:
+    width = 0
+
+    for index, char in enumerate(word):
+        width += max(wcwidth(char), 0)
+
+        # at least one character is kept on each line
+        if width > max_width and index > 0:
+            return word[:index], word[index:]
+
+    return word, ""
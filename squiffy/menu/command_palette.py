@@ -0,0 +1,196 @@
+import re
+from bisect import bisect_left, insort
+from typing import Iterator, NamedTuple
+from prompt_toolkit import PromptSession
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+from squiffy import signals, utils
+from squiffy.abstract.abstract_menu import AbstractItem
+from squiffy.abstract.abstract_style import AbstractRenderer
+
+# the maximum number of results proposed by the palette
+PALETTE_LIMIT: int = 20
+
+# the weight of a match in the option name and in the help text
+OPTION_WEIGHT: int = 3
+HELP_WEIGHT: int = 1
+
+# a whole word match ranks above a word prefix match
+EXACT_BONUS: int = 2
+
+_WORDS = re.compile(r"[^\W_]+")
+
+
+class PaletteEntry(NamedTuple):
+    uid: int
+    submenu: str
+    option: str
+    help: str | None
+    signal: signals.Signal
+
+
+class CommandPalette:
+    """
+    Searches the options of all the submenus and their help text.
+
+    The words of the options and of the help texts are kept in an inverted
+    index, built once by the LayoutFactory. A query matches the options
+    which contain a word starting with each word of the query. The results
+    are ranked by where the words matched (the option name ranks above the
+    help text), by whole word matches and by the option starting with the
+    query.
+
+    Args:
+        renderer (AbstractRenderer | None): The renderer of the menu, which
+        is redrawn after the palette is closed.
+    """
+
+    def __init__(self, renderer: AbstractRenderer | None = None) -> None:
+        self._renderer = renderer
+
+        self._entries: list[PaletteEntry] = list([])
+        self._phrases: list[str] = list([])
+        self._postings: dict[str, dict[int, int]] = dict({})
+        self._words: list[str] = list([])
+
+        self._prompt_session: PromptSession | None = None
+
+    def add(self, submenu: str, item: AbstractItem) -> None:
+        entry = PaletteEntry(
+            uid=len(self._entries),
+            submenu=submenu,
+            option=item.show(),
+            help=item.help_text,
+            signal=item.emit(),
+        )
+        self._entries.append(entry)
+        self._phrases.append(" ".join(_words(entry.option)))
+
+        words = {word: OPTION_WEIGHT for word in _words(entry.option)}
+        for word in _words(entry.help or ""):
+            words.setdefault(word, HELP_WEIGHT)
+
+        for word, weight in words.items():
+            if word not in self._postings:
+                self._postings[word] = dict({})
+                insort(self._words, word)
+
+            self._postings[word][entry.uid] = weight
+
+    def clear(self) -> None:
+        """
+        Drops the indexed entries, before the options are indexed again.
+        """
+        self._entries.clear()
+        self._phrases.clear()
+        self._postings.clear()
+        self._words.clear()
+
+    def search(
+        self, query: str, limit: int | None = PALETTE_LIMIT
+    ) -> list[PaletteEntry]:
+        terms = _words(query)
+        if not terms:
+            return list([])
+
+        scores: dict[int, int] | None = None
+        for term in terms:
+            term_scores = self._term_scores(term)
+
+            # every word of the query has to match
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    uid: score + term_scores[uid]
+                    for uid, score in scores.items()
+                    if uid in term_scores
+                }
+
+        phrase = " ".join(terms)
+        for uid in scores:
+            if self._phrases[uid].startswith(phrase):
+                scores[uid] += OPTION_WEIGHT * EXACT_BONUS
+
+        ranked = sorted(scores, key=lambda uid: (-scores[uid], uid))
+        return [self._entries[uid] for uid in ranked[:limit]]
+
+    def show(self) -> PaletteEntry | None:
+        """
+        Prompts for a query and returns the chosen entry, or None when the
+        palette is left without a choice.
+        """
+        if self._prompt_session is None:
+            self._prompt_session = PromptSession(
+                completer=PaletteCompleter(self), complete_while_typing=True
+            )
+
+        try:
+            text = self._prompt_session.prompt(
+                "palette> ", in_thread=utils._event_loop_running()
+            ).strip()
+        except (KeyboardInterrupt, EOFError):
+            return None
+        finally:
+            # the completions are drawn over the frame
+            if self._renderer is not None:
+                self._renderer.invalidate()
+
+        return self.choose(text)
+
+    def choose(self, text: str) -> PaletteEntry | None:
+        """
+        The entry chosen by the text of the palette prompt: an accepted
+        proposal inserts the entry number, otherwise the best result of the
+        query is chosen.
+        """
+        if text.isdecimal():
+            uid = int(text)
+            return self._entries[uid] if uid < len(self._entries) else None
+
+        results = self.search(text, limit=1)
+        return results[0] if results else None
+
+    def _term_scores(self, term: str) -> dict[int, int]:
+        scores: dict[int, int] = dict({})
+
+        # the words starting with the term are adjacent in the sorted words
+        for index in range(bisect_left(self._words, term), len(self._words)):
+            word = self._words[index]
+            if not word.startswith(term):
+                break
+
+            bonus = EXACT_BONUS if word == term else 1
+            for uid, weight in self._postings[word].items():
+                scores[uid] = max(scores.get(uid, 0), weight * bonus)
+
+        return scores
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PaletteCompleter(Completer):
+    """
+    Proposes the ranked results of the palette, narrowed on each keystroke.
+    """
+
+    def __init__(self, palette: CommandPalette) -> None:
+        self._palette = palette
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterator[Completion]:
+        text = document.text_before_cursor
+
+        for entry in self._palette.search(text):
+            yield Completion(
+                text=str(entry.uid),
+                start_position=-len(text),
+                display=f"{entry.submenu} / {entry.option}",
+                display_meta=entry.help or "",
+            )
+
+
+def _words(text: str) -> list[str]:
+    return _WORDS.findall(text.casefold())
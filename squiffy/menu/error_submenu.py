@@ -1,12 +1,16 @@
-from prompt_toolkit import prompt
-from rich.pretty import pprint
+import sys
+from prompt_toolkit import PromptSession
+from rich.pretty import pretty_repr
 from squiffy import utils
 from squiffy import signals
 from squiffy.abstract.abstract_menu import AbstractErrorSubmenu, AbstractMenu
+from squiffy.renderer import Renderer
+from squiffy.abstract.abstract_style import AbstractRenderer
+from squiffy.abstract.abstract_input import AbstractInputSource
 
 
 class ErrorSubmenu(AbstractErrorSubmenu):
-    def __init__(self, logger=None) -> None:
+    def __init__(self, logger=None, renderer: AbstractRenderer | None = None) -> None:
         self._options: dict[str, signals.Signal] = {
             "RETURN_TO_MAIN": signals.ReturnToMain(),
             "RETURN_TO_PREVIOUS": signals.ReturnToPrevious(),
@@ -16,18 +20,48 @@ class ErrorSubmenu(AbstractErrorSubmenu):
         self._options_tree: dict[int, signals.Signal] = dict({})
         self._update_options_tree()
 
+        # the options are fixed, so the validator is built once
+        self._validator = utils._is_number_within_limits(
+            lower=0, upper=len(self._options_tree) - 1
+        )
+        self._prompt_session: PromptSession | None = None
+
         self._master_menu: AbstractMenu | None = None
 
         self._logger = logger
+        self._renderer = renderer if renderer is not None else Renderer()
+
+        self._input_source: AbstractInputSource | None = None
+        self._rendering: bool = True
 
     def show(self, error: signals.Error) -> None:
         try:
-            if self._logger is not None:
+            if self._input_source is not None:
+                # A script can not answer an error it did not expect, so the
+                # error is reported and the application quits (and saves).
+                print(error.log_message, error.traceback, sep="\n", file=sys.stderr)
+                self._master_menu.handle_signals(signals.Quit())
+            elif self._logger is not None:
                 pass
+            elif not self._rendering:
+                # without a screen, the errors are still reported
+                print(error.log_message, error.traceback, sep="\n", file=sys.stderr)
+
+                option = self._show_prompt()
+                self._propagate_option(option)
             else:
-                print(error.log_message)
-                print(error.traceback)
-                pprint(self._options_tree, expand_all=True, indent_guides=False)
+                # The error could be raised at any point of the frame or
+                # callback output, so the screen is entirely redrawn.
+                self._renderer.invalidate()
+                self._renderer.render(
+                    "\n".join(
+                        [
+                            str(error.log_message),
+                            str(error.traceback),
+                            pretty_repr(self._options_tree, expand_all=True),
+                        ]
+                    )
+                )
 
                 option = self._show_prompt()
                 self._propagate_option(option)
@@ -37,14 +71,12 @@ class ErrorSubmenu(AbstractErrorSubmenu):
         except EOFError:
             self._master_menu.handle_signals(signals.Quit())
 
-    def _show_prompt(self) -> None:
+    def _show_prompt(self) -> int:
+        if self._prompt_session is None:
+            self._prompt_session = PromptSession(validator=self._validator)
+
         option = int(
-            prompt(
-                ">> ",
-                validator=utils._is_number_within_limits(
-                    lower=0, upper=len(self._options_tree)
-                ),
-            )
+            self._prompt_session.prompt(">> ", in_thread=utils._event_loop_running())
         )
 
         return option
@@ -65,3 +97,19 @@ class ErrorSubmenu(AbstractErrorSubmenu):
     @master_menu.setter
     def master_menu(self, menu: AbstractMenu) -> None:
         self._master_menu = menu
+
+    @property
+    def input_source(self) -> AbstractInputSource | None:
+        return self._input_source
+
+    @input_source.setter
+    def input_source(self, input_source: AbstractInputSource | None) -> None:
+        self._input_source = input_source
+
+    @property
+    def rendering(self) -> bool:
+        return self._rendering
+
+    @rendering.setter
+    def rendering(self, rendering: bool) -> None:
+        self._rendering = rendering
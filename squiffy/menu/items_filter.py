@@ -0,0 +1,157 @@
+import re
+from bisect import bisect_left
+from itertools import count
+from typing import Iterable, Iterator
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+from squiffy.abstract.abstract_menu import AbstractItem
+
+# the length of the substrings indexed for the queries of at least this length
+NGRAM: int = 3
+
+# the maximum number of options proposed while filtering
+FILTER_LIMIT: int = 50
+
+_WORDS = re.compile(r"[^\W_]+")
+
+
+class ItemsIndex:
+    """
+    A search index over the options of an ItemsCollection.
+
+    Queries shorter than NGRAM characters match the start of a word of the
+    option (ex. "PR" matches "PRINT_THE_STATE" and "SHOW_PREVIEW"), longer
+    queries match anywhere in the option. The index is updated on every
+    add and remove, so it is never rebuilt.
+
+    Every item gets an increasing sequence number when added. Since the items
+    are only appended to the collection, the sequence numbers follow the
+    order of the collection and the posting lists stay sorted. The position
+    of an item is the number of live items with a lower sequence number.
+    """
+
+    def __init__(self, items: Iterable[AbstractItem] = ()) -> None:
+        self._sequence = count()
+
+        self._sequences: list[int] = list([])
+        self._items: dict[int, AbstractItem] = dict({})
+        self._texts: dict[int, str] = dict({})
+        self._item_sequence: dict[int, int] = dict({})
+
+        self._postings: dict[str, list[int]] = dict({})
+
+        for item in items:
+            self.add(item)
+
+    def add(self, item: AbstractItem) -> None:
+        sequence = next(self._sequence)
+        text = item.show().casefold()
+
+        self._sequences.append(sequence)
+        self._items[sequence] = item
+        self._texts[sequence] = text
+        self._item_sequence[id(item)] = sequence
+
+        for key in self._keys(text):
+            self._postings.setdefault(key, list([])).append(sequence)
+
+    def remove(self, item: AbstractItem) -> None:
+        sequence = self._item_sequence.pop(id(item))
+        text = self._texts.pop(sequence)
+        del self._items[sequence]
+
+        del self._sequences[bisect_left(self._sequences, sequence)]
+
+        for key in self._keys(text):
+            postings = self._postings[key]
+            del postings[bisect_left(postings, sequence)]
+
+            if not postings:
+                del self._postings[key]
+
+    def search(self, query: str, limit: int | None = FILTER_LIMIT) -> list[int]:
+        """
+        The positions of the items matching the query, in the collection order.
+        """
+        return [
+            bisect_left(self._sequences, sequence)
+            for sequence in self._search(query.casefold(), limit)
+        ]
+
+    def _search(self, query: str, limit: int | None) -> Iterator[int]:
+        query = query.strip()
+        if not query:
+            return
+
+        if len(query) < NGRAM:
+            # a short query is a word prefix, which is indexed as such
+            yield from self._postings.get(f"^{query}", ())[:limit]
+            return
+
+        # The shortest posting list holds every match, which are confirmed
+        # against the option text, so only the first matches are checked.
+        candidates = min(
+            (
+                self._postings.get(query[start : start + NGRAM], ())
+                for start in range(len(query) - NGRAM + 1)
+            ),
+            key=len,
+        )
+
+        found = 0
+        for sequence in candidates:
+            if query in self._texts[sequence]:
+                yield sequence
+
+                found += 1
+                if found == limit:
+                    return
+
+    def item(self, position: int) -> AbstractItem:
+        return self._items[self._sequences[position]]
+
+    @staticmethod
+    def _keys(text: str) -> set[str]:
+        # the word prefixes are marked with ^, so they do not mix with n-grams
+        keys = {
+            f"^{word[:length]}"
+            for word in _WORDS.findall(text)
+            for length in range(1, NGRAM)
+        }
+        keys.update(
+            text[start : start + NGRAM] for start in range(len(text) - NGRAM + 1)
+        )
+
+        return keys
+
+    def __len__(self) -> int:
+        return len(self._sequences)
+
+
+class ItemsCompleter(Completer):
+    """
+    Proposes the options matching the text typed in the prompt.
+
+    Each keystroke narrows the proposals. Accepting a proposal replaces
+    the text with the index of the option.
+    """
+
+    def __init__(self, index: ItemsIndex, limit: int = FILTER_LIMIT) -> None:
+        self._index = index
+        self._limit = limit
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterator[Completion]:
+        text = document.text_before_cursor
+
+        # a number is a selection, not a filter
+        if not text.strip() or text.strip().isdecimal():
+            return
+
+        for position in self._index.search(text, limit=self._limit):
+            yield Completion(
+                text=str(position),
+                start_position=-len(text),
+                display=f"{position}>>>{self._index.item(position).show()}",
+            )
@@ -0,0 +1,57 @@
+from .menu_items import Item, ItemsCollection
+from .submenu import Submenu
+from squiffy import signals
+from squiffy.context.jobs import JobRunner
+from squiffy.layout.style import Style
+from squiffy.abstract.abstract_style import AbstractRenderer
+
+# the title of the submenu listing the background jobs, used as a switch target
+JOBS_SUBMENU: str = "Jobs"
+
+
+class JobsSubmenu(Submenu):
+    """
+    Lists the background jobs, running and finished, with their timings.
+    The list is rebuilt every time the submenu is shown, and selecting a
+    job refreshes it.
+
+    Args:
+        jobs (JobRunner): The runner of the background jobs.
+    """
+
+    def __init__(
+        self,
+        jobs: JobRunner,
+        title: str = JOBS_SUBMENU,
+        style: Style | None = None,
+        renderer: AbstractRenderer | None = None,
+    ) -> None:
+        super().__init__(
+            title=title,
+            items=ItemsCollection(uid=f"{title}_items".upper(), items=[]),
+            style=style,
+            header_msg="The background jobs, running and finished.",
+            footer_msg="Select a job to refresh the list.",
+            renderer=renderer,
+        )
+
+        self._jobs = jobs
+
+    def show(self) -> None:
+        self._update_items()
+        super().show()
+
+    async def show_async(self) -> None:
+        self._update_items()
+        await super().show_async()
+
+    def _update_items(self) -> None:
+        while len(self._items):
+            self._items.remove_item()
+
+        for job in self._jobs.jobs:
+            self._items.add_item(
+                Item(option=repr(job), signal=signals.SwitchSubmenu(self._title))
+            )
+
+        self._create_return_or_quit_options()
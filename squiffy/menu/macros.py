@@ -0,0 +1,52 @@
+from typing import NamedTuple
+
+# the keys a macro can be bound to, since the other keys select or filter options
+MACRO_HOTKEYS: tuple[str, ...] = tuple(f"f{number}" for number in range(5, 13))
+
+# the keys recording and replaying a macro in session
+RECORD_KEY: str = "f3"
+REPLAY_KEY: str = "f4"
+
+# the name of the macro recorded in session, replayed with REPLAY_KEY
+RECORDED_MACRO: str = "recorded"
+
+
+class MacroStep(NamedTuple):
+    """
+    A selection of the option at the index, in the submenu with the uid.
+    """
+
+    submenu: str
+    option: int
+
+
+class Macro(NamedTuple):
+    name: str
+    steps: tuple[MacroStep, ...]
+    hotkey: str | None = None
+
+
+class MacroRecorder:
+    """
+    Collects the selections made while a macro is recorded.
+    """
+
+    def __init__(self) -> None:
+        self._steps: list[MacroStep] | None = None
+
+    def start(self) -> None:
+        self._steps = list([])
+
+    def record(self, submenu: str, option: int) -> None:
+        if self._steps is not None:
+            self._steps.append(MacroStep(submenu=submenu, option=option))
+
+    def stop(self) -> tuple[MacroStep, ...]:
+        steps = tuple(self._steps or ())
+        self._steps = None
+
+        return steps
+
+    @property
+    def recording(self) -> bool:
+        return self._steps is not None
@@ -1,17 +1,57 @@
 from typing import Union
 from traceback import format_exc
 from .submenu import Submenu
+from .command_palette import CommandPalette
+from .macros import (
+    Macro,
+    MacroRecorder,
+    MacroStep,
+    MACRO_HOTKEYS,
+    RECORDED_MACRO,
+)
+from .navigation import (
+    NavigationStack,
+    MenuAddress,
+    NAVIGATION_MAX_DEPTH,
+    normalize_address,
+)
 from squiffy.abstract.abstract_menu import AbstractMenu, AbstractMenuObserversLayer
 from squiffy.abstract import abstract_context
+from squiffy.abstract.abstract_input import AbstractInputSource
 from squiffy import signals
+from squiffy.errors import InvalidMacroError
+from squiffy.dispatch import TypeDispatcher
 
 
 class Menu(AbstractMenu):
+    # The handlers are called with the menu and the signal. The Abort
+    # signals are not handled.
+    _SIGNAL_HANDLERS = TypeDispatcher(
+        {
+            signals.SwitchSubmenu: lambda menu, signal: menu._change_submenu(
+                signal.target_id
+            ),
+            signals.Error: lambda menu, signal: menu.handle_errors(signal),
+            signals.Quit: lambda menu, signal: menu._quit(),
+            signals.ReturnToPrevious: lambda menu, signal: menu._return_to_previous(),
+            signals.ReturnToMain: lambda menu, signal: menu._return_to_main(),
+            signals.OK: lambda menu, signal: menu._handle_ok_do_signal(signal),
+            signals.Do: lambda menu, signal: menu._handle_ok_do_signal(signal),
+            signals.OpenPalette: lambda menu, signal: menu._open_palette(),
+            signals.Jump: lambda menu, signal: menu.jump(signal.address),
+            signals.RecordMacro: lambda menu, signal: menu._toggle_recording(),
+            signals.PlayMacro: lambda menu, signal: menu.play_macro(signal.name),
+        }
+    )
+
     def __init__(
         self,
         submenu: list[Submenu],
         main_submenu_idx: int,
         error_submenu: Submenu | None = None,
+        palette: CommandPalette | None = None,
+        max_depth: int = NAVIGATION_MAX_DEPTH,
+        paths: dict[str, MenuAddress] | None = None,
     ) -> None:
         self._running: bool = True
 
@@ -37,8 +77,23 @@ class Menu(AbstractMenu):
         # submenues interaction
         self._root_submenu: Submenu = self._submenu[main_submenu_idx]
 
-        # keeps the order of the submenus
-        self._submenu_order: list[Submenu, None] = [self._current_submenu]
+        # keeps the path from the root to the current submenu
+        self._navigation: NavigationStack = NavigationStack(
+            root=self._root_submenu, max_depth=max_depth
+        )
+
+        # searches the options of all the submenus
+        self._palette: CommandPalette | None = palette
+
+        # maps the addresses of the submenus and options to their targets
+        self._paths: dict[str, MenuAddress] = paths if paths is not None else {}
+
+        # the macros replay a sequence of selections without showing the
+        # submenus on the way
+        self._macros: dict[str, Macro] = dict({})
+        self._macro_hotkeys: dict[str, str] = dict({})
+        self._recorder: MacroRecorder = MacroRecorder()
+        self._replaying: bool = False
 
     def show(self) -> None:
         """
@@ -62,6 +117,22 @@ class Menu(AbstractMenu):
                 )
             )
 
+    async def show_async(self) -> None:
+        """
+        Shows the current submenu with its prompt awaited on the running
+        event loop, used by the asyncio mode of the application.
+        """
+        try:
+            await self._current_submenu.show_async()
+        except Exception:
+            self.handle_errors(
+                signals.Error(
+                    origin=self._current_submenu.uid,
+                    log_message="An error occurred while trying to show the submenu",
+                    traceback=format_exc(),
+                )
+            )
+
     def handle_errors(self, error: signals.Error) -> None:
         self._error_submenu.show(error)
 
@@ -76,6 +147,10 @@ class Menu(AbstractMenu):
             signals.Quit,
             signals.Abort,
             signals.Error,
+            signals.OpenPalette,
+            signals.Jump,
+            signals.RecordMacro,
+            signals.PlayMacro,
         ],
     ) -> None:
         """
@@ -83,27 +158,7 @@ class Menu(AbstractMenu):
         propagates it to the context.
 
         """
-        #
-        if isinstance(signal, signals.SwitchSubmenu):
-            self._change_submenu(signal.target_id)
-
-        elif isinstance(signal, signals.Error):
-            self.handle_errors(signal)
-
-        elif isinstance(signal, signals.Quit):
-            self._quit()
-
-        elif isinstance(signal, signals.ReturnToPrevious):
-            self._return_to_previous()
-
-        elif isinstance(signal, signals.ReturnToMain):
-            self._return_to_main()
-
-        elif isinstance(signal, signals.OK) or isinstance(signal, signals.Do):
-            self._handle_ok_do_signal(signal)
-
-        elif isinstance(signal, signals.Abort):
-            pass
+        self._SIGNAL_HANDLERS.dispatch(signal, self)
 
     def _handle_ok_do_signal(self, signal: signals.OK) -> None:
         if self._context is not None:
@@ -122,19 +177,186 @@ class Menu(AbstractMenu):
                 )
             )
 
-    def _return_to_previous(self) -> None:
-        # returns to the previous submenu
-        if len(self._submenu_order) == 1:
-            self._current_submenu = self._root_submenu
+    def _open_palette(self) -> None:
+        if self._palette is None:
+            return
+
+        entry = self._palette.show()
+
+        # The signal of the chosen option is handled from the current
+        # submenu, so the submenus on the way to the option are not shown.
+        if entry is not None:
+            self.handle_signals(entry.signal)
+
+    def jump(self, address: str) -> bool:
+        """
+        Goes directly to the submenu or option at the address, ex.
+        "Main_Menu/Second_Menu/Accept_an_input". The submenus on the path
+        are placed on the navigation stack, without being shown. An option
+        is selected as if it was chosen in its submenu.
+        """
+        target = self._paths.get(normalize_address(address))
+
+        if target is None:
+            self.handle_errors(
+                signals.Error(
+                    origin=self._current_submenu.uid,
+                    log_message=f"InvalidAddressError: {address}",
+                    traceback=None,
+                )
+            )
+            return False
+
+        self._navigation.reset()
+        for uid in target.path:
+            self._navigation.push(self._submenu[self._submenu_tree[uid]])
+
+        self._current_submenu = self._navigation.top
+
+        if target.option is not None:
+            self._current_submenu.select(target.option)
+
+        return True
+
+    def add_macro(
+        self, name: str, steps: list[str | MacroStep], hotkey: str | None = None
+    ) -> Macro:
+        """
+        Adds a macro replaying the steps. A step is a MacroStep or a
+        selection in a submenu, ex. "Second_Menu/Accept_an_input" or
+        "Second_Menu/0".
+        """
+        macro = Macro(
+            name=name,
+            steps=tuple(self._compile_macro_step(step) for step in steps),
+            hotkey=hotkey,
+        )
+        self._register_macro(macro)
+
+        return macro
+
+    def play_macro(self, name: str) -> None:
+        """
+        Replays the selections of the macro. Each selection is handled as
+        if it was made at the prompt, but no submenu is shown until the
+        macro ends. The macro starts with a jump to the submenu of its
+        first step, since its hotkey is bound in every submenu.
+        """
+        macro = self._macros.get(name)
+
+        if macro is None:
+            self.handle_errors(
+                signals.Error(
+                    origin=self._current_submenu.uid,
+                    log_message=f"MacroNotFoundError: {name}",
+                    traceback=None,
+                )
+            )
+            return
+
+        first = macro.steps[0].submenu if macro.steps else None
+        if first is not None and self._current_submenu.uid != first:
+            if not self.jump(first):
+                return
+
+        self._replaying = True
+        try:
+            for step in macro.steps:
+                if not self._running:
+                    break
+
+                # a step can not be replayed after the path changed
+                if self._current_submenu.uid != step.submenu:
+                    self.handle_errors(
+                        signals.Error(
+                            origin=self._current_submenu.uid,
+                            log_message=f"MacroStepError: {name} expected "
+                            f"{step.submenu}, found {self._current_submenu.uid}",
+                            traceback=None,
+                        )
+                    )
+                    break
+
+                self._current_submenu.select(step.option)
+        finally:
+            self._replaying = False
+
+    def start_recording(self) -> None:
+        self._recorder.start()
+
+    def stop_recording(
+        self, name: str = RECORDED_MACRO, hotkey: str | None = None
+    ) -> Macro:
+        macro = Macro(name=name, steps=self._recorder.stop(), hotkey=hotkey)
+        self._register_macro(macro)
+
+        return macro
+
+    def record_selection(self, submenu: str, option: int) -> None:
+        # the replayed selections are not recorded again
+        if not self._replaying:
+            self._recorder.record(submenu, option)
+
+    def _toggle_recording(self) -> None:
+        if self._recorder.recording:
+            self.stop_recording()
         else:
-            # remove the current submenu form the list
-            # and initialize the last submenu in the list
-            self._submenu_order.pop()
-            self._current_submenu = self._submenu_order[-1]
+            self.start_recording()
+
+    def _register_macro(self, macro: Macro) -> None:
+        if macro.hotkey is not None:
+            if macro.hotkey not in MACRO_HOTKEYS:
+                raise InvalidMacroError(
+                    f"The hotkey {macro.hotkey!r} of {macro.name} should be one "
+                    f"of {', '.join(MACRO_HOTKEYS)}"
+                )
+
+            # prompt_toolkit runs only the last binding of a key
+            owner = self._macro_hotkeys.get(macro.hotkey)
+            if owner is not None and owner != macro.name:
+                raise InvalidMacroError(
+                    f"The hotkey {macro.hotkey!r} of {macro.name} is already "
+                    f"used by {owner}"
+                )
+
+            self._macro_hotkeys[macro.hotkey] = macro.name
+            for submenu in self._submenu:
+                submenu.add_key_signal(macro.hotkey, signals.PlayMacro(macro.name))
+
+        self._macros[macro.name] = macro
+
+    def _compile_macro_step(self, step: str | MacroStep) -> MacroStep:
+        if isinstance(step, MacroStep):
+            return step
+
+        title, _, option = step.rpartition("/")
+        titles = {submenu.uid.casefold(): submenu for submenu in self._submenu}
+        submenu = titles.get(title.strip().casefold())
+
+        index = submenu.find(option.strip()) if submenu is not None else None
+        if index is None:
+            raise InvalidMacroError(f"The step {step!r} does not select an option")
+
+        return MacroStep(submenu=submenu.uid, option=index)
+
+    def _return_to_previous(self) -> None:
+        # returns to the previous submenu, or stays on the root one
+        self._current_submenu = self._navigation.pop()
 
     def _return_to_main(self) -> None:
         # returns to the main submenu
-        self._current_submenu = self._root_submenu
+        self._current_submenu = self._navigation.reset()
+
+    def return_to(self, uid: str) -> bool:
+        """
+        Returns to a submenu on the navigation path. Returns False when the
+        submenu is not an ancestor of the current one.
+        """
+        if not self._navigation.return_to(uid):
+            return False
+
+        self._current_submenu = self._navigation.top
+        return True
 
     def _quit(self) -> None:
         self._running = False
@@ -169,7 +391,7 @@ class Menu(AbstractMenu):
                 )
                 return
             else:
-                self._submenu_order.append(self._current_submenu)
+                self._navigation.push(self._current_submenu)
 
     def _set_submenu_master_menu(self) -> None:
         for submenu in self._submenu:
@@ -186,3 +408,38 @@ class Menu(AbstractMenu):
     @property
     def is_running(self) -> bool:
         return self._running
+
+    @property
+    def breadcrumbs(self) -> str:
+        return self._navigation.breadcrumbs
+
+    @property
+    def navigation(self) -> NavigationStack:
+        return self._navigation
+
+    @property
+    def macros(self) -> dict[str, Macro]:
+        return self._macros
+
+    @property
+    def recording(self) -> bool:
+        return self._recorder.recording
+
+    def set_input_source(self, input_source: AbstractInputSource | None) -> None:
+        """
+        Reads the selections of all the submenus from the input source,
+        instead of the prompt.
+        """
+        for submenu in self._submenu:
+            submenu.input_source = input_source
+
+        self._error_submenu.input_source = input_source
+
+    def set_rendering(self, rendering: bool) -> None:
+        """
+        Enables or disables the rendering of the submenus.
+        """
+        for submenu in self._submenu:
+            submenu.rendering = rendering
+
+        self._error_submenu.rendering = rendering
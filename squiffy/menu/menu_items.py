@@ -5,6 +5,7 @@ from typing import Optional, Union
 from squiffy.abstract.abstract_menu import AbstractItem, AbstractItemsCollection
 from squiffy import signals
 from squiffy import utils
+from .items_filter import ItemsIndex
 
 
 class Item(AbstractItem):
@@ -24,11 +25,13 @@ class Item(AbstractItem):
         signal: signals.Signal,
         help: Optional[str] = None,
         *args,
+        hotkey: Optional[str] = None,
         **kwargs,
     ) -> None:
         self._option = option.upper()
         self._signal = signal
         self._help = help
+        self._hotkey = hotkey
 
         self.args = args
         self.kwargs = kwargs
@@ -49,7 +52,18 @@ class Item(AbstractItem):
     def emit(self) -> signals.Signal:
         return self._signal
 
+    @property
+    def help_text(self) -> Optional[str]:
+        return self._help
+
+    @property
+    def hotkey(self) -> Optional[str]:
+        return self._hotkey
+
     def __repr__(self) -> str:
+        if self._hotkey is not None:
+            return f"{self._option} [{self._hotkey}]"
+
         return self._option
 
 
@@ -65,10 +79,23 @@ class ItemsCollection(AbstractItemsCollection):
         self.__items_tree: dict[int, Item] = dict({})
         self._update_tree()
 
+        # the search index used for filtering the options
+        self.__index = ItemsIndex(items)
+
         self.__uid: str = uid
 
-    def show(self) -> None:
-        rp.pprint(self.__items_tree, expand_all=True, indent_guides=True)
+    def show(self, start: int = 0, stop: int | None = None) -> None:
+        rp.pprint(self._window(start, stop), expand_all=True, indent_guides=True)
+
+    def render(self, start: int = 0, stop: int | None = None) -> str:
+        return rp.pretty_repr(self._window(start, stop), expand_all=True)
+
+    def _window(self, start: int, stop: int | None) -> dict[int, Item]:
+        if start == 0 and stop is None:
+            return self.__items_tree
+
+        stop = len(self.__items) if stop is None else min(stop, len(self.__items))
+        return {index: self.__items_tree[index] for index in range(start, stop)}
 
     def emit(
         self, idx: int
@@ -102,15 +129,32 @@ class ItemsCollection(AbstractItemsCollection):
 
     def add_item(self, item: Item) -> None:
         self.__items.append(item)
-        self._update_tree()
+        # appending does not move the other items, so only the new one
+        # is added to the tree
+        self.__items_tree.update({len(self.__items) - 1: item})
+        self.__index.add(item)
 
     def remove_item(self, index: int = -1) -> None:
-        self.__items.pop(index)
+        item = self.__items.pop(index)
+        self.__index.remove(item)
+        self.__items_tree.clear()
         self._update_tree()
 
     def get_item(self, index: int) -> Item:
         return self.__items[index]
 
+    def find(self, option: str) -> int | None:
+        """
+        The index of the item with the given option name, or None.
+        """
+        option = option.casefold()
+
+        for index, item in enumerate(self.__items):
+            if item.show().casefold() == option:
+                return index
+
+        return None
+
     def _update_tree(self) -> None:
         for index, item in enumerate(self.__items):
             self.__items_tree.update({index: item})
@@ -121,3 +165,7 @@ class ItemsCollection(AbstractItemsCollection):
     @property
     def items(self) -> dict:
         return self.__items_tree
+
+    @property
+    def index(self) -> ItemsIndex:
+        return self.__index
@@ -2,21 +2,58 @@ from typing import Union
 from .menu import Menu
 from squiffy.abstract.abstract_menu import AbstractObserver, AbstractMenuObserversLayer
 from squiffy import signals
+from squiffy.dispatch import TypeDispatcher
 
 
 class MenuObserversLayer(AbstractMenuObserversLayer):
+    """
+    Routes the events of the menu to the observers.
+
+    The observers are indexed by their route, so a Do signal reaches only
+    the observers routed to its name, whatever the number of observers.
+    The errors, aborts and quits are broadcast to every observer, while the
+    observers without a route are sent every event.
+    """
+
+    # the events sent to the observers, the other ones are dropped
+    _EVENT_HANDLERS = TypeDispatcher(
+        {
+            signals.Do: lambda layer, event: layer._route(event),
+            signals.OK: lambda layer, event: layer._send_unrouted(event),
+            signals.Quit: lambda layer, event: layer._broadcast(event),
+            signals.Abort: lambda layer, event: layer._broadcast(event),
+            signals.Error: lambda layer, event: layer._broadcast(event),
+        }
+    )
+
     def __init__(self, menu: Menu) -> None:
         self._menu: Menu = menu
         self._menu.controller = self
 
         self._observers: list[AbstractObserver] = list([])
+        self._routes: dict[str, list[AbstractObserver]] = dict({})
+        self._unrouted: list[AbstractObserver] = list([])
 
     def attach(self, observer: AbstractObserver) -> None:
         self._observers.append(observer)
 
+        if observer.route is None:
+            self._unrouted.append(observer)
+        else:
+            self._routes.setdefault(observer.route, list([])).append(observer)
+
     def detach(self, observer: AbstractObserver) -> None:
         self._observers.remove(observer)
 
+        if observer.route is None:
+            self._unrouted.remove(observer)
+        else:
+            routed = self._routes[observer.route]
+            routed.remove(observer)
+
+            if not routed:
+                del self._routes[observer.route]
+
     def send(
         self,
         event: Union[
@@ -29,17 +66,21 @@ class MenuObserversLayer(AbstractMenuObserversLayer):
 
         """
 
-        if isinstance(event, signals.OK) or isinstance(event, signals.Do):
-            for observer in self._observers:
-                observer.inform(event)
-
-        elif (
-            isinstance(event, signals.Quit)
-            or isinstance(event, signals.Abort)
-            or isinstance(event, signals.Error)
-        ):
-            for observer in self._observers:
-                observer.inform(event)
+        self._EVENT_HANDLERS.dispatch(event, self)
+
+    def _route(self, event: signals.Do) -> None:
+        for observer in self._routes.get(event.signal, ()):
+            observer.inform(event)
+
+        self._send_unrouted(event)
+
+    def _send_unrouted(self, event: signals.Signal) -> None:
+        for observer in self._unrouted:
+            observer.inform(event)
+
+    def _broadcast(self, event: signals.Signal) -> None:
+        for observer in self._observers:
+            observer.inform(event)
 
     def handle_errors(self, error: signals.Error) -> None:
         self._menu.handle_errors(error)
@@ -1,9 +1,27 @@
 from squiffy.abstract.abstract_menu import AbstractObserver
 from squiffy import signals
+from squiffy.dispatch import TypeDispatcher
 from typing import Callable, Any, Union
 from squiffy.abstract import abstract_context
 
 
+def _forward_to_context(observer: AbstractObserver, event: signals.Signal) -> None:
+    observer.context.handle_signal(event)
+
+
+# The Do events are handled by the observer they are meant for, while the
+# errors, aborts and quits are forwarded to the context. The handlers are
+# called with the observer and the event.
+_EVENT_HANDLERS = TypeDispatcher(
+    {
+        signals.Do: lambda observer, event: observer._handle_do(event),
+        signals.Error: _forward_to_context,
+        signals.Abort: _forward_to_context,
+        signals.Quit: _forward_to_context,
+    }
+)
+
+
 class EventObserver(AbstractObserver):
     def __init__(
         self,
@@ -45,16 +63,16 @@ class EventObserver(AbstractObserver):
             # the signals will be forwarded towards the context
             self._context.handle_signal(event)
         else:
-            if isinstance(event, signals.Do) and (event.signal == self._event_type):
-                self._context.handle_signal(self._callback(*self._args, **self._kwargs))
-                return
-            elif (
-                isinstance(event, signals.Error)
-                or isinstance(event, signals.Abort)
-                or isinstance(event, signals.Quit)
-            ):
-                self._context.handle_signal(event)
-                return
+            _EVENT_HANDLERS.dispatch(event, self)
+
+    def _handle_do(self, event: signals.Do) -> None:
+        if event.signal == self._event_type:
+            self._context.handle_signal(self._callback(*self._args, **self._kwargs))
+
+    @property
+    def route(self) -> str | None:
+        # without a callback, every event is forwarded to the context
+        return self._event_type if self._callback is not None else None
 
     @property
     def context(self) -> Any:
@@ -109,16 +127,15 @@ class ExecutorObserver(AbstractObserver):
         In case of an error, abort of callback operation or quit
         the context will handle it.
         """
-        if isinstance(event, signals.Do) and (event.signal == self._signal_type):
+        _EVENT_HANDLERS.dispatch(event, self)
+
+    def _handle_do(self, event: signals.Do) -> None:
+        if event.signal == self._signal_type:
             self._context.handle_signal(self._callback(*self._args, **self._kwargs))
-            return
-        elif (
-            isinstance(event, signals.Error)
-            or isinstance(event, signals.Abort)
-            or isinstance(event, signals.Quit)
-        ):
-            self._context.handle_signal(event)
-            return
+
+    @property
+    def route(self) -> str | None:
+        return self._signal_type
 
     @property
     def context(self) -> Any:
@@ -140,16 +157,16 @@ class RoutingObserver(AbstractObserver):
             signals.Abort, signals.Error, signals.Quit, signals.Do, signals.OK
         ],
     ) -> Union[signals.Abort, signals.OK, signals.Do, signals.Error, signals.Quit]:
-        if isinstance(signal, signals.Do) and (signal.signal == self._signal):
-            self._context.handle_signal(signal)
-            return
-        elif (
-            isinstance(signal, signals.Error)
-            or isinstance(signal, signals.Abort)
-            or isinstance(signal, signals.Quit)
-        ):
+        _EVENT_HANDLERS.dispatch(signal, self)
+
+    def _handle_do(self, signal: signals.Do) -> None:
+        if signal.signal == self._signal:
             self._context.handle_signal(signal)
 
+    @property
+    def route(self) -> str | None:
+        return self._signal
+
     @property
     def context(self) -> Any:
         return self._context
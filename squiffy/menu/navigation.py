@@ -0,0 +1,148 @@
+from typing import NamedTuple
+from squiffy.abstract.abstract_menu import AbstractSubmenu
+
+# the default maximum number of submenus kept on the navigation stack
+NAVIGATION_MAX_DEPTH: int = 32
+
+BREADCRUMB_SEPARATOR: str = " > "
+
+# separates the submenus and the option of an address, ex. "Main_Menu/Second_Menu"
+ADDRESS_SEPARATOR: str = "/"
+
+
+class NavigationStack:
+    """
+    The path from the root submenu to the current one.
+
+    A submenu which is already on the stack is not pushed again, the stack
+    is truncated to it instead, so bouncing between submenus does not grow
+    the stack. When the maximum depth is reached, the oldest submenus after
+    the root are dropped. The positions of the submenus and the breadcrumbs
+    of each level are kept along the stack, so returning to an ancestor and
+    reading the breadcrumbs do not walk the stack.
+
+    Args:
+        root (AbstractSubmenu): The submenu at the bottom of the stack,
+        which is never removed.
+        max_depth (int): The maximum number of submenus on the stack.
+    """
+
+    def __init__(
+        self, root: AbstractSubmenu, max_depth: int = NAVIGATION_MAX_DEPTH
+    ) -> None:
+        if max_depth < 1:
+            raise ValueError("The navigation stack should hold at least the root")
+
+        self._max_depth = max_depth
+
+        self._stack: list[AbstractSubmenu] = [root]
+        self._positions: dict[str, int] = {root.uid: 0}
+        self._breadcrumbs: list[str] = [root.uid]
+
+    def push(self, submenu: AbstractSubmenu) -> AbstractSubmenu:
+        """
+        Makes the submenu the current one and returns it.
+        """
+        if self.return_to(submenu.uid):
+            return submenu
+
+        self._stack.append(submenu)
+        self._positions[submenu.uid] = len(self._stack) - 1
+        self._breadcrumbs.append(
+            f"{self._breadcrumbs[-1]}{BREADCRUMB_SEPARATOR}{submenu.uid}"
+        )
+
+        if len(self._stack) > self._max_depth:
+            self._drop_oldest()
+
+        return submenu
+
+    def pop(self) -> AbstractSubmenu:
+        """
+        Returns to the previous submenu. The root is never removed.
+        """
+        if len(self._stack) > 1:
+            self._truncate(len(self._stack) - 2)
+
+        return self.top
+
+    def return_to(self, uid: str) -> bool:
+        """
+        Returns to the submenu with the given uid, if it is on the stack.
+        """
+        position = self._positions.get(uid)
+
+        if position is None:
+            return False
+
+        self._truncate(position)
+        return True
+
+    def reset(self) -> AbstractSubmenu:
+        """
+        Returns to the root submenu.
+        """
+        self._truncate(0)
+        return self.top
+
+    def _truncate(self, position: int) -> None:
+        for submenu in self._stack[position + 1 :]:
+            del self._positions[submenu.uid]
+
+        del self._stack[position + 1 :]
+        del self._breadcrumbs[position + 1 :]
+
+    def _drop_oldest(self) -> None:
+        # the root stays, so the oldest submenu is the second one
+        del self._positions[self._stack.pop(1).uid]
+
+        root = self._stack[0].uid
+        self._breadcrumbs = [root]
+        for position, submenu in enumerate(self._stack[1:], start=1):
+            self._positions[submenu.uid] = position
+            self._breadcrumbs.append(
+                f"{self._breadcrumbs[-1]}{BREADCRUMB_SEPARATOR}{submenu.uid}"
+            )
+
+    @property
+    def top(self) -> AbstractSubmenu:
+        return self._stack[-1]
+
+    @property
+    def root(self) -> AbstractSubmenu:
+        return self._stack[0]
+
+    @property
+    def breadcrumbs(self) -> str:
+        return self._breadcrumbs[-1]
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._positions
+
+    def __len__(self) -> int:
+        return len(self._stack)
+
+
+class MenuAddress(NamedTuple):
+    """
+    The target of an address: the submenus from the root to the target
+    submenu and, optionally, the index of an option in it.
+    """
+
+    path: tuple[str, ...]
+    option: int | None = None
+
+
+def normalize_address(address: str) -> str:
+    """
+    The form of an address used as a key of the path index.
+    """
+    return ADDRESS_SEPARATOR.join(
+        part.strip().casefold()
+        for part in address.split(ADDRESS_SEPARATOR)
+        if part.strip()
+    )
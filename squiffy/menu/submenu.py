@@ -1,15 +1,38 @@
-import os
-from prompt_toolkit import prompt
+from typing import Callable
+from prompt_toolkit import PromptSession
+from prompt_toolkit.application import get_app
+from prompt_toolkit.validation import Validator
+from prompt_toolkit.filters import Condition
+from prompt_toolkit.key_binding import KeyBindings
 from .menu_items import Item, ItemsCollection
+from .items_filter import ItemsCompleter
+from .macros import RECORD_KEY, REPLAY_KEY, RECORDED_MACRO
 from squiffy.abstract.abstract_menu import AbstractSubmenu, AbstractMenu
 from squiffy import signals
 from squiffy import utils
 from squiffy.layout.style import Style
+from squiffy.renderer import Renderer
+from squiffy.abstract.abstract_style import AbstractRenderer
+from squiffy.abstract.abstract_input import AbstractInputSource
+from squiffy.errors import InputScriptError
+from squiffy.dispatch import TypeDispatcher
 
 
 class Submenu(AbstractSubmenu):
     # encapsulate the logic of a submenu
 
+    # The errors go to the error submenu and the rest of the signals
+    # to the menu. The handlers are called with the submenu and the signal.
+    _SIGNAL_HANDLERS = TypeDispatcher(
+        {
+            type(None): lambda submenu, signal: submenu._handle_none_signal(),
+            signals.Error: lambda submenu, signal: submenu._master_menu.handle_errors(
+                signal
+            ),
+        },
+        default=lambda submenu, signal: submenu._master_menu.handle_signals(signal),
+    )
+
     def __init__(
         self,
         title: str,
@@ -21,12 +44,16 @@ class Submenu(AbstractSubmenu):
         add_return: bool = True,
         add_return_to_main: bool = True,
         add_quit: bool = True,
+        renderer: AbstractRenderer | None = None,
+        hotkeys: dict[str, Item] | None = None,
     ) -> None:
         self._title = title
         self._items: ItemsCollection = items
+        self._hotkeys: dict[str, Item] = hotkeys if hotkeys is not None else {}
         self._logo = logo
 
         self._style = style
+        self._renderer = renderer if renderer is not None else Renderer()
         self._header_msg = header_msg
         self._footer_msg = footer_msg
 
@@ -35,56 +62,113 @@ class Submenu(AbstractSubmenu):
         self._add_quit = add_quit
         self._create_return_or_quit_options()
 
+        self._key_bindings: KeyBindings = self._create_key_bindings()
+
+        # The prompt session is kept between the frames and created on the
+        # first prompt, while the validator is rebuilt only when the number
+        # of items changes.
+        self._prompt_session: PromptSession | None = None
+        self._validator: Validator | None = None
+        self._validator_items: int | None = None
+
+        # the selections are read from the prompt unless an input source is set
+        self._input_source: AbstractInputSource | None = None
+        self._rendering: bool = True
+
         self._master_menu: AbstractMenu | None = None
 
     def show(self) -> None:
         try:
-            self._show_ui()
+            if self._rendering:
+                self._show_ui()
             option = self._show_prompt()
         except KeyboardInterrupt:
             self.handle_signals(signals.Quit())
         except EOFError:
             self.handle_signals(signals.Quit())
+        except InputScriptError as error:
+            self._handle_script_error(error)
+        else:
+            self._handle_selection(option)
+
+    async def show_async(self) -> None:
+        """
+        Shows the submenu with a prompt awaited on the running event loop.
+        """
+        try:
+            if self._rendering:
+                self._show_ui()
+            option = await self._show_prompt_async()
+        except KeyboardInterrupt:
+            self.handle_signals(signals.Quit())
+        except EOFError:
+            self.handle_signals(signals.Quit())
+        except InputScriptError as error:
+            self._handle_script_error(error)
         else:
+            self._handle_selection(option)
+
+    def _handle_selection(self, option: int | Item | signals.Signal | None) -> None:
+        # the prompt is left without a selection when only the
+        # view changed (ex. scrolling)
+        if isinstance(option, signals.Signal):
+            self.handle_signals(option)
+        elif isinstance(option, Item):
+            self._record_selection(self._items.find(option.show()))
+            self._emit_signal_from_item(option)
+        elif option is not None:
+            self._record_selection(option)
             self._emit_signal_from_selection(option)
 
     def handle_signals(self, signal: signals.Signal) -> None:
-        if signal is None:
-            self._master_menu.handle_errors(
-                error=signals.Error(
-                    origin=self._title,
-                    log_message="NoneSignalRaisedError",
-                    traceback=None,
-                )
+        self._SIGNAL_HANDLERS.dispatch(signal, self)
+
+    def _handle_script_error(self, error: InputScriptError) -> None:
+        # the error submenu reports the line and quits in scripted mode
+        self._master_menu.handle_errors(
+            error=signals.Error(
+                origin=self._title,
+                log_message=f"InputScriptError: {error}",
+                traceback=None,
             )
-        elif isinstance(signal, signals.Error):
-            self._master_menu.handle_errors(signal)
-        else:
-            self._master_menu.handle_signals(signal)
+        )
+
+    def _handle_none_signal(self) -> None:
+        self._master_menu.handle_errors(
+            error=signals.Error(
+                origin=self._title,
+                log_message="NoneSignalRaisedError",
+                traceback=None,
+            )
+        )
 
     def _show_ui(self) -> None:
-        # Clear the console
         # TODO: Add support for a stilyzed console
-
-        os.system("cls")
-
         if self._style is not None:
-            style = self._style.create(
+            frame = self._style.create(
                 title=self._title,
-                subtitle="",
+                subtitle=self._breadcrumbs(),
                 header_msg=self._header_msg,
                 content=self._items.items,
                 footer_msg=self._footer_msg,
             )
 
-            print(style)
-
         else:
-            print(self._title)
+            lines = [self._title]
             if self._logo is not None:
-                print(self._logo)
+                lines.append(self._logo)
+            lines.append(self._items.render())
+
+            frame = "\n".join(lines)
 
-            self._items.show()
+        self._renderer.render(frame)
+
+    def _breadcrumbs(self) -> str:
+        # the path is shown only below the root submenu
+        if self._master_menu is None or self._master_menu.breadcrumbs == self._title:
+            return ""
+
+        return self._master_menu.breadcrumbs
 
     def _create_return_or_quit_options(self) -> None:
         if self._add_return:
@@ -110,20 +194,156 @@ class Submenu(AbstractSubmenu):
                 Item(option="QUIT", help="Quit the application", signal=signals.Quit())
             )
 
-    def _show_prompt(self) -> int:
-        option = int(
-            prompt(
-                ">> ",
-                validator=utils._is_number_within_limits(
-                    lower=0, upper=len(self._items)
-                ),
-            )
+    def _create_key_bindings(self) -> KeyBindings:
+        key_bindings = KeyBindings()
+
+        @key_bindings.add("pageup")
+        def _scroll_up(event) -> None:
+            self._scroll(-1)
+            event.app.exit(result=None)
+
+        @key_bindings.add("pagedown")
+        def _scroll_down(event) -> None:
+            self._scroll(1)
+            event.app.exit(result=None)
+
+        @Condition
+        def _empty_input() -> bool:
+            return not get_app().current_buffer.text
+
+        @key_bindings.add("f2")
+        @key_bindings.add(":", filter=_empty_input)
+        def _open_palette(event) -> None:
+            event.app.exit(result=signals.OpenPalette())
+
+        @key_bindings.add(RECORD_KEY)
+        def _record_macro(event) -> None:
+            event.app.exit(result=signals.RecordMacro())
+
+        @key_bindings.add(REPLAY_KEY)
+        def _replay_macro(event) -> None:
+            event.app.exit(result=signals.PlayMacro(RECORDED_MACRO))
+
+        # The hotkeys select their item on the keystroke, without a line of
+        # input. They are active only at an empty prompt, so the options can
+        # still be filtered by text containing them.
+        for key, item in self._hotkeys.items():
+            key_bindings.add(key, filter=_empty_input)(self._hotkey_handler(item))
+
+        return key_bindings
+
+    def add_key_signal(self, key: str, signal: signals.Signal) -> None:
+        """
+        Binds the key to a signal, emitted when the key is pressed at the prompt.
+        """
+
+        @self._key_bindings.add(key)
+        def _emit(event) -> None:
+            event.app.exit(result=signal)
+
+    @staticmethod
+    def _hotkey_handler(item: Item) -> Callable:
+        def _select(event) -> None:
+            event.app.exit(result=item)
+
+        return _select
+
+    def _scroll(self, pages: int) -> None:
+        if self._style is not None:
+            self._style.scroll(pages)
+
+    def _show_prompt(self) -> int | Item | signals.Signal | None:
+        if self._input_source is not None:
+            return self._read_selection()
+
+        selection = self._session().prompt(">> ", validator=self._item_validator())
+
+        return self._parse_selection(selection)
+
+    async def _show_prompt_async(self) -> int | Item | signals.Signal | None:
+        if self._input_source is not None:
+            return self._read_selection()
+
+        selection = await self._session().prompt_async(
+            ">> ", validator=self._item_validator()
         )
 
-        return option
+        return self._parse_selection(selection)
+
+    @staticmethod
+    def _parse_selection(
+        selection: str | Item | signals.Signal | None,
+    ) -> int | Item | signals.Signal | None:
+        # the key bindings leave the prompt with an item, a signal
+        # or without a result
+        if not isinstance(selection, str):
+            return selection
+
+        return int(selection)
+
+    def _read_selection(self) -> int:
+        selection = self._input_source.read(self._title)
+
+        index = self.find(selection)
+        if index is not None:
+            return index
+
+        raise InputScriptError(f"{selection!r} is not an option of {self._title}")
+
+    def _session(self) -> PromptSession:
+        if self._prompt_session is None:
+            # Typing text instead of an index filters the options. The input
+            # is validated only when accepted, so the filter text is not
+            # reported as an invalid number on every keystroke.
+            self._prompt_session = PromptSession(
+                key_bindings=self._key_bindings,
+                completer=ItemsCompleter(self._items.index),
+                complete_while_typing=True,
+                validate_while_typing=False,
+            )
+
+        return self._prompt_session
+
+    def _item_validator(self) -> Validator:
+        items = len(self._items)
+
+        if items != self._validator_items:
+            # the selection is an index, so the last item is len - 1
+            self._validator = utils._is_number_within_limits(lower=0, upper=items - 1)
+            self._validator_items = items
+
+        return self._validator
+
+    def find(self, option: str) -> int | None:
+        """
+        The index of the option, given by its index or its name, or None.
+        """
+        if option.isdecimal():
+            return int(option) if int(option) < len(self._items) else None
+
+        return self._items.find(option)
+
+    def select(self, index: int) -> None:
+        """
+        Selects the item at the index, as if it was chosen at the prompt.
+        """
+        self._emit_signal_from_selection(index)
+
+    def _record_selection(self, selection: int | None) -> None:
+        # the selections are recorded while a macro is recorded
+        if self._master_menu is not None and selection is not None:
+            self._master_menu.record_selection(self._title, selection)
 
     def _emit_signal_from_selection(self, selection: int) -> None:
-        event = self._items.get_item(selection).emit()
+        self._emit_signal_from_item(self._items.get_item(selection))
+
+    def _emit_signal_from_item(self, item: Item) -> None:
+        event = item.emit()
+
+        # The callbacks triggered by a Do signal are free to write to the
+        # terminal, so the next frame can not be drawn over the current one.
+        if isinstance(event, signals.Do):
+            self._renderer.invalidate()
 
         self.handle_signals(event)
 
@@ -138,3 +358,23 @@ class Submenu(AbstractSubmenu):
     @property
     def uid(self) -> str:
         return self._title
+
+    @property
+    def hotkeys(self) -> dict[str, Item]:
+        return self._hotkeys
+
+    @property
+    def input_source(self) -> AbstractInputSource | None:
+        return self._input_source
+
+    @input_source.setter
+    def input_source(self, input_source: AbstractInputSource | None) -> None:
+        self._input_source = input_source
+
+    @property
+    def rendering(self) -> bool:
+        return self._rendering
+
+    @rendering.setter
+    def rendering(self, rendering: bool) -> None:
+        self._rendering = rendering
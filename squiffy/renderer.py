@@ -0,0 +1,137 @@
+import sys
+from typing import TextIO
+from squiffy.abstract import abstract_style
+from squiffy.screen import Screen
+from squiffy.layout.contants import PROMPT_LINES
+
+# ANSI control sequences used for redrawing the frame
+CSI: str = "\x1b["
+CURSOR_HOME: str = CSI + "H"
+CLEAR_SCREEN: str = CSI + "2J"
+CLEAR_LINE_END: str = CSI + "K"
+CLEAR_SCREEN_END: str = CSI + "J"
+
+
+class Renderer(abstract_style.AbstractRenderer):
+    """
+    A double-buffered terminal renderer.
+
+    The Renderer keeps the previously displayed frame and, on the next
+    render, moves the cursor only to the lines that changed and rewrites
+    them. The whole update is sent to the terminal in a single write.
+
+    A full redraw is done for the first frame, after an invalidation
+    (ex. a callback printed to the terminal) or when the frame does not
+    fit on the screen, since the terminal would scroll and the line
+    positions would not be valid anymore.
+
+    Args:
+        stream (TextIO | None): The stream the frames are written to.
+        Defaults to the current sys.stdout.
+        screen (Screen | None): The screen used to check if a frame fits
+        in the terminal.
+    """
+
+    def __init__(
+        self, stream: TextIO | None = None, screen: Screen | None = None
+    ) -> None:
+        self._stream = stream
+        self._screen = screen if screen is not None else Screen()
+        self._screen.attach(self)
+
+        self._previous: list[str] | None = None
+        self._bytes_written: int = 0
+
+    def render(self, frame: str) -> None:
+        lines = frame.split("\n")
+        fits = self._fits(lines)
+
+        if self._previous is None or not fits:
+            output = self._redraw(lines)
+        else:
+            output = self._update(lines)
+
+        # When the frame does not fit, the terminal scrolls, so the next frame
+        # can not be written over this one.
+        self._previous = lines if fits else None
+
+        self._write(output)
+
+    def invalidate(self) -> None:
+        """
+        Forces a full redraw on the next render. Should be called whenever
+        something else than the Renderer wrote to the terminal.
+        """
+        self._previous = None
+
+    def resize(self, hight: int, width: int) -> None:
+        # the terminal reflows the text on resize
+        self.invalidate()
+
+    def _redraw(self, lines: list[str]) -> str:
+        return CURSOR_HOME + CLEAR_SCREEN + "\n".join(lines) + "\n"
+
+    def _update(self, lines: list[str]) -> str:
+        previous = self._previous
+        output: list[str] = list([])
+
+        for index, line in enumerate(lines):
+            if index < len(previous) and previous[index] == line:
+                continue
+
+            output.append(f"{CSI}{index + 1};1H{line}{CLEAR_LINE_END}")
+
+        # Place the cursor bellow the frame and clear the rest of the screen,
+        # which holds the previous prompt and any leftovers of a longer frame.
+        output.append(f"{CSI}{len(lines) + 1};1H{CLEAR_SCREEN_END}")
+
+        return "".join(output)
+
+    def _fits(self, lines: list[str]) -> bool:
+        return len(lines) + PROMPT_LINES <= self._screen.hight
+
+    def _write(self, output: str) -> None:
+        stream = self._stream if self._stream is not None else sys.stdout
+        stream.write(output)
+        stream.flush()
+
+        self._bytes_written += len(output.encode(errors="replace"))
+
+    @property
+    def bytes_written(self) -> int:
+        return self._bytes_written
+
+
+class HeadlessRenderer(abstract_style.AbstractRenderer):
+    """
+    Renders the frames into memory instead of the terminal.
+
+    Keeps the last rendered frame and the number of rendered frames, so
+    automated runs and benchmarks exercise the rendering path without a TTY.
+    """
+
+    def __init__(self, screen: Screen | None = None) -> None:
+        self._screen = screen
+        if self._screen is not None:
+            self._screen.attach(self)
+
+        self._frame: str | None = None
+        self._frames_rendered: int = 0
+
+    def render(self, frame: str) -> None:
+        self._frame = frame
+        self._frames_rendered += 1
+
+    def invalidate(self) -> None:
+        pass
+
+    def resize(self, hight: int, width: int) -> None:
+        pass
+
+    @property
+    def frame(self) -> str | None:
+        return self._frame
+
+    @property
+    def frames_rendered(self) -> int:
+        return self._frames_rendered
@@ -1,35 +1,117 @@
-import os
+import asyncio
+import shutil
+import signal
+import weakref
+from typing import Protocol
 from squiffy.abstract import abstract_style
 from squiffy.abstract import abstract_menu
+from squiffy.layout.contants import STANDARD_HIGHT, STANDARD_WIDTH
+
+# seconds between two checks of the terminal size when no SIGWINCH is available
+SIZE_POLL_INTERVAL: float = 0.5
+
+
+class ResizeObserver(Protocol):
+    def resize(self, hight: int, width: int) -> None: ...
 
 
 class Screen(abstract_style.AbstractScreen):
+    """
+    Keeps the size of the terminal.
+
+    The size is cached and refreshed either once per frame or by the asyncio
+    watcher started with async_get_sceen_size. When the size changes, the
+    attached observers (ex. the styles and the renderer) are informed through
+    their resize method. The observers are weakly referenced, so a style
+    dropped with its submenu is detached.
+    """
+
     def __init__(self) -> None:
         self._screen_hight: int | None = None
         self._screen_width: int | None = None
 
+        self._observers: weakref.WeakSet[ResizeObserver] = weakref.WeakSet()
+        self._watched: bool = False
+
         # self._content:abstract_menu.AbstractMenu = None
 
     def display(self) -> None:
         pass
 
     def get_screen_size(self) -> None:
-        screen_size = os.get_terminal_size()
-        self._screen_hight = screen_size.lines
-        self._screen_width = screen_size.columns
+        # falls back to the standard size when the output is not a terminal
+        # (ex. a pipe or a cron job)
+        screen_size = shutil.get_terminal_size(
+            fallback=(STANDARD_WIDTH, STANDARD_HIGHT)
+        )
+        self._update_size(screen_size.lines, screen_size.columns)
 
-    def async_get_sceen_size(self):
-        pass
+    async def async_get_sceen_size(self) -> None:
+        """
+        Watches the terminal size until cancelled.
+
+        On POSIX the size is refreshed from a SIGWINCH handler registered on
+        the running event loop, otherwise the size is polled.
+        """
+        loop = asyncio.get_running_loop()
+        sigwinch = getattr(signal, "SIGWINCH", None)
+
+        if sigwinch is not None:
+            try:
+                loop.add_signal_handler(sigwinch, self.get_screen_size)
+            except (NotImplementedError, RuntimeError, ValueError):
+                # not the main thread or an event loop without signal support
+                sigwinch = None
+
+        self._watched = True
+        try:
+            if sigwinch is not None:
+                # the handler does the work, so just wait to be cancelled
+                await loop.create_future()
+
+            while True:
+                self.get_screen_size()
+                await asyncio.sleep(SIZE_POLL_INTERVAL)
+        finally:
+            self._watched = False
+            if sigwinch is not None:
+                loop.remove_signal_handler(sigwinch)
+
+    def refresh(self) -> None:
+        """
+        Reads the terminal size once. Intended to be called before
+        each frame is rendered. Does nothing while the size is watched.
+        """
+        if not self._watched:
+            self.get_screen_size()
+
+    def attach(self, observer: ResizeObserver) -> None:
+        self._observers.add(observer)
+
+    def detach(self, observer: ResizeObserver) -> None:
+        self._observers.discard(observer)
+
+    def _update_size(self, hight: int, width: int) -> None:
+        if hight == self._screen_hight and width == self._screen_width:
+            return
+
+        self._screen_hight = hight
+        self._screen_width = width
+
+        for observer in list(self._observers):
+            observer.resize(hight, width)
 
     @property
     def hight(self) -> int:
-        self.get_screen_size()
+        if self._screen_hight is None:
+            self.get_screen_size()
 
         return self._screen_hight
 
     @property
     def width(self) -> int:
-        self.get_screen_size()
+        if self._screen_width is None:
+            self.get_screen_size()
 
         return self._screen_width
 
@@ -40,3 +122,28 @@ class Screen(abstract_style.AbstractScreen):
     @menu.setter
     def menu(self, content: abstract_menu.AbstractMenu) -> None:
         self._content = content
+
+
+class HeadlessScreen(Screen):
+    """
+    A screen with a fixed size, which never touches the terminal.
+    Intended for automated runs, tests and benchmarks.
+    """
+
+    def __init__(
+        self, hight: int = STANDARD_HIGHT, width: int = STANDARD_WIDTH
+    ) -> None:
+        super().__init__()
+        self._update_size(hight, width)
+
+    def get_screen_size(self) -> None:
+        pass
+
+    async def async_get_sceen_size(self) -> None:
+        pass
+
+    def resize(self, hight: int, width: int) -> None:
+        """
+        Sets a new size, as a terminal resize would.
+        """
+        self._update_size(hight, width)
@@ -1,7 +1,45 @@
 from abc import ABC
+from typing import Any
 
 
-class Signal(ABC): ...
+class Signal(ABC):
+    """
+    The base of the signals exchanged by the menu, the observers and the
+    context. The signals are slotted and are not changed once created, so
+    the instances without a payload can be shared.
+    """
+
+    __slots__ = ()
+
+
+class _Interned(Signal):
+    """
+    A signal of which a single instance is shared when it is created without
+    a payload, ex. Quit(). A signal created with a payload is a new instance.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "_Interned":
+        if args or kwargs:
+            return super().__new__(cls)
+
+        # looked up on the class itself, so the subclasses get their own instance
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+
+        return instance
+
+    def __getnewargs_ex__(self) -> tuple[tuple, dict[str, Any]]:
+        # a copy or an unpickled signal without payload is the shared instance
+        payload = {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if getattr(self, name) is not None
+        }
+        return (), payload
 
 
 class OK(Signal):
@@ -19,6 +57,8 @@ class OK(Signal):
 
     """
 
+    __slots__ = ("origin", "payload")
+
     def __init__(
         self, origin: str | None = None, payload: dict[str, object] | None = None
     ) -> None:
@@ -39,18 +79,42 @@ class Do(Signal):
     The Menu should not implement any responses to the Do event, other
     than routing it to the appropriate context.
 
+    The Do events are interned by signal and option id, so the options and
+    executors of an operation share a single instance.
+
     Args:
         signal_type (str): The type of signal to be sent, representing the
         operation to be done.
+        option_id (int | None): The id given to the option by the
+        LayoutFactory, which routes the signal to its callback with a list
+        lookup. Without it, the signal is routed by its name.
 
 
     """
 
-    def __init__(self, signal: str) -> None:
+    __slots__ = ("signal", "option_id")
+
+    _interned: dict[tuple[str, int | None], "Do"] = dict({})
+
+    def __new__(cls, signal: str, option_id: int | None = None) -> "Do":
+        instance = cls._interned.get((signal, option_id))
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._interned[(signal, option_id)] = instance
+
+        return instance
+
+    def __init__(self, signal: str, option_id: int | None = None) -> None:
         self.signal = signal
+        self.option_id = option_id
+
+    def __getnewargs__(self) -> tuple[str, int | None]:
+        return (self.signal, self.option_id)
 
 
 class Error(Signal):
+    __slots__ = ("origin", "log_message", "traceback")
+
     def __init__(
         self,
         origin: str | None = None,
@@ -62,7 +126,9 @@ class Error(Signal):
         self.traceback = traceback
 
 
-class Abort(Signal):
+class Abort(_Interned):
+    __slots__ = ("origin", "log_message")
+
     def __init__(
         self, origin: str | None = None, log_message: str | None = None
     ) -> None:
@@ -70,7 +136,9 @@ class Abort(Signal):
         self.log_message = log_message
 
 
-class Quit(Signal):
+class Quit(_Interned):
+    __slots__ = ("origin", "log_message")
+
     def __init__(
         self, origin: str | None = None, log_message: str | None = None
     ) -> None:
@@ -78,12 +146,61 @@ class Quit(Signal):
         self.log_message = log_message
 
 
-class ReturnToMain(Signal): ...
+class ReturnToMain(_Interned):
+    __slots__ = ()
 
 
-class ReturnToPrevious(Signal): ...
+class ReturnToPrevious(_Interned):
+    __slots__ = ()
+
+
+class OpenPalette(_Interned):
+    """
+    Opens the command palette, which searches the options of all the submenus.
+    """
+
+    __slots__ = ()
+
+
+class RecordMacro(_Interned):
+    """
+    Starts recording the selections as a macro or, while recording, stops it.
+    """
+
+    __slots__ = ()
+
+
+class PlayMacro(Signal):
+    """
+    Replays the selections of a macro.
+
+    Args:
+        name (str): The name of the macro.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Jump(Signal):
+    """
+    Goes directly to a submenu or an option by its address.
+
+    Args:
+        address (str): The submenus and, optionally, the option separated
+        by "/", ex. "Main_Menu/Second_Menu/Accept_an_input".
+    """
+
+    __slots__ = ("address",)
+
+    def __init__(self, address: str) -> None:
+        self.address = address
 
 
 class SwitchSubmenu(Signal):
+    __slots__ = ("target_id",)
+
     def __init__(self, target_id: str) -> None:
         self.target_id = target_id
@@ -2,6 +2,9 @@ from typing import Optional
 from squiffy.abstract import abstract_state
 from squiffy.errors import StateContentNotSavable
 
+# tells a pending None from a value which is not pending
+_MISSING = object()
+
 
 # TODO: Should add a method for checking that the value in the init dict or payload is not a buildin type?
 class State(abstract_state.AbstractState):
@@ -49,6 +52,13 @@ class State(abstract_state.AbstractState):
     def get(self, value_name: str) -> object:
         return self._state.get(value_name)
 
+    def snapshot(self, value_names: list[str] | tuple[str, ...]) -> "StateSnapshot":
+        """
+        A copy of the given values, sent to the callbacks running in a
+        worker process. The changes are returned as the payload of an OK.
+        """
+        return StateSnapshot({name: self._state.get(name) for name in value_names})
+
     def _state_content_precheck(self, init: dict) -> None:
         """
         Checks that all the values in the state content are savable.
@@ -71,3 +81,55 @@ class State(abstract_state.AbstractState):
 
             elif not hasattr(values, "save"):
                 raise StateContentNotSavable(f"State content {values} is not savable.")
+
+
+class StateSnapshot:
+    """
+    A read-only copy of some values of a State, which can be pickled and
+    sent to a worker process. The values are read with get, as from a State.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: dict[str, object]) -> None:
+        self._values = values
+
+    def get(self, value_name: str) -> object:
+        return self._values.get(value_name)
+
+    def keys(self) -> list[str]:
+        return list(self._values)
+
+
+class StateView:
+    """
+    The state as seen by the callbacks while the payloads of the OK signals
+    wait to be applied: the pending values are read before the ones of the
+    state, and the rest of the State is used as it is. The updates are
+    added to the pending values, so the last writer wins when they are
+    applied.
+    """
+
+    __slots__ = ("_state", "_pending")
+
+    def __init__(self, state: State, pending: dict[str, object]) -> None:
+        self._state = state
+        self._pending = pending
+
+    def get(self, value_name: str) -> object:
+        # a single lookup, since the pending values are cleared by the main
+        # thread while the background jobs read them
+        value = self._pending.get(value_name, _MISSING)
+        if value is _MISSING:
+            return self._state.get(value_name)
+
+        return value
+
+    def update(self, value_dict: dict[str, object]) -> None:
+        self._pending.update(value_dict)
+
+    def snapshot(self, value_names: list[str] | tuple[str, ...]) -> StateSnapshot:
+        return StateSnapshot({name: self.get(name) for name in value_names})
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._state, name)
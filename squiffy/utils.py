@@ -1,3 +1,4 @@
+import asyncio
 from prompt_toolkit import prompt
 from prompt_toolkit.validation import Validator
 
@@ -7,14 +8,35 @@ def generate_signal_name(submenu_name: str, option_name: str) -> str:
 
 
 def take_break() -> None:
-    prompt("Press Enter to continue...")
+    prompt("Press Enter to continue...", in_thread=_event_loop_running())
+
+
+def _event_loop_running() -> bool:
+    """
+    Whether an event loop runs in this thread (the asyncio mode), where a
+    blocking prompt can not start its own loop and is run in a thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+
+    return True
 
 
 def _is_number_within_limits(
     lower: int | float = 0, upper: int | float = 99999
 ) -> Validator:
+    """
+    A validator accepting the whole numbers between lower and upper, inclusive.
+    """
+
     def __is_number_within_limits(text: str) -> bool:
-        return text.isdigit() and (int(text) >= lower) and (int(text) <= upper)
+        # isdigit accepts characters (ex. superscripts) which int rejects
+        if not text.isdecimal():
+            return False
+
+        return lower <= int(text) <= upper
 
     validator = Validator.from_callable(
         __is_number_within_limits,
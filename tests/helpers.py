@@ -0,0 +1,26 @@
+import json
+import os
+import tempfile
+import unittest
+from typing import Callable
+
+EXAMPLE_LAYOUT = os.path.join(
+    os.path.dirname(__file__), os.pardir, "examples", "example1.json"
+)
+
+
+def write_layout(testcase: unittest.TestCase, mutate: Callable[[dict], None]) -> str:
+    """
+    Writes the example layout, changed by mutate, to a temporary file
+    removed at the end of the test, and returns its path.
+    """
+    with open(EXAMPLE_LAYOUT) as file:
+        layout = json.load(file)
+
+    mutate(layout)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as file:
+        json.dump(layout, file)
+    testcase.addCleanup(os.remove, file.name)
+
+    return file.name
@@ -3,11 +3,16 @@ import unittest.mock
 from squiffy import Application
 from squiffy.context import executor
 from squiffy import signals
+from squiffy.errors import UnknownOptionError
 
 
 class TestApplication(unittest.TestCase):
     _mock_state = unittest.mock.Mock()
     _mock_layout = unittest.mock.Mock()
+    _mock_layout.option_ids = {"SUBMENU_OPTION": 0}
+    _mock_layout.background_options = set()
+    _mock_layout.process_options = set()
+    _mock_layout.jobs = None
 
     _application = Application(layout=_mock_layout, state=_mock_state)
     _application._menu = unittest.mock.Mock()
@@ -41,6 +46,14 @@ class TestApplication(unittest.TestCase):
             list(self._application._context.executors.values())[0], executor.Executor
         )
 
+    def test_add_for_unknown_option(self):
+        with self.assertRaises(UnknownOptionError):
+            self._application.add(
+                function=unittest.mock.Mock(),
+                option_name="missing",
+                submenu_name="submenu",
+            )
+
     def test_handle_errors(self):
         # Test if the handle_errors function calls the menu's handle_errors function
         self._application.handle_errors(signals.Error())
@@ -49,12 +62,26 @@ class TestApplication(unittest.TestCase):
     def test_handle_ok(self):
         # Test if the handle_ok function updates the state with the payload
         self._application.handle_ok(signals.OK(payload={"key": "value"}))
+        self._application.flush_ok_batch()
         self._application._state.update.assert_called_once_with({"key": "value"})
 
         # Test if the handle_ok function does not update the state when the payload is empty
         self._application.handle_ok(signals.OK())
+        self._application.flush_ok_batch()
         self.assertEqual(self._application._state.update.call_count, 1)
 
+    def test_ok_payloads_are_coalesced(self):
+        state = unittest.mock.Mock()
+        application = Application(layout=self._mock_layout, state=state)
+
+        application.handle_ok(signals.OK(origin="first", payload={"a": 1, "b": 1}))
+        application.handle_ok(signals.OK(origin="second", payload={"b": 2}))
+        state.update.assert_not_called()
+
+        application.flush_ok_batch()
+        state.update.assert_called_once_with({"a": 1, "b": 2})
+        self.assertEqual(application.payload_origins, {"a": "first", "b": "second"})
+
     def test_handle_quit(self):
         pass
 
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import signal as os_signal
+import unittest
+import unittest.mock
+from squiffy import Application, LayoutFactory, ScriptedInput, signals
+from squiffy.context.executor import Executor
+from tests.helpers import EXAMPLE_LAYOUT
+
+
+class TestAsyncApplication(unittest.TestCase):
+    def test_coroutine_callbacks_share_the_loop(self):
+        calls: list = []
+
+        async def wait(state):
+            await asyncio.sleep(0)
+            calls.append("wait")
+            return signals.OK(payload={"wait": True})
+
+        application = Application(
+            layout=LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True),
+            state=unittest.mock.Mock(),
+            input_source=ScriptedInput(
+                [
+                    "Main_Menu/Print_and_wait",
+                    "Main_Menu/SwitchToSubmenu2",
+                    "Second_Menu/Accept_an_input",
+                ]
+            ),
+            render=False,
+        )
+        application.add(wait, option_name="Print_and_wait", submenu_name="Main_Menu")
+        application.add(
+            lambda state: calls.append("input") or signals.OK(),
+            option_name="Accept_an_input",
+            submenu_name="Second_Menu",
+        )
+
+        asyncio.run(application.run_async())
+
+        self.assertEqual(calls, ["wait", "input"])
+        application._state.update.assert_called_once_with({"wait": True})
+        application._state.save.assert_called_once()
+        self.assertFalse(application._context.asynchronous)
+
+    def test_screen_size_is_watched_while_running(self):
+        watched: list = []
+
+        async def watch() -> None:
+            watched.append("started")
+            try:
+                await asyncio.get_running_loop().create_future()
+            finally:
+                watched.append("stopped")
+
+        async def wait(state):
+            await asyncio.sleep(0)
+            return signals.OK()
+
+        application = Application(
+            layout=LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True),
+            state=unittest.mock.Mock(),
+            input_source=ScriptedInput(["Main_Menu/Print_and_wait"]),
+            render=False,
+        )
+        application.add(wait, option_name="Print_and_wait", submenu_name="Main_Menu")
+
+        with unittest.mock.patch.object(
+            application._layout.screen, "async_get_sceen_size", new=watch
+        ):
+            asyncio.run(application.run_async())
+
+        # the watcher is cancelled before run_async returns
+        self.assertEqual(watched, ["started", "stopped"])
+
+
+class TestAsyncExecutor(unittest.TestCase):
+    def setUp(self):
+        self.context = unittest.mock.Mock()
+
+    def _executor(self, callback) -> Executor:
+        executor = Executor(signals.Do("SUBMENU_OPTION"), callback)
+        executor.context = self.context
+
+        return executor
+
+    def test_coroutine_callback_runs_without_a_loop(self):
+        async def callback(state):
+            return signals.OK(payload=state)
+
+        self._executor(callback).execute(signals.Do("SUBMENU_OPTION"), {"key": 1})
+
+        result = self.context.handle_signal.call_args.args[0]
+        self.assertEqual(result.payload, {"key": 1})
+
+    @unittest.skipUnless(os.name == "posix", "the loop signal handlers are POSIX only")
+    def test_interrupt_cancels_the_callback(self):
+        async def callback(state):
+            await asyncio.sleep(10)
+            return signals.OK()
+
+        async def run() -> None:
+            asyncio.get_running_loop().call_later(
+                0.01, os.kill, os.getpid(), os_signal.SIGINT
+            )
+            await self._executor(callback).execute_async(
+                signals.Do("SUBMENU_OPTION"), None
+            )
+
+        asyncio.run(run())
+
+        result = self.context.handle_signal.call_args.args[0]
+        self.assertIsInstance(result, signals.Abort)
+        self.assertEqual(result.origin, "SUBMENU_OPTION")
+
+
+if __name__ == "__main__":
+    unittest.main()
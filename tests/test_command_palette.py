@@ -0,0 +1,74 @@
+import unittest
+import unittest.mock
+from squiffy import signals
+from squiffy.abstract.abstract_context import AbstractContext
+from squiffy.layout.layout_factory import LayoutFactory
+from squiffy.menu.command_palette import CommandPalette
+from squiffy.menu.menu_items import Item
+from tests.helpers import EXAMPLE_LAYOUT
+
+
+class TestCommandPalette(unittest.TestCase):
+    def setUp(self):
+        self.palette = CommandPalette()
+        self.palette.add(
+            "Main", Item("export_report", signals.Do("EXPORT"), help="Save as csv")
+        )
+        self.palette.add(
+            "Tools", Item("report_settings", signals.Do("SETTINGS"), help=None)
+        )
+        self.palette.add(
+            "Tools", Item("cleanup", signals.Do("CLEANUP"), help="Remove old reports")
+        )
+
+    def _options(self, query: str) -> list[str]:
+        return [entry.option for entry in self.palette.search(query)]
+
+    def test_options_rank_above_help_text(self):
+        self.assertEqual(
+            self._options("report"), ["REPORT_SETTINGS", "EXPORT_REPORT", "CLEANUP"]
+        )
+
+    def test_every_query_word_has_to_match(self):
+        self.assertEqual(self._options("rep sett"), ["REPORT_SETTINGS"])
+        self.assertEqual(self._options("csv"), ["EXPORT_REPORT"])
+        self.assertEqual(self._options("csv settings"), [])
+
+    def test_choose(self):
+        self.assertEqual(self.palette.choose("2").option, "CLEANUP")
+        self.assertEqual(self.palette.choose("clean").signal.signal, "CLEANUP")
+        self.assertIsNone(self.palette.choose("9"))
+        self.assertIsNone(self.palette.choose("missing"))
+
+
+class TestMenuPalette(unittest.TestCase):
+    def setUp(self):
+        self.layout = LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True)
+        self.menu = self.layout.create()
+        self.menu.controller = unittest.mock.Mock(spec=AbstractContext)
+
+    def test_palette_indexes_all_submenus(self):
+        submenus = {entry.submenu for entry in self.layout.palette.search("print")}
+        self.assertEqual(submenus, {"Main_Menu", "Second_Menu"})
+
+    def test_palette_is_rebuilt_by_a_second_create(self):
+        entries = len(self.layout.palette)
+        self.layout.create()
+
+        self.assertEqual(len(self.layout.palette), entries)
+        self.assertEqual(len(self.layout.palette.search("print the state")), 1)
+
+    def test_chosen_option_is_handled_without_switching(self):
+        entry = self.layout.palette.search("print the state")[0]
+
+        with unittest.mock.patch.object(
+            self.layout.palette, "show", return_value=entry
+        ):
+            self.menu.handle_signals(signals.OpenPalette())
+
+        self.menu.controller.handle_signal.assert_called_once_with(entry.signal)
+        self.assertEqual(self.menu._current_submenu.uid, "Main_Menu")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,6 +32,18 @@ class TestContext(unittest.TestCase):
         self._context._handle_do_event(signals.Do("signal"))
         self.assertEqual(self._context._executors["signal"].execute.call_count, 1)
 
+    def test_handle_do_event_by_option_id(self):
+        context = Context(self._mock_application)
+        routed_executor = unittest.mock.Mock(signal="SUBMENU_OPTION")
+
+        context.executors = routed_executor
+        context.option_ids = {"SUBMENU_WITHOUT_CALLBACK": 0, "SUBMENU_OPTION": 1}
+
+        context._handle_do_event(signals.Do("SUBMENU_OPTION", option_id=1))
+        context._handle_do_event(signals.Do("SUBMENU_WITHOUT_CALLBACK", option_id=0))
+
+        self.assertEqual(routed_executor.execute.call_count, 1)
+
     def test_handle_signal_OK(self):
         self._context.handle_signal(signals.OK())
         self.assertEqual(self._mock_application.handle_ok.call_count, 1)
@@ -0,0 +1,51 @@
+import unittest
+import unittest.mock
+from squiffy import signals
+from squiffy.dispatch import TypeDispatcher
+
+
+class _ChildOK(signals.OK):
+    pass
+
+
+class TestTypeDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.ok_handler = unittest.mock.Mock(return_value="ok")
+        self.default = unittest.mock.Mock(return_value="default")
+        self.dispatcher = TypeDispatcher(
+            {signals.OK: self.ok_handler}, default=self.default
+        )
+
+    def test_dispatch_to_the_handler_of_the_type(self):
+        signal = signals.OK()
+
+        self.assertEqual(self.dispatcher.dispatch(signal, "owner"), "ok")
+        self.ok_handler.assert_called_once_with("owner", signal)
+
+    def test_subclass_uses_the_handler_of_its_base(self):
+        signal = _ChildOK()
+
+        self.assertEqual(self.dispatcher.dispatch(signal), "ok")
+        self.assertIs(self.dispatcher.resolve(_ChildOK), self.ok_handler)
+
+    def test_type_without_handler_uses_the_default(self):
+        self.assertEqual(self.dispatcher.dispatch(signals.Quit()), "default")
+
+    def test_type_without_handler_is_ignored_without_default(self):
+        dispatcher = TypeDispatcher({signals.OK: self.ok_handler})
+
+        self.assertIsNone(dispatcher.dispatch(signals.Quit()))
+        self.ok_handler.assert_not_called()
+
+    def test_register_overrides_the_resolved_handler(self):
+        self.dispatcher.dispatch(_ChildOK())
+
+        child_handler = unittest.mock.Mock(return_value="child")
+        self.dispatcher.register(_ChildOK, child_handler)
+
+        self.assertEqual(self.dispatcher.dispatch(_ChildOK()), "child")
+        self.assertEqual(self.dispatcher.dispatch(signals.OK()), "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import io
+import unittest
+import unittest.mock
+from squiffy import Application, LayoutFactory, ScriptedInput, signals
+from squiffy.errors import InputScriptError
+from tests.helpers import EXAMPLE_LAYOUT
+
+
+class TestScriptedInput(unittest.TestCase):
+    def test_lines_are_read_in_order(self):
+        script = ScriptedInput(["", "# comment", "Main_Menu/2", "  quit  "])
+
+        self.assertEqual(script.read("Main_Menu"), "2")
+        self.assertEqual(script.read("Second_Menu"), "quit")
+        self.assertEqual(script.line_number, 4)
+        self.assertEqual(script.selections, 2)
+
+        with self.assertRaises(EOFError):
+            script.read("Main_Menu")
+
+    def test_selection_for_another_submenu(self):
+        script = ScriptedInput(["second_menu/0"])
+
+        with self.assertRaises(InputScriptError):
+            script.read("Main_Menu")
+
+    def test_from_stream(self):
+        script = ScriptedInput.from_stream(io.StringIO("Main_Menu/1\n"))
+        self.assertEqual(script.read("MAIN_MENU"), "1")
+
+
+class TestScriptedApplication(unittest.TestCase):
+    def _run(self, *lines: str, render: bool = False) -> tuple[Application, list]:
+        calls: list = []
+        state = unittest.mock.Mock()
+
+        application = Application(
+            layout=LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True),
+            state=state,
+            input_source=ScriptedInput(lines),
+            render=render,
+        )
+        application.add(
+            function=lambda state: calls.append("wait") or signals.OK(),
+            option_name="Print_and_wait",
+            submenu_name="Main_Menu",
+        )
+        application.add(
+            function=lambda state: calls.append("input") or signals.OK(),
+            option_name="Accept_an_input",
+            submenu_name="Second_Menu",
+        )
+        application.run()
+
+        return application, calls
+
+    def test_script_drives_the_menu(self):
+        application, calls = self._run(
+            "Main_Menu/1",
+            "Main_Menu/SwitchToSubmenu2",
+            "Second_Menu/accept_an_input",
+            "Second_Menu/RETURN_TO_MAIN",
+            "Main_Menu/Print_and_wait",
+        )
+
+        self.assertEqual(calls, ["wait", "input", "wait"])
+        # the end of the script quits and saves the state
+        self.assertFalse(application._running)
+        application._state.save.assert_called_once()
+
+    def test_frames_are_not_rendered(self):
+        application, _ = self._run("Main_Menu/1")
+        self.assertEqual(application._layout.renderer.frames_rendered, 0)
+
+        application, _ = self._run("Main_Menu/1", render=True)
+        self.assertEqual(application._layout.renderer.frames_rendered, 2)
+
+    def test_unmatched_line_quits(self):
+        with unittest.mock.patch("sys.stderr", new=io.StringIO()) as stderr:
+            application, calls = self._run("Main_Menu/9", "Main_Menu/Print_and_wait")
+
+        self.assertIn("is not an option of Main_Menu", stderr.getvalue())
+        # the error menu does not read the next line, the state is saved
+        self.assertEqual(calls, [])
+        self.assertFalse(application._running)
+        application._state.save.assert_called_once()
+
+    def test_line_for_another_submenu_quits(self):
+        with unittest.mock.patch("sys.stderr", new=io.StringIO()) as stderr:
+            application, calls = self._run("Second_Menu/0", "Main_Menu/Print_and_wait")
+
+        self.assertIn("the current submenu is Main_Menu", stderr.getvalue())
+        self.assertEqual(calls, [])
+        application._state.save.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+from squiffy import signals
+from squiffy.menu.items_filter import ItemsCompleter
+from squiffy.menu.menu_items import Item, ItemsCollection
+
+
+def _item(option: str) -> Item:
+    return Item(option=option, signal=signals.Quit())
+
+
+class TestItemsIndex(unittest.TestCase):
+    def setUp(self):
+        self.items = ItemsCollection(
+            uid="Main",
+            items=[
+                _item("print_the_state"),
+                _item("show_preview"),
+                _item("accept_an_input"),
+            ],
+        )
+
+    def test_short_query_matches_word_prefixes(self):
+        self.assertEqual(self.items.index.search("pr"), [0, 1])
+        self.assertEqual(self.items.index.search("ta"), [])
+
+    def test_long_query_matches_substrings(self):
+        self.assertEqual(self.items.index.search("STAT"), [0])
+        self.assertEqual(self.items.index.search("an_in"), [2])
+        self.assertEqual(self.items.index.search("input_x"), [])
+
+    def test_index_follows_add_and_remove(self):
+        self.items.add_item(_item("print_again"))
+        self.assertEqual(self.items.index.search("print"), [0, 3])
+
+        self.items.remove_item(0)
+        self.assertEqual(self.items.index.search("print"), [2])
+        self.assertEqual(self.items.index.search("pr"), [0, 2])
+        self.assertEqual(len(self.items.index), len(self.items))
+
+    def test_limit(self):
+        self.assertEqual(self.items.index.search("_", limit=None), [])
+        self.assertEqual(self.items.index.search("e", limit=1), [])
+        self.assertEqual(self.items.index.search("s", limit=1), [0])
+
+
+class TestItemsCompleter(unittest.TestCase):
+    def setUp(self):
+        self.items = ItemsCollection(
+            uid="Main", items=[_item("print_the_state"), _item("quit")]
+        )
+        self.completer = ItemsCompleter(self.items.index)
+
+    def _completions(self, text: str) -> list:
+        return list(self.completer.get_completions(Document(text), CompleteEvent()))
+
+    def test_completion_replaces_the_filter_with_the_index(self):
+        (completion,) = self._completions("qu")
+
+        self.assertEqual(completion.text, "1")
+        self.assertEqual(completion.start_position, -2)
+        self.assertEqual(completion.display_text, "1>>>QUIT")
+
+    def test_numbers_are_not_filtered(self):
+        self.assertEqual(self._completions("1"), [])
+        self.assertEqual(self._completions(""), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
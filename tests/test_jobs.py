@@ -0,0 +1,204 @@
+import os
+import threading
+import time
+import unittest
+import unittest.mock
+from squiffy import Application, LayoutFactory, ScriptedInput, State, signals
+from squiffy.errors import InvalidLayoutError
+from squiffy.context.jobs import JOB_DONE, JOB_FAILED, JobRunner
+from squiffy.menu.jobs_submenu import JOBS_SUBMENU
+from tests.helpers import EXAMPLE_LAYOUT, write_layout
+
+
+def _square(state) -> signals.OK:
+    # a module level function, so it can be sent to a worker process
+    return signals.OK(
+        payload={
+            "square": state.get("number") ** 2,
+            "keys": state.keys(),
+            "pid": os.getpid(),
+        }
+    )
+
+
+def _crash(state) -> None:
+    os._exit(1)
+
+
+class TestJobRunner(unittest.TestCase):
+    def setUp(self):
+        self.runner = JobRunner(max_workers=2, kept=2)
+        self.addCleanup(self.runner.shutdown)
+
+    def test_result_is_queued_until_drained(self):
+        release = threading.Event()
+        ok = signals.OK(payload={"key": "value"})
+
+        job = self.runner.submit("EXPORT", lambda state: release.wait() and ok, None)
+
+        self.assertEqual(self.runner.running, 1)
+        self.assertEqual(self.runner.drain(), [])
+
+        release.set()
+        self.runner.shutdown(wait=True)
+
+        self.assertEqual(self.runner.drain(), [ok])
+        self.assertEqual(job.status, JOB_DONE)
+        self.assertIsNotNone(job.finished)
+
+    def test_failed_job_sends_an_error(self):
+        job = self.runner.submit("EXPORT", lambda state: 1 / 0, None)
+        self.runner.shutdown(wait=True)
+
+        (error,) = self.runner.drain()
+        self.assertIsInstance(error, signals.Error)
+        self.assertEqual(error.origin, "EXPORT")
+        self.assertEqual(job.status, JOB_FAILED)
+
+    def test_oldest_finished_jobs_are_forgotten(self):
+        for index in range(4):
+            self.runner.submit(f"JOB_{index}", lambda state: signals.OK(), None)
+        self.runner.shutdown(wait=True)
+        self.runner.drain()
+
+        self.assertEqual([job.name for job in self.runner.jobs], ["JOB_2", "JOB_3"])
+
+    def test_processes_are_reused(self):
+        runner = JobRunner(max_processes=1)
+        self.addCleanup(runner.shutdown)
+
+        state = State(init={"number": 3, "other": 4}, save_except=["number", "other"])
+        for _ in range(2):
+            runner.submit("SQUARE", _square, state.snapshot(["number"]), processes=True)
+        runner.shutdown(wait=True)
+
+        first, second = (signal.payload for signal in runner.drain())
+        self.assertEqual(first["square"], 9)
+        self.assertEqual(first["keys"], ["number"])
+        self.assertNotEqual(first["pid"], os.getpid())
+        self.assertEqual(first["pid"], second["pid"])
+
+    def test_broken_process_pool_is_replaced(self):
+        runner = JobRunner(max_processes=1)
+        self.addCleanup(runner.shutdown)
+
+        crashed = runner.submit("CRASH", _crash, None, processes=True)
+        deadline = time.monotonic() + 30
+        while crashed.finished is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        (error,) = runner.drain()
+        self.assertIsInstance(error, signals.Error)
+        self.assertEqual(crashed.status, JOB_FAILED)
+
+        state = State(init={"number": 3}, save_except=["number"])
+        job = runner.submit("SQUARE", _square, state.snapshot(["number"]), True)
+        runner.shutdown(wait=True)
+
+        (ok,) = runner.drain()
+        self.assertEqual(ok.payload["square"], 9)
+        self.assertEqual(job.status, JOB_DONE)
+        self.assertEqual(runner.running, 0)
+
+    def test_failed_submission_is_not_left_running(self):
+        with unittest.mock.patch.object(
+            self.runner, "_submit_to_processes", side_effect=RuntimeError()
+        ):
+            job = self.runner.submit("SQUARE", _square, None, processes=True)
+
+        self.assertEqual(job.status, JOB_FAILED)
+        self.assertEqual(self.runner.running, 0)
+        self.assertIsInstance(self.runner.drain()[0], signals.Error)
+
+
+class TestBackgroundOptions(unittest.TestCase):
+    def _layout(
+        self, background: bool | str = True, extra_title: str | None = None
+    ) -> LayoutFactory:
+        def set_background(layout: dict) -> None:
+            if extra_title is not None:
+                layout["submenu"].append({"title": extra_title, "options": []})
+
+            for option in layout["submenu"][0]["options"]:
+                if option["option"] == "Print_and_wait":
+                    option["background"] = background
+
+        return LayoutFactory(
+            layout_file_path=write_layout(self, set_background), headless=True
+        )
+
+    def test_background_option_runs_in_the_job_runner(self):
+        threads: list[str] = []
+        state = unittest.mock.Mock()
+
+        def export(state) -> signals.OK:
+            threads.append(threading.current_thread().name)
+            return signals.OK(payload={"done": 1})
+
+        application = Application(
+            layout=self._layout(),
+            state=state,
+            input_source=ScriptedInput(["Main_Menu/Print_and_wait"]),
+            render=False,
+        )
+        application.add(
+            function=export, option_name="Print_and_wait", submenu_name="Main_Menu"
+        )
+        application.run()
+
+        self.assertTrue(threads[0].startswith("squiffy-job"))
+        # the job is waited for on quit, so its result is saved
+        state.update.assert_called_once_with({"done": 1})
+        state.save.assert_called_once()
+
+        jobs_submenu = application._menu._submenu[-1]
+        jobs_submenu._update_items()
+        self.assertTrue(
+            jobs_submenu._items.get_item(0)
+            .show()
+            .startswith("MAIN_MENU_PRINT_AND_WAIT DONE")
+        )
+
+    def test_process_option_merges_its_payload(self):
+        state = State(init={"number": 5}, save_except=["number"])
+
+        application = Application(
+            layout=self._layout(background="process"),
+            state=state,
+            input_source=ScriptedInput(["Main_Menu/Print_and_wait"]),
+            render=False,
+        )
+        application.add(
+            function=_square,
+            option_name="Print_and_wait",
+            submenu_name="Main_Menu",
+            state_keys=["number"],
+        )
+        application.run()
+
+        self.assertEqual(state.get("square"), 25)
+        self.assertNotEqual(state.get("pid"), os.getpid())
+
+    def test_layout_submenu_titled_jobs(self):
+        with self.assertRaises(InvalidLayoutError):
+            self._layout(extra_title="jobs").create()
+
+    def test_jobs_submenu_is_addressed(self):
+        menu = self._layout().create()
+
+        self.assertTrue(menu.jump(JOBS_SUBMENU))
+        self.assertEqual(menu._current_submenu.uid, JOBS_SUBMENU)
+
+    def test_runner_is_kept_between_creations(self):
+        layout = self._layout()
+        layout.create()
+        runner = layout.jobs
+
+        menu = layout.create()
+
+        self.assertIs(layout.jobs, runner)
+        self.assertIs(menu._submenu[-1]._jobs, runner)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from squiffy.errors import InvalidHotkeyError
+from squiffy.layout.layout_factory import LayoutFactory
+from squiffy.renderer import HeadlessRenderer
+from squiffy.screen import HeadlessScreen
+from tests.helpers import EXAMPLE_LAYOUT, write_layout
+
+
+class TestHeadlessLayoutFactory(unittest.TestCase):
+    def setUp(self):
+        self.layout = LayoutFactory(
+            layout_file_path=EXAMPLE_LAYOUT, headless=True, screen_size=(40, 60)
+        )
+
+    def test_headless_backend_is_used(self):
+        self.assertIsInstance(self.layout.screen, HeadlessScreen)
+        self.assertIsInstance(self.layout.renderer, HeadlessRenderer)
+        self.assertEqual((self.layout.screen.hight, self.layout.screen.width), (40, 60))
+
+    def test_frame_is_rendered_in_memory(self):
+        menu = self.layout.create()
+        menu._current_submenu._show_ui()
+
+        frame = self.layout.renderer.frame
+        self.assertEqual(self.layout.renderer.frames_rendered, 1)
+        self.assertIn("Main_Menu", frame)
+        self.assertIn("0>>>SWITCHTOSUBMENU2", frame)
+        self.assertTrue(all(len(line) <= 60 for line in frame.split("\n")))
+
+    def test_options_get_dense_ids(self):
+        menu = self.layout.create()
+        option_ids = self.layout.option_ids
+
+        self.assertEqual(sorted(option_ids.values()), list(range(len(option_ids))))
+
+        submenu = menu._current_submenu
+        signal = submenu._items.get_item(submenu.find("Print_and_wait")).emit()
+        self.assertEqual(signal.option_id, option_ids["MAIN_MENU_PRINT_AND_WAIT"])
+
+    def test_resize_of_headless_screen(self):
+        menu = self.layout.create()
+        self.layout.screen.resize(30, 40)
+        menu._current_submenu._show_ui()
+
+        frame = self.layout.renderer.frame
+        self.assertTrue(all(len(line) <= 40 for line in frame.split("\n")))
+
+
+class TestLayoutHotkeys(unittest.TestCase):
+    def _layout(self, *hotkeys: str | None) -> LayoutFactory:
+        def set_hotkeys(layout: dict) -> None:
+            options = layout["submenu"][0]["options"]
+            for option, hotkey in zip(options, hotkeys):
+                option["hotkey"] = hotkey
+
+        return LayoutFactory(
+            layout_file_path=write_layout(self, set_hotkeys), headless=True
+        )
+
+    def test_hotkeys_are_compiled_per_submenu(self):
+        menu = self._layout("s", None, "t").create()
+        hotkeys = menu._current_submenu.hotkeys
+
+        self.assertEqual(sorted(hotkeys), ["s", "t"])
+        self.assertEqual(hotkeys["t"].show(), "TRIGGER_AN_ERROR")
+
+    def test_duplicated_hotkey(self):
+        with self.assertRaises(InvalidHotkeyError):
+            self._layout("s", "s").create()
+
+    def test_invalid_hotkey(self):
+        for hotkey in ("1", ":", " ", "ab"):
+            with self.assertRaises(InvalidHotkeyError):
+                self._layout(hotkey).create()
+
+
+if __name__ == "__main__":
+    unittest.main()
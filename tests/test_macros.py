@@ -0,0 +1,205 @@
+import unittest
+import unittest.mock
+from prompt_toolkit.keys import Keys
+from squiffy import Application, ScriptedInput, State, signals
+from squiffy.abstract.abstract_context import AbstractContext
+from squiffy.errors import InvalidMacroError
+from squiffy.layout.layout_factory import LayoutFactory
+from squiffy.menu.macros import MacroStep
+from tests.helpers import EXAMPLE_LAYOUT, write_layout
+
+
+class TestMacros(unittest.TestCase):
+    def setUp(self):
+        self.layout = LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True)
+        self.menu = self.layout.create()
+        self.menu.controller = unittest.mock.Mock(spec=AbstractContext)
+
+    def _handled(self) -> list[str]:
+        return [
+            call.args[0].signal
+            for call in self.menu.controller.handle_signal.call_args_list
+        ]
+
+    def test_steps_are_compiled(self):
+        macro = self.menu.add_macro(
+            "report", ["main_menu/SwitchToSubmenu2", "Second_Menu/1"]
+        )
+
+        self.assertEqual(
+            macro.steps,
+            (MacroStep("Main_Menu", 0), MacroStep("Second_Menu", 1)),
+        )
+
+        with self.assertRaises(InvalidMacroError):
+            self.menu.add_macro("missing", ["Second_Menu/Missing"])
+        with self.assertRaises(InvalidMacroError):
+            self.menu.add_macro("hotkey", ["Second_Menu/0"], hotkey="x")
+
+    def test_duplicated_hotkey(self):
+        self.menu.add_macro("first", ["Main_Menu/1"], hotkey="f5")
+        # the same macro can be registered again with its hotkey
+        self.menu.add_macro("first", ["Main_Menu/1"], hotkey="f5")
+
+        with self.assertRaises(InvalidMacroError):
+            self.menu.add_macro("second", ["Main_Menu/1"], hotkey="f5")
+
+    def test_replay_renders_only_the_final_frame(self):
+        self.menu.add_macro(
+            "report", ["Main_Menu/SwitchToSubmenu2", "Second_Menu/Print_the_state"]
+        )
+        self.menu.set_input_source(ScriptedInput([]))
+
+        self.menu.handle_signals(signals.PlayMacro("report"))
+        self.assertEqual(self._handled(), ["SECOND_MENU_PRINT_THE_STATE"])
+        self.assertEqual(self.layout.renderer.frames_rendered, 0)
+
+        self.menu.show()
+        self.assertEqual(self.layout.renderer.frames_rendered, 1)
+        self.assertIn("Second_Menu", self.layout.renderer.frame)
+
+    def test_replay_starts_at_the_first_submenu(self):
+        self.menu.add_macro("state", ["Second_Menu/Print_the_state"])
+
+        self.menu.play_macro("state")
+
+        self.assertEqual(self._handled(), ["SECOND_MENU_PRINT_THE_STATE"])
+        self.assertEqual(self.menu.breadcrumbs, "Main_Menu > Second_Menu")
+
+    def test_replay_stops_on_another_path(self):
+        self.menu.add_macro("state", ["Main_Menu/SwitchToSubmenu2", "Main_Menu/1"])
+
+        with unittest.mock.patch.object(self.menu, "handle_errors") as handle_errors:
+            self.menu.play_macro("state")
+            self.menu.play_macro("missing")
+
+        self.assertEqual(handle_errors.call_count, 2)
+        self.assertEqual(self._handled(), [])
+
+    def test_recorded_selections_are_replayed(self):
+        self.menu.set_input_source(
+            ScriptedInput(["Main_Menu/SwitchToSubmenu2", "Second_Menu/Accept_an_input"])
+        )
+
+        self.menu.handle_signals(signals.RecordMacro())
+        self.menu.show()
+        self.menu.show()
+        self.menu.handle_signals(signals.RecordMacro())
+
+        self.menu.handle_signals(signals.ReturnToMain())
+        self.menu.handle_signals(signals.PlayMacro("recorded"))
+
+        self.assertFalse(self.menu.recording)
+        self.assertEqual(
+            self._handled(),
+            ["SECOND_MENU_ACCEPT_AN_INPUT", "SECOND_MENU_ACCEPT_AN_INPUT"],
+        )
+        # the replayed selections are not recorded
+        self.assertEqual(len(self.menu.macros["recorded"].steps), 2)
+
+
+class TestLayoutMacros(unittest.TestCase):
+    def test_macros_are_declared_in_the_layout(self):
+        def add_macro(layout: dict) -> None:
+            layout["macros"] = [
+                {
+                    "name": "state",
+                    "hotkey": "f5",
+                    "steps": [
+                        "Main_Menu/SwitchToSubmenu2",
+                        "Second_Menu/Print_the_state",
+                    ],
+                }
+            ]
+
+        menu = LayoutFactory(
+            layout_file_path=write_layout(self, add_macro), headless=True
+        ).create()
+
+        self.assertIn("state", menu.macros)
+        for submenu in menu._submenu:
+            self.assertTrue(submenu._key_bindings.get_bindings_for_keys((Keys.F5,)))
+
+
+class TestMacroPayloads(unittest.TestCase):
+    def test_replayed_payloads_are_applied_once(self):
+        state = State(init={"count": 0}, save_except=["count"])
+        application = Application(
+            layout=LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True),
+            state=state,
+            render=False,
+        )
+        application.add(
+            # the count of the previous step is read before it is applied
+            lambda state: signals.OK(
+                origin="wait", payload={"count": state.get("count") + 1, "last": "wait"}
+            ),
+            option_name="Print_and_wait",
+            submenu_name="Main_Menu",
+        )
+        application.add(
+            lambda state: signals.OK(origin="input", payload={"last": "input"}),
+            option_name="Accept_an_input",
+            submenu_name="Second_Menu",
+        )
+
+        menu = application._menu
+        menu.add_macro(
+            "batch",
+            [
+                "Main_Menu/Print_and_wait",
+                "Main_Menu/Print_and_wait",
+                "Main_Menu/SwitchToSubmenu2",
+                "Second_Menu/Accept_an_input",
+            ],
+        )
+
+        with unittest.mock.patch.object(state, "update", wraps=state.update) as update:
+            menu.play_macro("batch")
+            update.assert_not_called()
+
+            application.flush_ok_batch()
+
+        update.assert_called_once_with({"count": 2, "last": "input"})
+        self.assertEqual(state.get("count"), 2)
+        self.assertEqual(
+            application.payload_origins, {"count": "wait", "last": "input"}
+        )
+
+    def test_direct_update_is_the_last_writer(self):
+        state = State(init={"last": None}, save_except=["last"])
+        application = Application(
+            layout=LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True),
+            state=state,
+            render=False,
+        )
+        application.add(
+            lambda state: signals.OK(origin="wait", payload={"last": "wait"}),
+            option_name="Print_and_wait",
+            submenu_name="Main_Menu",
+        )
+        application.add(
+            # written after the pending payload, so it is not hidden by it
+            lambda state: state.update({"last": "direct"}) or signals.OK(),
+            option_name="Accept_an_input",
+            submenu_name="Second_Menu",
+        )
+
+        menu = application._menu
+        menu.add_macro(
+            "direct",
+            [
+                "Main_Menu/Print_and_wait",
+                "Main_Menu/SwitchToSubmenu2",
+                "Second_Menu/Accept_an_input",
+            ],
+        )
+        menu.play_macro("direct")
+
+        self.assertEqual(application.provide_state().get("last"), "direct")
+        application.flush_ok_batch()
+        self.assertEqual(state.get("last"), "direct")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import unittest.mock
+from squiffy import signals
+from squiffy.menu.menu_layers import MenuObserversLayer
+from squiffy.menu.menu_observers import (
+    EventObserver,
+    ExecutorObserver,
+    RoutingObserver,
+)
+
+
+def _attach(layer: MenuObserversLayer, observer):
+    observer.context = unittest.mock.Mock()
+    layer.attach(observer)
+
+    return observer
+
+
+class TestMenuObserversLayer(unittest.TestCase):
+    def setUp(self):
+        self.layer = MenuObserversLayer(unittest.mock.Mock())
+
+        self.callback = unittest.mock.Mock(return_value=signals.OK())
+        self.executor = _attach(self.layer, ExecutorObserver("execute", self.callback))
+        self.router = _attach(self.layer, RoutingObserver("route"))
+        self.listener = _attach(self.layer, EventObserver("listen"))
+
+    def test_do_reaches_only_the_routed_observers(self):
+        with unittest.mock.patch.object(
+            self.router, "inform", wraps=self.router.inform
+        ) as inform:
+            self.layer.send(signals.Do("execute"))
+
+        inform.assert_not_called()
+        self.callback.assert_called_once_with()
+        self.executor.context.handle_signal.assert_called_once_with(
+            self.callback.return_value
+        )
+        self.router.context.handle_signal.assert_not_called()
+
+    def test_unrouted_observers_receive_every_event(self):
+        ok = signals.OK(payload={"key": "value"})
+
+        self.layer.send(signals.Do("route"))
+        self.layer.send(ok)
+
+        self.router.context.handle_signal.assert_called_once_with(signals.Do("route"))
+        self.assertEqual(
+            self.listener.context.handle_signal.call_args_list,
+            [unittest.mock.call(signals.Do("route")), unittest.mock.call(ok)],
+        )
+
+    def test_quit_is_broadcast(self):
+        self.layer.send(signals.Quit())
+
+        for observer in (self.executor, self.router, self.listener):
+            observer.context.handle_signal.assert_called_once_with(signals.Quit())
+
+    def test_detached_observer_is_not_routed(self):
+        self.layer.detach(self.executor)
+        self.layer.send(signals.Do("execute"))
+
+        self.callback.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
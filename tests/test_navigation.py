@@ -0,0 +1,138 @@
+import unittest
+import unittest.mock
+from squiffy import Application, ScriptedInput, signals
+from squiffy.abstract.abstract_context import AbstractContext
+from squiffy.layout.layout_factory import LayoutFactory
+from squiffy.menu.navigation import MenuAddress, NavigationStack
+from tests.helpers import EXAMPLE_LAYOUT
+
+
+def _submenu(uid: str) -> unittest.mock.Mock:
+    return unittest.mock.Mock(uid=uid)
+
+
+class TestNavigationStack(unittest.TestCase):
+    def setUp(self):
+        self.root = _submenu("Main")
+        self.stack = NavigationStack(root=self.root, max_depth=4)
+
+    def test_revisit_truncates_to_the_submenu(self):
+        first, second = _submenu("First"), _submenu("Second")
+
+        for _ in range(1000):
+            self.stack.push(first)
+            self.stack.push(second)
+
+        self.assertEqual(len(self.stack), 3)
+        self.assertEqual(self.stack.breadcrumbs, "Main > First > Second")
+
+        self.stack.push(self.root)
+        self.assertEqual(len(self.stack), 1)
+        self.assertEqual(self.stack.breadcrumbs, "Main")
+
+    def test_max_depth_keeps_the_root(self):
+        for uid in ("A", "B", "C", "D", "E"):
+            self.stack.push(_submenu(uid))
+
+        self.assertEqual(len(self.stack), 4)
+        self.assertIs(self.stack.root, self.root)
+        self.assertEqual(self.stack.breadcrumbs, "Main > C > D > E")
+        self.assertNotIn("A", self.stack)
+
+        self.assertTrue(self.stack.return_to("C"))
+        self.assertEqual(self.stack.top.uid, "C")
+
+    def test_pop_and_return_to(self):
+        self.stack.push(_submenu("A"))
+        self.stack.push(_submenu("B"))
+
+        self.assertFalse(self.stack.return_to("Missing"))
+        self.assertEqual(self.stack.pop().uid, "A")
+        self.assertIs(self.stack.pop(), self.root)
+        self.assertIs(self.stack.pop(), self.root)
+
+    def test_invalid_max_depth(self):
+        with self.assertRaises(ValueError):
+            NavigationStack(root=self.root, max_depth=0)
+
+
+class TestMenuNavigation(unittest.TestCase):
+    def setUp(self):
+        self.layout = LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True)
+        self.menu = self.layout.create()
+
+    def test_bouncing_between_submenus_does_not_grow(self):
+        for _ in range(100):
+            self.menu.handle_signals(signals.SwitchSubmenu("Second_Menu"))
+            self.menu.handle_signals(signals.SwitchSubmenu("Main_Menu"))
+
+        self.assertEqual(len(self.menu.navigation), 1)
+
+    def test_breadcrumbs_are_rendered_below_the_root(self):
+        self.menu.handle_signals(signals.SwitchSubmenu("Second_Menu"))
+        self.menu._current_submenu._show_ui()
+        self.assertIn("Main_Menu > Second_Menu", self.layout.renderer.frame)
+
+        self.menu.handle_signals(signals.ReturnToMain())
+        self.menu._current_submenu._show_ui()
+        self.assertNotIn(" > ", self.layout.renderer.frame)
+
+
+class TestMenuAddresses(unittest.TestCase):
+    def setUp(self):
+        self.layout = LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True)
+        self.menu = self.layout.create()
+        self.menu.controller = unittest.mock.Mock(spec=AbstractContext)
+
+    def test_path_index(self):
+        paths = self.layout._create_path_index()
+
+        self.assertEqual(
+            paths["main_menu/second_menu"], MenuAddress(("Main_Menu", "Second_Menu"))
+        )
+        self.assertEqual(paths["second_menu"], paths["main_menu/second_menu"])
+        self.assertEqual(
+            paths["second_menu/print_the_state"],
+            MenuAddress(("Main_Menu", "Second_Menu"), option=1),
+        )
+
+    def test_jump_to_an_option(self):
+        self.assertTrue(self.menu.jump(" Main_Menu/Second_Menu/Accept_an_input/ "))
+
+        self.assertEqual(self.menu.breadcrumbs, "Main_Menu > Second_Menu")
+        self.menu.controller.handle_signal.assert_called_once()
+        self.assertEqual(
+            self.menu.controller.handle_signal.call_args.args[0].signal,
+            "SECOND_MENU_ACCEPT_AN_INPUT",
+        )
+        # nothing was shown on the way
+        self.assertIsNone(self.layout.renderer.frame)
+
+    def test_invalid_address(self):
+        with unittest.mock.patch.object(self.menu, "handle_errors") as handle_errors:
+            self.assertFalse(self.menu.jump("Main_Menu/Missing"))
+
+        handle_errors.assert_called_once()
+        self.assertEqual(self.menu.breadcrumbs, "Main_Menu")
+
+    def test_application_starts_at_the_address(self):
+        calls: list = list([])
+        application = Application(
+            layout=LayoutFactory(layout_file_path=EXAMPLE_LAYOUT, headless=True),
+            state=unittest.mock.Mock(),
+            input_source=ScriptedInput(["Second_Menu/RETURN_TO_PREVIOUS"]),
+            render=False,
+            start_at="Second_Menu/Print_the_state",
+        )
+        application.add(
+            function=lambda state: calls.append("state") or signals.OK(),
+            option_name="Print_the_state",
+            submenu_name="Second_Menu",
+        )
+        application.run()
+
+        self.assertEqual(calls, ["state"])
+
+
+if __name__ == "__main__":
+    unittest.main()
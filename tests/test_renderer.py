@@ -0,0 +1,48 @@
+import io
+import unittest
+import unittest.mock
+from squiffy.renderer import Renderer, CURSOR_HOME, CLEAR_SCREEN
+
+
+class TestRenderer(unittest.TestCase):
+    def _renderer(self, hight: int = 24) -> tuple[Renderer, io.StringIO]:
+        stream = io.StringIO()
+        renderer = Renderer(stream=stream, screen=unittest.mock.Mock(hight=hight))
+        return renderer, stream
+
+    def test_first_frame_is_fully_drawn(self):
+        renderer, stream = self._renderer()
+        renderer.render("a\nb")
+        self.assertEqual(stream.getvalue(), CURSOR_HOME + CLEAR_SCREEN + "a\nb\n")
+
+    def test_only_changed_lines_are_written(self):
+        renderer, stream = self._renderer()
+        renderer.render("a\nb\nc")
+        stream.seek(0)
+        stream.truncate()
+
+        renderer.render("a\nB\nc")
+        output = stream.getvalue()
+
+        self.assertIn("\x1b[2;1HB", output)
+        self.assertNotIn("a", output)
+        self.assertNotIn("c", output)
+
+    def test_invalidate_forces_full_redraw(self):
+        renderer, stream = self._renderer()
+        renderer.render("a")
+        renderer.invalidate()
+        stream.seek(0)
+        stream.truncate()
+
+        renderer.render("a")
+        self.assertTrue(stream.getvalue().startswith(CURSOR_HOME + CLEAR_SCREEN))
+
+    def test_frame_taller_than_screen_is_always_redrawn(self):
+        renderer, stream = self._renderer(hight=3)
+        renderer.render("a\nb\nc")
+        stream.seek(0)
+        stream.truncate()
+
+        renderer.render("a\nb\nc")
+        self.assertTrue(stream.getvalue().startswith(CURSOR_HOME + CLEAR_SCREEN))
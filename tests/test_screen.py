@@ -0,0 +1,50 @@
+import gc
+import os
+import unittest
+import unittest.mock
+from squiffy.screen import Screen
+
+
+class TestScreen(unittest.TestCase):
+    def test_size_is_cached(self):
+        screen = Screen()
+        with unittest.mock.patch(
+            "os.get_terminal_size", return_value=os.terminal_size((80, 24))
+        ) as get_terminal_size:
+            self.assertEqual((screen.hight, screen.width), (24, 80))
+            self.assertEqual((screen.hight, screen.width), (24, 80))
+
+        self.assertEqual(get_terminal_size.call_count, 1)
+
+    def test_resize_is_pushed_to_observers(self):
+        screen = Screen()
+        observer = unittest.mock.Mock()
+        screen.attach(observer)
+
+        with unittest.mock.patch(
+            "os.get_terminal_size", return_value=os.terminal_size((80, 24))
+        ):
+            screen.refresh()
+            screen.refresh()
+
+        with unittest.mock.patch(
+            "os.get_terminal_size", return_value=os.terminal_size((120, 40))
+        ):
+            screen.refresh()
+
+        self.assertEqual(
+            observer.resize.call_args_list,
+            [unittest.mock.call(24, 80), unittest.mock.call(40, 120)],
+        )
+
+    def test_dropped_observers_are_detached(self):
+        screen = Screen()
+        kept = unittest.mock.Mock()
+        screen.attach(kept)
+        screen.attach(unittest.mock.Mock())
+        gc.collect()
+
+        self.assertEqual(len(screen._observers), 1)
+
+        screen.detach(kept)
+        self.assertEqual(len(screen._observers), 0)
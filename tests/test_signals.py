@@ -0,0 +1,49 @@
+import copy
+import pickle
+import unittest
+from squiffy import signals
+
+
+class TestSignals(unittest.TestCase):
+    def test_signals_are_slotted(self):
+        for signal in (
+            signals.OK(),
+            signals.Do("signal"),
+            signals.Error(),
+            signals.Quit(),
+            signals.ReturnToMain(),
+            signals.SwitchSubmenu(target_id="Submenu"),
+        ):
+            with self.subTest(signal=type(signal).__name__):
+                self.assertFalse(hasattr(signal, "__dict__"))
+
+    def test_signals_without_payload_are_shared(self):
+        self.assertIs(signals.Quit(), signals.Quit())
+        self.assertIs(signals.ReturnToMain(), signals.ReturnToMain())
+        self.assertIs(signals.ReturnToPrevious(), signals.ReturnToPrevious())
+        self.assertIsNot(signals.ReturnToMain(), signals.ReturnToPrevious())
+
+    def test_signals_with_payload_are_not_shared(self):
+        quit_signal = signals.Quit(origin="origin", log_message="message")
+
+        self.assertIsNot(quit_signal, signals.Quit())
+        self.assertIsNone(signals.Quit().origin)
+        self.assertEqual(quit_signal.origin, "origin")
+
+    def test_do_is_interned_by_signal(self):
+        self.assertIs(signals.Do("first"), signals.Do(signal="first"))
+        self.assertIsNot(signals.Do("first"), signals.Do("second"))
+
+    def test_copies_keep_the_interned_instances(self):
+        for signal in (signals.Quit(), signals.ReturnToMain(), signals.Do("first")):
+            with self.subTest(signal=type(signal).__name__):
+                self.assertIs(pickle.loads(pickle.dumps(signal)), signal)
+                self.assertIs(copy.copy(signal), signal)
+
+        quit_signal = pickle.loads(pickle.dumps(signals.Quit(origin="origin")))
+        self.assertEqual(quit_signal.origin, "origin")
+        self.assertIsNone(signals.Quit().origin)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import Mock
-from squiffy.state import State
+from squiffy.state import State, StateView
 from squiffy.errors import StateContentNotSavable
 
 
@@ -69,5 +69,27 @@ class TestState(unittest.TestCase):
             state = State({"key": "value"})
 
 
+class TestStateView(unittest.TestCase):
+    def test_pending_values_are_read_first(self):
+        state = State({"key": 1, "other": 2}, save_except=["key", "other"])
+        view = StateView(state, {"key": None})
+
+        # a pending None is still a pending value
+        self.assertIsNone(view.get("key"))
+        self.assertEqual(view.get("other"), 2)
+        self.assertEqual(view.snapshot(["key", "other"]).get("other"), 2)
+
+    def test_update_is_pending(self):
+        state = State({"key": 1}, save_except=["key"])
+        pending: dict[str, object] = {"key": 2}
+        view = StateView(state, pending)
+
+        view.update({"key": 3})
+
+        self.assertEqual(view.get("key"), 3)
+        self.assertEqual(state.get("key"), 1)
+        self.assertEqual(pending, {"key": 3})
+
+
 state = State({"key": TestValue()})
 print(state.save())
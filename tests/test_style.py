@@ -0,0 +1,153 @@
+import unittest
+import unittest.mock
+from squiffy.layout.style import FrameCache
+from squiffy.layout.style_factory import StyleFactory
+from squiffy.layout.style_components import TextGenerator, compile_template
+from squiffy.layout.borders import BORDERS
+
+STYLE_SHEET = {
+    "dimensions": {"type": "auto", "width": None, "height": None},
+    "padding": {"top": 1, "right": 2, "bottom": 1, "left": 2},
+    "border": {"type": "double"},
+}
+
+
+class TestFrameCache(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = FrameCache(max_size=2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", "frame")
+        self.assertEqual(cache.get("a"), "frame")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_least_recently_used_eviction(self):
+        cache = FrameCache(max_size=2)
+        cache.put("a", "frame_a")
+        cache.put("b", "frame_b")
+        cache.get("a")
+        cache.put("c", "frame_c")
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "frame_a")
+
+
+class TestStyle(unittest.TestCase):
+    _screen = unittest.mock.Mock(hight=40, width=80)
+
+    def _create(self, style, content: dict, header_msg: str = "header") -> str:
+        return style.create(
+            title="Title",
+            subtitle="",
+            header_msg=header_msg,
+            content=content,
+            footer_msg="footer",
+        )
+
+    def test_unchanged_frame_is_served_from_cache(self):
+        style = StyleFactory(screen=self._screen).create(STYLE_SHEET)
+        content = {0: "OPTION", 1: "QUIT"}
+
+        first = self._create(style, content)
+        second = self._create(style, content)
+
+        self.assertEqual(first, second)
+        self.assertEqual(style.frame_cache.hits, 1)
+        self.assertEqual(style.frame_cache.misses, 1)
+
+    def test_changed_content_is_rendered_again(self):
+        style = StyleFactory(screen=self._screen).create(STYLE_SHEET)
+        content = {0: "OPTION"}
+
+        first = self._create(style, content)
+        content.update({1: "QUIT"})
+        second = self._create(style, content)
+
+        self.assertNotEqual(first, second)
+        self.assertIn("1>>>QUIT", second)
+        self.assertEqual(style.frame_cache.misses, 2)
+
+    def test_invalidate(self):
+        style = StyleFactory(screen=self._screen).create(STYLE_SHEET)
+        self._create(style, {0: "OPTION"})
+        style.invalidate()
+
+        self.assertEqual(len(style.frame_cache), 0)
+
+
+class TestStyleTemplate(unittest.TestCase):
+    _texts = ["Title", "", "A rather long message " * 8, "0>>>OPTION"]
+
+    def test_same_output_as_text_generator(self):
+        for border in BORDERS:
+            for alignment in ("left", "center", "right"):
+                template = compile_template(border, 60, 1, 2, 3, 1)
+                generated = TextGenerator(border).generate(
+                    screen_h=40,
+                    screen_w=60,
+                    padding_top=1,
+                    padding_bottom=2,
+                    padding_left=3,
+                    padding_right=1,
+                    texts=self._texts,
+                    alignment=alignment,
+                )
+
+                self.assertEqual(template.fill(self._texts, alignment), generated)
+
+    def test_template_is_compiled_once(self):
+        self.assertIs(
+            compile_template("light", 80, 1, 1, 2, 2),
+            compile_template("light", 80, 1, 1, 2, 2),
+        )
+
+
+class TestStyleResize(unittest.TestCase):
+    def test_resize_updates_components_and_drops_frames(self):
+        style = StyleFactory(screen=unittest.mock.Mock(hight=40, width=80)).create(
+            STYLE_SHEET
+        )
+        style.create("Title", "", "header", {0: "OPTION"}, "footer")
+
+        style.resize(30, 50)
+
+        self.assertEqual(len(style.frame_cache), 0)
+        self.assertEqual((style._header.hight, style._header.width), (30, 50))
+        frame = style.create("Title", "", "header", {0: "OPTION"}, "footer")
+        self.assertEqual(len(frame.split("\n")[0]), 50)
+
+
+class TestWindowedStyle(unittest.TestCase):
+    _screen = unittest.mock.Mock(hight=30, width=80)
+    _items = {index: f"OPTION_{index}" for index in range(10000)}
+
+    def _style(self):
+        style_sheet = dict(STYLE_SHEET)
+        style_sheet["dimensions"] = dict(STYLE_SHEET["dimensions"], windowed=True)
+        return StyleFactory(screen=self._screen).create(style_sheet)
+
+    def _create(self, style) -> str:
+        return style.create("Title", "", "header", self._items, "footer")
+
+    def test_frame_fits_the_screen(self):
+        frame = self._create(self._style())
+
+        self.assertLessEqual(len(frame.split("\n")) + 2, self._screen.hight)
+        self.assertIn("0>>>OPTION_0", frame)
+        self.assertNotIn(">>>OPTION_9999", frame)
+
+    def test_scroll(self):
+        style = self._style()
+        self._create(style)
+        rows = style._content.rows
+
+        style.scroll(1)
+        frame = self._create(style)
+        self.assertIn(f"{rows}>>>OPTION_{rows}", frame)
+        self.assertNotIn("0>>>OPTION_0", frame)
+
+        # scrolling stops at the last and the first page
+        style.scroll(10000)
+        self.assertIn("9999>>>OPTION_9999", self._create(style))
+        style.scroll(-10000)
+        self.assertIn("0>>>OPTION_0", self._create(style))
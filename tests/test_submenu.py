@@ -0,0 +1,95 @@
+import unittest
+import unittest.mock
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.document import Document
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from prompt_toolkit.validation import ValidationError
+from squiffy import signals, utils
+from squiffy.menu.menu_items import Item, ItemsCollection
+from squiffy.menu.submenu import Submenu
+from squiffy.renderer import HeadlessRenderer
+
+
+class TestNumberValidator(unittest.TestCase):
+    def _is_valid(self, validator, text: str) -> bool:
+        try:
+            validator.validate(Document(text))
+        except ValidationError:
+            return False
+
+        return True
+
+    def test_limits_are_inclusive(self):
+        validator = utils._is_number_within_limits(lower=0, upper=2)
+
+        self.assertTrue(self._is_valid(validator, "0"))
+        self.assertTrue(self._is_valid(validator, "2"))
+        self.assertFalse(self._is_valid(validator, "3"))
+
+    def test_non_decimal_text_is_rejected(self):
+        validator = utils._is_number_within_limits(lower=0, upper=9)
+
+        for text in ("", "a", "-1", "1.0", "²"):
+            self.assertFalse(self._is_valid(validator, text))
+
+
+class TestSubmenuPrompt(unittest.TestCase):
+    def setUp(self):
+        self.submenu = Submenu(
+            title="Main",
+            items=ItemsCollection(
+                uid="Main", items=[Item(option="first", signal=signals.Do("FIRST"))]
+            ),
+            add_return=False,
+            add_return_to_main=False,
+            renderer=HeadlessRenderer(),
+        )
+
+    def test_validator_is_cached_by_item_count(self):
+        validator = self.submenu._item_validator()
+        self.assertIs(self.submenu._item_validator(), validator)
+
+        self.submenu._items.add_item(Item(option="second", signal=signals.Quit()))
+        self.assertIsNot(self.submenu._item_validator(), validator)
+
+    def test_prompt_session_is_reused(self):
+        with unittest.mock.patch("squiffy.menu.submenu.PromptSession") as session:
+            session.return_value.prompt.return_value = "1"
+
+            self.assertEqual(self.submenu._show_prompt(), 1)
+            self.assertEqual(self.submenu._show_prompt(), 1)
+
+        session.assert_called_once()
+
+
+class TestSubmenuHotkeys(unittest.TestCase):
+    def setUp(self):
+        self.item = Item(option="print", signal=signals.Do("PRINT"), hotkey="p")
+        self.submenu = Submenu(
+            title="Main",
+            items=ItemsCollection(uid="Main", items=[self.item]),
+            add_return=False,
+            add_return_to_main=False,
+            renderer=HeadlessRenderer(),
+            hotkeys={"p": self.item},
+        )
+
+    def _prompt(self, keys: str):
+        with create_pipe_input() as pipe_input:
+            pipe_input.send_text(keys)
+            with create_app_session(input=pipe_input, output=DummyOutput()):
+                return self.submenu._show_prompt()
+
+    def test_hotkey_selects_without_enter(self):
+        self.assertIs(self._prompt("p"), self.item)
+
+    def test_hotkey_is_text_after_other_input(self):
+        self.assertEqual(self._prompt("0p\x7f\r"), 0)
+
+    def test_hotkey_is_shown_with_the_option(self):
+        self.assertEqual(repr(self.item), "PRINT [p]")
+
+
+if __name__ == "__main__":
+    unittest.main()
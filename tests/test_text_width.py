@@ -0,0 +1,47 @@
+import textwrap
+import unittest
+from squiffy.layout.text_width import display_width, wrap_text
+from squiffy.layout.style_components import compile_template
+
+
+class TestDisplayWidth(unittest.TestCase):
+    def test_ascii(self):
+        self.assertEqual(display_width("OPTION"), 6)
+
+    def test_wide_characters(self):
+        self.assertEqual(display_width("日本語"), 6)
+        self.assertEqual(display_width("ok 👍"), 5)
+
+    def test_combining_characters(self):
+        self.assertEqual(display_width("é"), 1)
+
+
+class TestWrapText(unittest.TestCase):
+    def test_lines_fit_the_display_width(self):
+        lines = wrap_text("日本語のテキスト は とても 長い です " * 4, 12)
+
+        self.assertGreater(len(lines), 1)
+        for line in lines:
+            self.assertLessEqual(display_width(line), 12)
+
+    def test_same_lines_as_textwrap_for_ascii(self):
+        texts = [
+            "This is the header for the main menu " * 5,
+            "  leading spaces and    several   spaces between words",
+            "averyveryverylongwordwhichdoesnotfit on a single line",
+            "hyphenated-words and\ttabs are wrapped by textwrap",
+        ]
+
+        for text in texts:
+            for width in (5, 13, 40):
+                self.assertEqual(wrap_text(text, width), textwrap.wrap(text, width))
+
+    def test_wide_words_are_broken(self):
+        self.assertEqual(wrap_text("日本語日本語", 4), ["日本", "語日", "本語"])
+
+    def test_borders_are_aligned_for_wide_text(self):
+        frame = compile_template("light", 40, 0, 0, 1, 1).fill(
+            ["0>>>日本語", "1>>>OPTION"], alignment="left"
+        )
+
+        self.assertEqual({display_width(line) for line in frame.split("\n")}, {40})